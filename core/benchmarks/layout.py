@@ -0,0 +1,358 @@
+"""Benchmarks of the Pack layout of large widget trees, on the dummy backend.
+
+Each scenario builds a synthetic tree of widgets, and then runs a series of phases
+against it: laying the tree out, applying the layout to the widgets, laying it out
+again after a change, and so on. Each phase is timed separately. The whole sequence
+is repeated several times, with a new tree each time, and the fastest and median
+times of each phase are reported.
+
+Run the benchmarks from the `core` directory:
+
+```console
+$ TOGA_BACKEND=toga_dummy python -m benchmarks.layout --output before.json
+```
+
+The results are written as JSON, so that the results from different commits can be
+compared:
+
+```console
+$ TOGA_BACKEND=toga_dummy python -m benchmarks.layout --compare before.json
+```
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+from collections.abc import Callable
+from datetime import datetime
+from itertools import cycle, islice
+from time import perf_counter
+
+from travertino.size import at_least
+
+import toga
+from toga.style.pack import COLUMN, LTR, ROW, RTL
+from toga.types import Size
+from toga_dummy.utils import EventLog
+
+# The size of the viewport that trees are laid out in, and the size it is resized to.
+VIEWPORT = Size(1024, 768)
+RESIZED_VIEWPORT = Size(1280, 800)
+
+# The number of children that are added and removed in the mutation phase.
+MUTATIONS = 100
+
+
+######################################################################
+# Trees
+######################################################################
+
+
+def mixed_children(count: int, text_direction: str = LTR) -> list[toga.Widget]:
+    """A list of leaf widgets, cycling between flexible, fixed, and intrinsically
+    sized widgets."""
+    kinds = cycle(["flex", "fixed", "intrinsic flex", "intrinsic fixed"])
+    children = []
+    for kind in islice(kinds, count):
+        if kind == "flex":
+            child = toga.Box(flex=1, text_direction=text_direction)
+        elif kind == "fixed":
+            child = toga.Box(width=20, height=10, text_direction=text_direction)
+        else:
+            child = toga.Box(
+                flex=1 if kind == "intrinsic flex" else 0,
+                margin=2,
+                text_direction=text_direction,
+            )
+            child.intrinsic.width = at_least(15) if kind == "intrinsic flex" else 15
+            child.intrinsic.height = 10
+        children.append(child)
+    return children
+
+
+def wide_tree(scale: float) -> toga.Box:
+    """A single row of 10,000 flexible children."""
+    return toga.Box(
+        direction=ROW,
+        children=[toga.Box(flex=1) for _ in range(max(1, int(10_000 * scale)))],
+    )
+
+
+def deep_tree(scale: float) -> toga.Box:
+    """Boxes nested 200 deep, alternating between rows and columns, each with a leaf
+    alongside the next level of nesting."""
+    node = toga.Box(flex=1)
+    for depth in range(max(1, int(200 * scale))):
+        leaf = toga.Box(width=5, height=5)
+        node = toga.Box(
+            direction=ROW if depth % 2 else COLUMN,
+            margin=1,
+            children=[leaf, node],
+        )
+    return node
+
+
+def mixed_tree(scale: float, text_direction: str = LTR) -> toga.Box:
+    """A column of 100 rows, each of 100 children of mixed flexibility."""
+    return toga.Box(
+        direction=COLUMN,
+        text_direction=text_direction,
+        children=[
+            toga.Box(
+                direction=ROW,
+                gap=1,
+                text_direction=text_direction,
+                children=mixed_children(100, text_direction),
+            )
+            for _ in range(max(1, int(100 * scale)))
+        ],
+    )
+
+
+def rtl_tree(scale: float) -> toga.Box:
+    """The mixed tree, with a right-to-left text direction throughout."""
+    return mixed_tree(scale, text_direction=RTL)
+
+
+SCENARIOS: dict[str, Callable[[float], toga.Box]] = {
+    "wide": wide_tree,
+    "deep": deep_tree,
+    "mixed": mixed_tree,
+    "rtl": rtl_tree,
+}
+
+
+######################################################################
+# Phases
+######################################################################
+
+
+def last_leaf(root: toga.Widget) -> toga.Widget:
+    """The last leaf of a tree; in the deep tree, this is the most deeply nested."""
+    node = root
+    while node.children:
+        node = node.children[-1]
+    return node
+
+
+class Phases:
+    """The phases run against a tree, in order.
+
+    Each phase is a method whose name starts with `phase_`; they are run in the order
+    they are defined.
+    """
+
+    def __init__(self, build: Callable[[float], toga.Box], scale: float):
+        self.build = build
+        self.scale = scale
+        self.root = None
+
+    def phase_build(self) -> None:
+        """Create the widgets, and add them to their parents."""
+        self.root = self.build(self.scale)
+
+    def phase_layout(self) -> None:
+        """Lay out the tree for the first time."""
+        self.root.style.layout(VIEWPORT)
+
+    def phase_set_bounds(self) -> None:
+        """Apply the layout to every widget."""
+        self.root.applicator.set_bounds()
+
+    def phase_layout_unchanged(self) -> None:
+        """Lay out the tree again, when nothing has changed."""
+        self.root.style.layout(VIEWPORT)
+
+    def phase_set_bounds_unchanged(self) -> None:
+        """Apply the layout again, when nothing has changed."""
+        self.root.applicator.set_bounds()
+
+    def phase_layout_resized(self) -> None:
+        """Lay out the tree in a larger viewport."""
+        self.root.style.layout(RESIZED_VIEWPORT)
+
+    def phase_set_bounds_resized(self) -> None:
+        """Apply the layout in a larger viewport."""
+        self.root.applicator.set_bounds()
+
+    def phase_restyle(self) -> None:
+        """Change the margin of the last leaf, and lay out and apply the tree."""
+        last_leaf(self.root).style.margin = 3
+        self.root.style.layout(RESIZED_VIEWPORT)
+        self.root.applicator.set_bounds()
+
+    def phase_mutate(self) -> None:
+        """Create some children, add them to the first branch of the tree, and remove
+        them again, laying out and applying the tree after each change."""
+        parent = self.root.children[0]
+        children = mixed_children(MUTATIONS)
+        parent.add(*children)
+        self.root.style.layout(RESIZED_VIEWPORT)
+        self.root.applicator.set_bounds()
+
+        parent.remove(*children)
+        self.root.style.layout(RESIZED_VIEWPORT)
+        self.root.applicator.set_bounds()
+
+    @classmethod
+    def names(cls) -> list[str]:
+        return [
+            name.removeprefix("phase_")
+            for name in vars(cls)
+            if name.startswith("phase_")
+        ]
+
+    def run(self) -> dict[str, float]:
+        """Run every phase, returning the time each one took, in seconds."""
+        times = {}
+        for name in self.names():
+            phase = getattr(self, f"phase_{name}")
+            # The dummy backend logs every call to a widget's implementation; don't
+            # let that log grow without bound.
+            EventLog.reset()
+            start = perf_counter()
+            phase()
+            times[name] = perf_counter() - start
+        EventLog.reset()
+        return times
+
+
+######################################################################
+# Running and reporting
+######################################################################
+
+
+def git_revision() -> str | None:
+    """The git revision of the code being benchmarked, if it can be determined."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(scenarios: list[str], scale: float, repeat: int) -> dict:
+    """Run the benchmarks.
+
+    :param scenarios: The names of the scenarios to run.
+    :param scale: A factor applied to the size of each tree.
+    :param repeat: The number of times to run each scenario.
+    :returns: The results, in a form that can be serialized as JSON.
+    """
+    results = {}
+    for scenario in scenarios:
+        runs = [Phases(SCENARIOS[scenario], scale).run() for _ in range(repeat)]
+        results[scenario] = {
+            name: {
+                "min": min(run[name] for run in runs),
+                "median": statistics.median(run[name] for run in runs),
+                "times": [run[name] for run in runs],
+            }
+            for name in Phases.names()
+        }
+
+    return {
+        "environment": {
+            "toga": toga.__version__,
+            "revision": git_revision(),
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now().astimezone().isoformat(),
+        },
+        "scale": scale,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def report(data: dict, baseline: dict | None = None) -> str:
+    """Format results as a table; if a baseline is given, include the change relative
+    to the baseline."""
+    lines = []
+    header = f"{'scenario':<10} {'phase':<24} {'min (ms)':>10} {'median (ms)':>12}"
+    if baseline:
+        header += f" {'baseline (ms)':>14} {'change':>8}"
+    lines.append(header)
+
+    for scenario, phases in data["results"].items():
+        for phase, result in phases.items():
+            line = (
+                f"{scenario:<10} {phase:<24} "
+                f"{result['min'] * 1000:>10.3f} {result['median'] * 1000:>12.3f}"
+            )
+            if baseline:
+                try:
+                    previous = baseline["results"][scenario][phase]["min"]
+                except KeyError:
+                    line += f" {'-':>14} {'-':>8}"
+                else:
+                    if previous:
+                        change = f"{result['min'] / previous:.2f}x"
+                    else:
+                        change = "-"
+                    line += f" {previous * 1000:>14.3f} {change:>8}"
+            lines.append(line)
+
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[0])
+    parser.add_argument(
+        "scenarios",
+        nargs="*",
+        metavar="scenario",
+        help=f"The scenarios to run: {', '.join(SCENARIOS)} (default: all of them).",
+    )
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="A factor applied to the size of each tree (default: 1).",
+    )
+    parser.add_argument(
+        "--repeat",
+        type=int,
+        default=5,
+        help="The number of times to run each scenario (default: 5).",
+    )
+    parser.add_argument(
+        "--output",
+        "-o",
+        help="A file to write the results to, as JSON.",
+    )
+    parser.add_argument(
+        "--compare",
+        help="A file of earlier results to compare against.",
+    )
+    args = parser.parse_args(argv)
+    for scenario in args.scenarios:
+        if scenario not in SCENARIOS:
+            parser.error(f"unknown scenario {scenario!r}")
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    data = run(args.scenarios or list(SCENARIOS), args.scale, args.repeat)
+    print(report(data, baseline))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+            f.write("\n")
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
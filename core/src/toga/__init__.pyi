@@ -59,6 +59,7 @@ from toga.widgets.table import Table as Table
 from toga.widgets.textinput import TextInput as TextInput
 from toga.widgets.timeinput import TimeInput as TimeInput
 from toga.widgets.tree import Tree as Tree
+from toga.widgets.virtualbox import VirtualBox as VirtualBox
 from toga.widgets.webview import WebView as WebView
 from toga.window import MainWindow as MainWindow
 from toga.window import Window as Window
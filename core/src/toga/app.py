@@ -347,6 +347,9 @@ class App:
         self._main_window = App._UNDEFINED
         self._windows = WindowSet(self)
 
+        # Root widgets whose layout refresh is waiting for the next flush.
+        self._pending_layouts: dict[Widget, None] = {}
+
         # Create the implementation. This will trigger any startup logic.
         self.factory.App(interface=self)
 
@@ -469,6 +472,35 @@ class App:
         of the app's main thread (read-only)."""
         return self._impl.loop
 
+    def _schedule_layout(self, widget: Widget) -> bool:
+        """Defer the layout refresh of a root widget to the event loop.
+
+        :param widget: The root widget whose layout needs to be refreshed.
+        :returns: True if the refresh was deferred; False if the event loop isn't
+            running, and the refresh must be performed immediately.
+        """
+        if not self.loop.is_running():
+            return False
+
+        if not self._pending_layouts:
+            self.loop.call_soon(self.flush_layout)
+        self._pending_layouts[widget] = None
+        return True
+
+    def flush_layout(self) -> None:
+        """Apply any pending layout changes immediately.
+
+        While the event loop is running, changes to the style or the widget tree
+        don't immediately update the layout. Instead, a single layout refresh of each
+        affected window is performed on the next iteration of the event loop, no
+        matter how many changes have been made. If you need to read the layout of a
+        widget before control returns to the event loop, call this method first.
+        """
+        pending = self._pending_layouts
+        self._pending_layouts = {}
+        for widget in pending:
+            widget._refresh_layout()
+
     def main_loop(self) -> None:
         """Start the application.
 
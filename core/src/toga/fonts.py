@@ -32,6 +32,10 @@ FONT_VARIANTS = {NORMAL, SMALL_CAPS}
 
 _REGISTERED_FONT_CACHE: dict[tuple[str, str, str, str], str] = {}
 _IMPL_CACHE: dict[Font, Any] = {}
+# Fonts that couldn't be loaded, so they aren't probed for again.
+_UNKNOWN_FONT_CACHE: set[Font] = set()
+# Fonts resolved from a list of families; see _resolve_font().
+_RESOLVED_FONT_CACHE: dict[tuple[tuple[str, ...], int, str, str, str], Font] = {}
 
 
 class UnknownFontError(Exception):
@@ -75,6 +79,9 @@ class Font(BaseFont):
             self._impl = _IMPL_CACHE[self]
 
         except KeyError:
+            if self in _UNKNOWN_FONT_CACHE:
+                raise UnknownFontError(f"Unknown font '{self}'") from None
+
             self._impl = self.factory.Font(self)
             try:
                 self._impl.load_predefined_system_font()
@@ -85,6 +92,7 @@ class Font(BaseFont):
                     try:
                         self._impl.load_arbitrary_system_font()
                     except UnknownFontError as exc:
+                        _UNKNOWN_FONT_CACHE.add(self)
                         raise UnknownFontError(f"Unknown font '{self}'") from exc
 
     def __str__(self) -> str:
@@ -134,6 +142,10 @@ class Font(BaseFont):
         font_key = Font._registered_font_key(family, weight, style, variant)
         _REGISTERED_FONT_CACHE[font_key] = str(toga.App.app.paths.app / path)
 
+        # A font that couldn't be loaded before may now be available.
+        _UNKNOWN_FONT_CACHE.clear()
+        _RESOLVED_FONT_CACHE.clear()
+
     @staticmethod
     def _registered_font_key(
         family: str,
@@ -149,3 +161,45 @@ class Font(BaseFont):
             variant = NORMAL
 
         return family, weight, style, variant
+
+
+def _resolve_font(
+    families: list[str],
+    size: int,
+    *,
+    weight: str,
+    style: str,
+    variant: str,
+) -> Font:
+    """Get the font for the first of a list of families that can be loaded.
+
+    If none of the families can be loaded, the system font is used. The result is
+    cached, so resolving the same font again doesn't probe for any of the families.
+
+    :param families: The font families, in order of preference.
+    :param size: The font size.
+    :param weight: The font weight.
+    :param style: The font style.
+    :param variant: The font variant.
+    :returns: The resolved font.
+    """
+    key = (tuple(families), size, weight, style, variant)
+    try:
+        return _RESOLVED_FONT_CACHE[key]
+    except KeyError:
+        pass
+
+    font_kwargs = {"size": size, "weight": weight, "style": style, "variant": variant}
+    for family in families:
+        try:
+            font = Font(family, **font_kwargs)
+            break
+        except UnknownFontError:
+            pass
+    else:
+        # Fall back to system font if no font families were valid
+        font = Font(SYSTEM, **font_kwargs)
+        print(f"No valid font family in {families}; using system font as a fallback")
+
+    _RESOLVED_FONT_CACHE[key] = font
+    return font
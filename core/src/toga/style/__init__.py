@@ -1,7 +1,9 @@
 from toga.style.applicator import TogaApplicator  # noqa: F401
+from toga.style.batch import batch  # noqa: F401
 from toga.style.pack import Pack  # noqa: F401
 
 __all__ = [
     "Pack",
     "TogaApplicator",
+    "batch",
 ]
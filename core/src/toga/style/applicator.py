@@ -3,6 +3,8 @@ from __future__ import annotations
 import warnings
 from typing import TYPE_CHECKING
 
+from travertino.constants import NONE
+
 if TYPE_CHECKING:
     from toga.widgets.base import Widget
 
@@ -13,6 +15,22 @@ warnings.filterwarnings("default", category=DeprecationWarning)
 class TogaApplicator:
     """Apply styles to a Toga widget."""
 
+    bounds_applied = 0
+    """The number of widgets whose bounds were applied to their implementation by
+    the most recent call to `set_bounds()` on this applicator."""
+    bounds_skipped = 0
+    """The number of widgets whose bounds weren't applied to their implementation by
+    the most recent call to `set_bounds()` on this applicator, because they hadn't
+    changed since they were last applied."""
+
+    # The container and bounds that were last applied to the widget's implementation.
+    _bounds = None
+    # Whether the widget was hidden (by its own style, or by an ancestor) when its
+    # visibility was last applied to the widget's implementation.
+    _hidden = None
+    # Whether a style has been applied to the widget's implementation yet.
+    _style_applied = False
+
     ######################################################################
     # 2024-12: Backwards compatibility for < 0.5.0
     ######################################################################
@@ -47,33 +65,125 @@ class TogaApplicator:
 
     def set_bounds(self) -> None:
         # print("  APPLY LAYOUT", self.widget, self.widget.layout)
-        self.widget._impl.set_bounds(
-            self.widget.layout.absolute_content_left,
-            self.widget.layout.absolute_content_top,
-            self.widget.layout.content_width,
-            self.widget.layout.content_height,
-        )
-        for child in self.widget.children:
-            child.applicator.set_bounds()
+        # The tree is walked with an explicit stack, rather than recursion, so that
+        # arbitrarily deep trees can be handled.
+        applied = skipped = 0
+        stack = [self.widget]
+        while stack:
+            widget = stack.pop()
+            layout = widget.layout
+            bounds = (
+                widget._impl.container,
+                layout.absolute_content_left,
+                layout.absolute_content_top,
+                layout.content_width,
+                layout.content_height,
+            )
+            # Only push the bounds to the backend if they have changed; this avoids
+            # a native call for every widget that hasn't moved.
+            applicator = widget.applicator
+            if bounds != applicator._bounds:
+                widget._impl.set_bounds(*bounds[1:])
+                applicator._bounds = bounds
+                applied += 1
+            else:
+                skipped += 1
+
+            # Children that aren't displayed aren't laid out, so they have no bounds.
+            # Children are pushed in reverse, so they're visited in order.
+            stack.extend(
+                child
+                for child in reversed(widget.children)
+                if child.style.display != NONE
+            )
+
+        self.bounds_applied = applied
+        self.bounds_skipped = skipped
+
+    def reset_bounds(self) -> None:
+        """Forget the bounds that were last applied to the widget.
+
+        The bounds will be applied to the widget's implementation on the next layout,
+        even if they haven't changed. Backends should call this if something other
+        than the layout (such as a change in DPI) alters the native geometry that
+        the same bounds produce.
+        """
+        self._bounds = None
 
     def set_text_align(self, alignment: str) -> None:
         self.widget._impl.set_text_align(alignment)
 
     def set_hidden(self, hidden: bool) -> None:
-        self.widget._impl.set_hidden(hidden)
-        for child in self.widget.children:
-            # If the parent is hidden, then so are all children. However, if the
-            # parent is visible, then the child's explicit visibility style is
-            # taken into account. This visibility cascades into any
-            # grandchildren.
-            #
-            # parent hidden child hidden style child final hidden state
-            # ============= ================== ========================
-            # True          True               True
-            # True          False              True
-            # False         True               True
-            # False         False              False
-            child.applicator.set_hidden(hidden or child.style._hidden)
+        widget = self.widget
+        widget._impl.set_hidden(hidden)
+        if getattr(widget._impl, "CASCADES_HIDDEN", False):
+            # The native toolkit also hides the widget if an ancestor is hidden.
+            hidden = hidden or self._parent_hidden()
+        if hidden != self._hidden:
+            self._hidden = hidden
+            self._set_children_hidden()
+
+    def _apply_hidden(self) -> None:
+        """Apply the visibility of the widget to its implementation.
+
+        If the native toolkit hides the children of a hidden widget, the
+        implementation is only given the visibility defined by the widget's own style;
+        otherwise, it is also hidden if an ancestor is hidden.
+        """
+        hidden = self.widget.style._hidden
+        if not getattr(self.widget._impl, "CASCADES_HIDDEN", False):
+            hidden = hidden or self._parent_hidden()
+        self.set_hidden(hidden)
+
+    def _parent_hidden(self) -> bool:
+        """Is an ancestor of the widget hidden?"""
+        widget = self.widget
+        while widget := widget.parent:
+            # The visibility of an ancestor that has been applied accounts for all
+            # the ancestors above it.
+            if (hidden := widget.applicator._hidden) is not None:
+                return hidden
+            if widget.style._hidden:
+                return True
+        return False
+
+    def _update_hidden(self) -> None:
+        """Apply the visibility of the widget, if it has changed because the widget
+        has been given a new parent."""
+        hidden = self.widget.style._hidden or self._parent_hidden()
+        if hidden != self._hidden:
+            self._apply_hidden()
+
+    def _set_children_hidden(self) -> None:
+        """Apply the visibility of the descendants of the widget, after the visibility
+        of the widget has changed.
+
+        If the parent is hidden, then so are all children. However, if the parent is
+        visible, then the child's explicit visibility style is taken into account.
+        This visibility cascades into any grandchildren.
+
+        parent hidden child hidden style child final hidden state
+        ============= ================== ========================
+        True          True               True
+        True          False              True
+        False         True               True
+        False         False              False
+
+        Only descendants whose visibility changes are updated. If the native toolkit
+        already hides the children of a hidden widget, the visibility of those
+        children isn't passed to their implementation at all.
+        """
+        stack = [self.widget]
+        while stack:
+            widget = stack.pop()
+            hidden = widget.applicator._hidden
+            for child in widget.children:
+                child_hidden = hidden or child.style._hidden
+                if child_hidden != child.applicator._hidden:
+                    if not getattr(child._impl, "CASCADES_HIDDEN", False):
+                        child._impl.set_hidden(child_hidden)
+                    child.applicator._hidden = child_hidden
+                    stack.append(child)
 
     def set_font(self, font: object) -> None:
         self.widget._impl.set_font(font)
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+
+from travertino.style import BaseStyle
+
+
+@contextmanager
+def batch() -> Iterator[None]:
+    """Defer applying style changes, and laying out widgets, until the end of a batch.
+
+    Restyling a widget normally applies the change to the widget's implementation
+    immediately, and refreshes the layout of the window that contains it. Inside a
+    `with toga.style.batch():` block, the changes made to the style of *any* widget
+    are collected. When the block exits, the changes to each widget's style are
+    applied in one step; then the layout of each affected widget tree is computed and
+    applied exactly once. Adding, inserting and removing widgets inside the block are
+    also laid out once, at the end.
+
+    This is useful for changes that restyle many widgets at once, such as switching
+    a theme. To only defer the layout of part of a widget tree, use
+    [`Widget.batch_update()`][toga.Widget.batch_update].
+
+    Batches can be nested; changes are deferred until the outermost batch exits.
+    """
+    # Imported here to avoid a circular import.
+    from toga.widgets.base import Widget
+
+    # Style changes are applied on exiting the inner context, refreshing widgets; the
+    # refreshes are then performed on exiting the outer context.
+    with Widget._batch_all_updates(), BaseStyle.batch_apply_all():
+        yield
@@ -0,0 +1,146 @@
+"""Bulk arithmetic for the layout of long runs of identically styled children.
+
+NumPy is used if it is installed; otherwise, the same arithmetic is performed with the
+standard library. NumPy isn't imported until the first run that is long enough to be
+laid out in bulk, so that it doesn't add to the time taken to import Toga. In either
+case, every value is computed with the same operations,
+performed in the same order, as the child-by-child layout, so the results are
+identical.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from functools import cache, reduce
+from itertools import accumulate, chain, islice, repeat
+from operator import add
+
+from travertino.constants import CENTER, END
+
+# The number of children below which the bulk arithmetic isn't used; for short runs,
+# the cost of preparing the data outweighs the benefit.
+MIN_CHILDREN = 64
+
+
+@cache
+def _numpy():
+    """Import NumPy, if it is installed.
+
+    :returns: The NumPy module, or None if it isn't installed.
+    """
+    try:
+        import numpy
+    except ImportError:  # pragma: no-cover-if-numpy-installed
+        return None
+    else:  # pragma: no-cover-if-missing-numpy
+        return numpy
+
+
+def _broadcast(value: int | Sequence[int], count: int) -> Sequence[int]:
+    return value if isinstance(value, Sequence) else repeat(value, count)
+
+
+def repeated_sum(start: float, step: float, count: int) -> float:
+    """Add `step` to `start`, `count` times in turn.
+
+    :param start: The initial value.
+    :param step: The value to add.
+    :param count: The number of times to add the step.
+    :returns: The final value.
+    """
+    if isinstance(start, int) and isinstance(step, int):
+        # Integer arithmetic is exact, so the order of the additions doesn't matter.
+        return start + step * count
+    elif (numpy := _numpy()) is not None:  # pragma: no-cover-if-missing-numpy
+        values = numpy.full(count + 1, step, dtype=numpy.float64)
+        values[0] = start
+        return numpy.add.accumulate(values)[-1].item()
+    else:  # pragma: no-cover-if-numpy-installed
+        return reduce(add, repeat(step, count), start)
+
+
+def offsets(
+    start: float,
+    count: int,
+    first: int | Sequence[int],
+    *rest: int | Sequence[int],
+) -> list[float]:
+    """Compute the offset of each of a run of children along an axis.
+
+    Starting from `start`, each child in turn adds `first`, then each of `rest`, to a
+    running total; the offset of a child is the total after it has added `first`.
+    Each term is either a value shared by all the children, or a sequence of values,
+    one for each child.
+
+    :param start: The initial value of the running total.
+    :param count: The number of children.
+    :param first: The term added before the offset of each child is taken.
+    :param rest: The terms added after the offset of each child is taken.
+    :returns: The offset of each child.
+    """
+    terms = (first, *rest)
+    if (numpy := _numpy()) is not None:  # pragma: no-cover-if-missing-numpy
+        dtype = numpy.int64 if isinstance(start, int) else numpy.float64
+        values = numpy.empty((count, len(terms)), dtype=dtype)
+        for column, term in enumerate(terms):
+            values[:, column] = term
+        totals = numpy.add.accumulate(
+            numpy.concatenate((numpy.array([start], dtype=dtype), values.ravel()))
+        )
+        return totals[1 :: len(terms)].tolist()
+    else:  # pragma: no-cover-if-numpy-installed
+        totals = accumulate(
+            chain.from_iterable(
+                zip(*(_broadcast(term, count) for term in terms), strict=True)
+            ),
+            initial=start,
+        )
+        return list(islice(totals, 1, None, len(terms)))
+
+
+def subtract_from(value: float, offsets: list[float]) -> list[float]:
+    """Subtract each of a list of offsets from a value.
+
+    :param value: The value to subtract from.
+    :param offsets: The offsets to subtract.
+    :returns: The result of each subtraction.
+    """
+    if (numpy := _numpy()) is not None:  # pragma: no-cover-if-missing-numpy
+        return (value - numpy.array(offsets)).tolist()
+    else:  # pragma: no-cover-if-numpy-installed
+        return [value - offset for offset in offsets]
+
+
+def aligned(
+    extent: float,
+    sizes: list[int],
+    margins: int,
+    margin_start: int,
+    align: str,
+) -> list[float]:
+    """Compute the position of each of a run of children, aligned within an extent.
+
+    :param extent: The extent the children are aligned within.
+    :param sizes: The size of the content of each child.
+    :param margins: The total of the margins on both sides of each child.
+    :param margin_start: The margin at the start of each child.
+    :param align: How the children are aligned: START, CENTER or END.
+    :returns: The position of the content of each child.
+    """
+    numpy = _numpy()
+    if align == END:
+        if numpy is not None:  # pragma: no-cover-if-missing-numpy
+            return (extent - (numpy.array(sizes) + margins) + margin_start).tolist()
+        else:  # pragma: no-cover-if-numpy-installed
+            return [extent - (size + margins) + margin_start for size in sizes]
+    elif align == CENTER:
+        if numpy is not None:  # pragma: no-cover-if-missing-numpy
+            extra = extent - (numpy.array(sizes) + margins)
+            # Converting to an integer truncates towards zero, like int().
+            return ((extra / 2).astype(numpy.int64) + margin_start).tolist()
+        else:  # pragma: no-cover-if-numpy-installed
+            return [
+                int((extent - (size + margins)) / 2) + margin_start for size in sizes
+            ]
+    else:  # START
+        return [margin_start] * len(sizes)
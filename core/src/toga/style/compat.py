@@ -28,12 +28,10 @@ class _AlignmentCondition(Condition):
         super().__init__(**properties)
         self.main_value = main_value
 
-    def match(self, style, main_name=None):
-        # main_name can't be accessed the "normal" way without causing a loop; we need
-        # to access the private stored value.
-        return (
-            super().match(style) and getattr(style, f"_{main_name}") == self.main_value
-        )
+    def match(self, style, main_index=None):
+        # The main property can't be accessed the "normal" way without causing a loop;
+        # we need to access the private stored value.
+        return super().match(style) and style._get_value(main_index) == self.main_value
 
 
 class _alignment_property(validated_property):
@@ -47,10 +45,15 @@ class _alignment_property(validated_property):
     # is computed / translated. They can never both be set at the same time; setting
     # one deletes any value stored in the other.
 
+    # Only the alignment property is deprecated; see __set_name__().
+    deprecated = False
+
     def __set_name__(self, owner, name):
         # Hard-coded because it's only called on alignment, not align_items.
 
         self.name = "alignment"
+        self.deprecated = True
+        self.index = owner._allocate_slot()
         owner._BASE_ALL_PROPERTIES[owner].add("alignment")
         self.other = "align_items"
         self.derive = {
@@ -65,10 +68,14 @@ class _alignment_property(validated_property):
 
         # Replace the align_items validated_property with another instance of this
         # class. This is needed so accessing or setting either one will properly
-        # reference the other.
-        owner.align_items = _alignment_property(START, CENTER, END)
+        # reference the other. The replacement uses the same storage slot.
+        align_items = _alignment_property(START, CENTER, END)
+        align_items.index = owner.align_items.index
+        self.other_index = align_items.index
+        owner.align_items = align_items
         owner.align_items.name = "align_items"
         owner.align_items.other = "alignment"
+        owner.align_items.other_index = self.index
         owner.align_items.derive = {
             # Invert each condition so that it maps in the opposite direction.
             _AlignmentCondition(result, **condition.properties): condition.main_value
@@ -81,10 +88,10 @@ class _alignment_property(validated_property):
 
         self.warn_if_deprecated()
 
-        if hasattr(obj, f"_{self.other}"):
+        if obj._set_mask >> self.other_index & 1:
             # If the other property is set, attempt to translate.
             for condition, value in self.derive.items():
-                if condition.match(obj, main_name=self.other):
+                if condition.match(obj, main_index=self.other_index):
                     return value
 
         # If the other property isn't set (or no condition is valid), access this
@@ -101,8 +108,8 @@ class _alignment_property(validated_property):
 
         # Delete the other property when setting this one.
         try:
-            delattr(obj, f"_{self.other}")
-        except AttributeError:
+            obj._delete_value(self.other_index)
+        except KeyError:
             pass
         super().__set__(obj, value)
 
@@ -111,8 +118,8 @@ class _alignment_property(validated_property):
 
         # Delete the other property too.
         try:
-            delattr(obj, f"_{self.other}")
-        except AttributeError:
+            obj._delete_value(self.other_index)
+        except KeyError:
             pass
         super().__delete__(obj)
 
@@ -120,10 +127,10 @@ class _alignment_property(validated_property):
         self.warn_if_deprecated()
 
         # Counts as set if *either* of the two properties is set.
-        return super().is_set_on(obj) or hasattr(obj, f"_{self.other}")
+        return super().is_set_on(obj) or bool(obj._set_mask >> self.other_index & 1)
 
     def warn_if_deprecated(self):
-        if self.name == "alignment":
+        if self.deprecated:
             warnings.warn(
                 "Pack.alignment is deprecated. Use Pack.align_items instead.",
                 DeprecationWarning,
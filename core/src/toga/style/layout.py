@@ -1,4 +1,9 @@
-from typing import Any
+from __future__ import annotations
+
+from collections import Counter
+from collections.abc import Callable, Generator
+from time import perf_counter
+from typing import Any, NamedTuple
 
 from travertino.constants import (  # noqa: F401
     BOLD,
@@ -33,32 +38,360 @@ from travertino.layout import BaseBox
 from travertino.size import BaseIntrinsicSize
 from travertino.style import BaseStyle
 
-from toga.fonts import (
-    SYSTEM_DEFAULT_FONT_SIZE,
-    Font,
-    UnknownFontError,
-)
+from toga.fonts import SYSTEM_DEFAULT_FONT_SIZE, _resolve_font
+
+from . import bulk
+
+# Indices of the sides of a box, in the same order as the margin shorthand.
+_TOP, _RIGHT, _BOTTOM, _LEFT = range(4)
+
+# Names of layout attributes, indexed by axis (0 is horizontal, 1 is vertical) or side.
+_SIZE = ("width", "height")
+_CONTENT = ("content_width", "content_height")
+_MIN_CONTENT = ("min_content_width", "min_content_height")
+_CONTENT_POSITION = ("content_top", "content_right", "content_bottom", "content_left")
+
+
+class _LayoutStyle:
+    """A snapshot of the style properties of a node that are read during layout.
+
+    A node that isn't displayed is excluded from the layout of its parent.
+
+    Sizes are indexed by axis (0 is horizontal, 1 is vertical), and margins by side,
+    in the order (top, right, bottom, left). The axes along which the node's children
+    are laid out are resolved from its direction and text direction.
+    """
+
+    __slots__ = [
+        "displayed",
+        "size",
+        "margin",
+        "flex",
+        "direction",
+        "gap",
+        "align_items",
+        "justify_content",
+        "main_axis",
+        "cross_axis",
+        "main_start",
+        "main_end",
+        "cross_start",
+        "cross_end",
+    ]
+
+    def __init__(self, style):
+        self.displayed = style.display != NONE
+        self.size = (style.width, style.height)
+        self.margin = (
+            style.margin_top,
+            style.margin_right,
+            style.margin_bottom,
+            style.margin_left,
+        )
+        self.flex = style.flex
+        self.direction = style.direction
+        self.gap = style.gap
+        self.align_items = style.align_items
+        self.justify_content = style.justify_content
+
+        horizontal = (_LEFT, _RIGHT) if style.text_direction == LTR else (_RIGHT, _LEFT)
+        if style.direction == COLUMN:
+            self.main_axis, self.cross_axis = 1, 0
+            self.main_start, self.main_end = _TOP, _BOTTOM
+            self.cross_start, self.cross_end = horizontal
+        else:
+            self.main_axis, self.cross_axis = 0, 1
+            self.main_start, self.main_end = horizontal
+            self.cross_start, self.cross_end = _TOP, _BOTTOM
+
+
+# A step in a layout; see _run_layout().
+LayoutSteps = Generator[Any, Any, Any]
+
+
+def _run_layout(steps: LayoutSteps | None) -> Any:
+    """Run the steps of a layout to completion, returning the final result.
+
+    The layout of a node is a generator. When it needs the result of another layout
+    (such as that of a child node), it yields the steps of that layout, or None if
+    there is nothing to do; it is then sent the result of those steps. An explicit
+    stack is used rather than recursion, so that arbitrarily deep trees can be laid
+    out without reaching Python's recursion limit.
+    """
+    if steps is None:
+        return None
+
+    stack = [steps]
+    result = None
+    while stack:
+        try:
+            steps = stack[-1].send(result)
+        except StopIteration as stop:
+            stack.pop()
+            result = stop.value
+        else:
+            if steps is not None:
+                stack.append(steps)
+            result = None
+    return result
+
+
+class LayoutTraceEvent(NamedTuple):
+    """The layout of a single node, as reported to a layout tracer."""
+
+    node: Any
+    """The node that was laid out."""
+
+    refresh: int
+    """The number of the refresh in which the node was laid out. Each layout of a
+    tree from its root is a new refresh; the first refresh after a tracer is installed
+    is number 1."""
+
+    pass_name: str
+    """What caused the node to be laid out:
+
+    * `"root"` - the node is the root of the tree being laid out;
+    * `"pass 1"` - the parent of the node laid it out while allocating space to
+      children with a fixed or non-flexible size;
+    * `"pass 2"` - the parent of the node laid it out while allocating flexible space;
+    * `"relayout"` - the node, or one of its descendants, changed since the node was
+      last laid out, so the node was laid out again with its previous allocation.
+    """
+
+    time: float
+    """The wall time, in seconds, taken to lay out the node, including the time taken
+    to lay out its descendants."""
+
+    self_time: float
+    """The wall time, in seconds, taken to lay out the node, excluding the time taken
+    to lay out its descendants."""
+
+
+class _Tracing:
+    """The state of tracing while a layout tracer is installed."""
+
+    def __init__(self, tracer: Callable[[LayoutTraceEvent], object]):
+        self.tracer = tracer
+        self.refresh = 0
+        # For each node that is currently being laid out (outermost first), the time
+        # at which its layout started, and the time spent laying out its children.
+        self.frames = []
+
+    def start_refresh(self) -> None:
+        self.refresh += 1
+        self.frames.clear()
+
+    def start(self) -> None:
+        self.frames.append([perf_counter(), 0.0])
+
+    def end(self, node: Any, pass_name: str) -> None:
+        started, child_time = self.frames.pop()
+        time = perf_counter() - started
+        if self.frames:
+            self.frames[-1][1] += time
+        self.tracer(
+            LayoutTraceEvent(node, self.refresh, pass_name, time, time - child_time)
+        )
+
+
+# The tracing state, if a layout tracer is installed.
+_tracing: _Tracing | None = None
+
+
+def set_tracer(
+    tracer: Callable[[LayoutTraceEvent], object] | None,
+) -> Callable[[LayoutTraceEvent], object] | None:
+    """Install a layout tracer.
+
+    Once installed, the tracer is invoked with a
+    [`LayoutTraceEvent`][toga.style.layout.LayoutTraceEvent] every time a node
+    finishes being laid out. Tracing has a small cost of its own, so it should only be
+    enabled while diagnosing layout performance.
+
+    :param tracer: A callable that accepts a single event; or None to disable tracing.
+    :returns: The previously installed tracer, or None if there wasn't one.
+    """
+    global _tracing
+    previous = None if _tracing is None else _tracing.tracer
+    _tracing = None if tracer is None else _Tracing(tracer)
+    return previous
+
+
+class LayoutTrace:
+    """A layout tracer that records every event, and summarizes them.
+
+    A trace can be installed with [`set_tracer()`][toga.style.layout.set_tracer], or
+    used as a context manager, in which case it is installed for the duration of the
+    `with` block:
+
+    ```python
+    from toga.style.layout import LayoutTrace
+
+    with LayoutTrace() as trace:
+        window.content.refresh()
+
+    print(trace.counts())
+    with open("layout.folded", "w") as f:
+        f.write(trace.flamegraph())
+    ```
+    """
+
+    def __init__(self):
+        self.events: list[LayoutTraceEvent] = []
+        """The events that have been recorded, in the order they occurred."""
+        self._previous = None
+
+    def __call__(self, event: LayoutTraceEvent) -> None:
+        self.events.append(event)
+
+    def __enter__(self) -> LayoutTrace:
+        self._previous = set_tracer(self)
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        set_tracer(self._previous)
+        self._previous = None
+
+    def counts(self) -> dict[int, Counter]:
+        """The number of times each node was laid out in each refresh.
+
+        :returns: A dictionary mapping the number of each refresh to a
+            [`Counter`][collections.Counter] of the nodes laid out in that refresh.
+        """
+        counts = {}
+        for event in self.events:
+            counts.setdefault(event.refresh, Counter())[event.node] += 1
+        return counts
+
+    def flamegraph(self) -> str:
+        """Export the recorded time as a flame graph profile.
+
+        The profile uses the "folded stacks" format understood by tools such as
+        `flamegraph.pl` and [speedscope](https://www.speedscope.app). There is one
+        line for each node that was laid out, giving the path from the root of the
+        tree to the node, and the total time spent laying out the node itself, in
+        microseconds.
+
+        :returns: The profile, as a string.
+        """
+        stacks = {}
+        for event in self.events:
+            path = []
+            node = event.node
+            while node is not None:
+                path.append(str(node).replace(";", ","))
+                node = node.parent
+            stack = ";".join(reversed(path))
+            stacks[stack] = stacks.get(stack, 0) + event.self_time
+
+        return "".join(
+            f"{stack} {round(time * 1_000_000)}\n" for stack, time in stacks.items()
+        )
+
+
+# The style properties that determine each attribute applied to a widget's
+# implementation, keyed by the names backends use in NATIVE_DEFAULT_STYLE.
+_APPLIED_PROPERTIES = {
+    "text_align": frozenset({"text_align", "text_direction"}),
+    "color": frozenset({"color"}),
+    "background_color": frozenset({"background_color"}),
+    "hidden": frozenset({"visibility", "display"}),
+    "font": frozenset(
+        {"font_family", "font_size", "font_style", "font_variant", "font_weight"}
+    ),
+}
 
 
 class PackLogic(BaseStyle):
     class Box(BaseBox):
-        pass
+        __slots__ = ["_layout_args", "_layout_key"]
+
+        def _reset(self):
+            super()._reset()
+            # The arguments this box was last laid out with, as a tuple of
+            # (alloc_width, alloc_height, use_all_width, use_all_height); or None if
+            # the box has never been laid out.
+            self._layout_args = None
+            # The parts of those arguments that can affect the layout of the box. As
+            # long as the box isn't dirty, laying it out again with an allocation that
+            # has the same key would produce the same result.
+            self._layout_key = None
 
     class IntrinsicSize(BaseIntrinsicSize):
         pass
 
-    _depth = -1
+    __slots__ = (
+        # The style properties read during layout, and the CSS declarations of the
+        # style; discarded whenever a property changes.
+        "_layout_snapshot",
+        "_css_snapshot",
+        "_css_text",
+    )
+
+    def __new__(cls, *args: Any, **kwargs: Any) -> PackLogic:
+        style = super().__new__(cls, *args, **kwargs)
+        style._layout_snapshot = None
+        style._css_snapshot = None
+        style._css_text = None
+        return style
+
+    def apply(self, *names: str) -> None:
+        self._layout_snapshot = None
+        self._css_snapshot = None
+        self._css_text = None
+        super().apply(*names)
 
-    @classmethod
-    def _debug(cls, *args: str) -> None:  # pragma: no cover
-        print("    " * cls._depth, *args)
+    @property
+    def _layout_style(self) -> _LayoutStyle:
+        if (snapshot := self._layout_snapshot) is None:
+            snapshot = self._layout_snapshot = _LayoutStyle(self)
+        return snapshot
 
     @property
     def _hidden(self) -> bool:
         """Does this style declaration define an object that should be hidden."""
-        return self.visibility == HIDDEN
+        return self.visibility == HIDDEN or self.display == NONE
+
+    def _native_defaults(self) -> set[str]:
+        """Get the properties that don't need to be applied when the style is first
+        applied to a widget.
+
+        A backend widget can list the attributes (from the keys of
+        `_APPLIED_PROPERTIES`) that its native widget already has the default value
+        for when it's created, as `NATIVE_DEFAULT_STYLE`. An attribute is only
+        skipped if none of the properties that determine it have been set.
+        """
+        applicator = self._applicator
+        impl_class = type(applicator.widget._impl)
+        defaults = set()
+        for attribute in getattr(impl_class, "NATIVE_DEFAULT_STYLE", ()):
+            properties = _APPLIED_PROPERTIES[attribute]
+            if not any(name in self for name in properties):
+                defaults |= properties
+
+        if "visibility" in defaults:
+            if applicator._parent_hidden():
+                defaults -= _APPLIED_PROPERTIES["hidden"]
+            else:
+                # The widget is visible, as its implementation already is.
+                applicator._hidden = False
+        return defaults
 
     def _apply(self, names: set) -> None:
+        # Whether to refresh depends on every property being applied, including any
+        # that are skipped below.
+        refresh = names - {
+            # All properties that *can't* affect layout
+            "text_align",
+            "color",
+            "background_color",
+            "visibility",
+        }
+
+        if not getattr(self._applicator, "_style_applied", True):
+            self._applicator._style_applied = True
+            names = names - self._native_defaults()
+
         if "text_align" in names:
             if (value := self.text_align) is None:
                 if self.text_direction == RTL:
@@ -75,18 +408,8 @@ class PackLogic(BaseStyle):
             self._applicator.set_color(self.color)
         if "background_color" in names:
             self._applicator.set_background_color(self.background_color)
-        if "visibility" in names:
-            value = self.visibility
-            if value == VISIBLE:
-                # If visibility is being set to VISIBLE, look up the chain to
-                # see if an ancestor is hidden.
-                widget = self._applicator.widget
-                while widget := widget.parent:
-                    if widget.style._hidden:
-                        value = HIDDEN
-                        break
-
-            self._applicator.set_hidden(value == HIDDEN)
+        if names & {"visibility", "display"}:
+            self._applicator._apply_hidden()
 
         if names & {
             "font_family",
@@ -95,46 +418,33 @@ class PackLogic(BaseStyle):
             "font_variant",
             "font_weight",
         }:
-            font = None
-            font_kwargs = {
-                "size": self.font_size,
-                "style": self.font_style,
-                "variant": self.font_variant,
-                "weight": self.font_weight,
-            }
-
-            for family in self.font_family:
-                try:
-                    font = Font(family, **font_kwargs)
-                    break
-                except UnknownFontError:
-                    pass
-
-            if font is None:
-                # Fall back to system font if no font families were valid
-                font = Font(SYSTEM, **font_kwargs)
-                print(
-                    f"No valid font family in {self.font_family}; using system font as "
-                    "a fallback"
-                )
-
+            font = _resolve_font(
+                self.font_family,
+                self.font_size,
+                weight=self.font_weight,
+                style=self.font_style,
+                variant=self.font_variant,
+            )
             self._applicator.set_font(font)
 
         # Refresh if any properties that could affect layout are being set.
-        if names - {
-            # All properties that *can't* affect layout
-            "text_align",
-            "color",
-            "background_color",
-            "visibility",
-        }:
+        if refresh:
+            self._applicator.node.layout._mark_dirty()
             self._applicator.refresh()
 
-    def __css__(self) -> str:
-        css = []
+    @property
+    def _css_declarations(self) -> dict[str, str]:
+        """The CSS declarations of this style, as a dictionary of property: value.
+
+        The dictionary is shared, and must not be modified.
+        """
+        if (declarations := self._css_snapshot) is not None:
+            return declarations
+
+        css = {}
         # display
         if self.display == NONE:
-            css.append("display: none;")
+            css["display"] = "none"
         else:
             # if self.display != NONE, it must be pack; it will inherit
             # the pack definition from the Toga stylesheet.
@@ -142,61 +452,61 @@ class PackLogic(BaseStyle):
 
         # visibility
         if self.visibility != VISIBLE:
-            css.append(f"visibility: {self.visibility};")
+            css["visibility"] = str(self.visibility)
 
         # direction
-        css.append(f"flex-direction: {self.direction.lower()};")
+        css["flex-direction"] = self.direction.lower()
         # flex
         if (self.width == NONE and self.direction == ROW) or (
             self.height == NONE and self.direction == COLUMN
         ):
-            css.append(f"flex: {self.flex} 0 auto;")
+            css["flex"] = f"{self.flex} 0 auto"
 
         # width/flex
         if self.width != NONE:
-            css.append(f"width: {self.width}px;")
+            css["width"] = f"{self.width}px"
 
         # height/flex
         if self.height != NONE:
-            css.append(f"height: {self.height}px;")
+            css["height"] = f"{self.height}px"
 
         # align_items
         if self.align_items:
-            css.append(f"align-items: {self.align_items};")
+            css["align-items"] = str(self.align_items)
 
         # justify_content
         if self.justify_content != START:
-            css.append(f"justify-content: {self.justify_content};")
+            css["justify-content"] = str(self.justify_content)
 
         # gap
         if self.gap:
-            css.append(f"gap: {self.gap}px;")
+            css["gap"] = f"{self.gap}px"
 
         # margin_*
         if self.margin_top:
-            css.append(f"margin-top: {self.margin_top}px;")
+            css["margin-top"] = f"{self.margin_top}px"
         if self.margin_bottom:
-            css.append(f"margin-bottom: {self.margin_bottom}px;")
+            css["margin-bottom"] = f"{self.margin_bottom}px"
         if self.margin_left:
-            css.append(f"margin-left: {self.margin_left}px;")
+            css["margin-left"] = f"{self.margin_left}px"
         if self.margin_right:
-            css.append(f"margin-right: {self.margin_right}px;")
+            css["margin-right"] = f"{self.margin_right}px"
 
         # color
         if self.color:
-            css.append(f"color: {self.color};")
+            css["color"] = str(self.color)
 
         # background_color
         if self.background_color:
-            css.append(f"background-color: {self.background_color};")
+            css["background-color"] = str(self.background_color)
 
         # text_align
         if self.text_align:
-            css.append(f"text-align: {self.text_align};")
+            css["text-align"] = str(self.text_align)
 
         # text_direction
         if self.text_direction != LTR:
-            css.append(f"text-direction: {self.text_direction};")
+            css["text-direction"] = str(self.text_direction)
 
         # font-*
         if self.font_family != [SYSTEM]:
@@ -204,39 +514,73 @@ class PackLogic(BaseStyle):
                 f'"{family}"' if " " in family else family
                 for family in self.font_family
             ]
-            css.append(f"font-family: {', '.join(families)};")
+            css["font-family"] = ", ".join(families)
         if self.font_size != SYSTEM_DEFAULT_FONT_SIZE:
-            css.append(f"font-size: {self.font_size}pt;")
+            css["font-size"] = f"{self.font_size}pt"
         if self.font_weight != NORMAL:
-            css.append(f"font-weight: {self.font_weight};")
+            css["font-weight"] = str(self.font_weight)
         if self.font_style != NORMAL:
-            css.append(f"font-style: {self.font_style};")
+            css["font-style"] = str(self.font_style)
         if self.font_variant != NORMAL:
-            css.append(f"font-variant: {self.font_variant};")
+            css["font-variant"] = str(self.font_variant)
+
+        self._css_snapshot = css
+        return css
 
-        return " ".join(css)
+    def __css__(self) -> str:
+        if (text := self._css_text) is None:
+            text = self._css_text = " ".join(
+                f"{name}: {value};" for name, value in self._css_declarations.items()
+            )
+        return text
+
+    def _css_changes(self, previous: dict[str, str]) -> dict[str, str | None]:
+        """Get the CSS declarations of this style that differ from an earlier set of
+        declarations.
+
+        This is used by the web backend to update only the declarations of a
+        widget's inline style that have changed: each declaration with a value is set
+        (with `setProperty()`), and each declaration that is `None` is removed (with
+        `removeProperty()`).
+
+        :param previous: The declarations that were last applied, as returned by
+            `_css_declarations`.
+        :returns: A dictionary of property: value for each declaration that has been
+            added or changed; the value is `None` for each declaration that has been
+            removed.
+        """
+        declarations = self._css_declarations
+        if declarations is previous:
+            return {}
+
+        changes = {
+            name: value
+            for name, value in declarations.items()
+            if previous.get(name) != value
+        }
+        for name in previous.keys() - declarations.keys():
+            changes[name] = None
+        return changes
 
     def layout(self, viewport: Any) -> None:
-        # self._debug("=" * 80)
-        # self._debug(
-        #     f"Layout root {node}, available {viewport.width}x{viewport.height}"
-        # )
-        self.__class__._depth = -1
-
-        self._layout_node(
-            alloc_width=viewport.width,
-            alloc_height=viewport.height,
-            use_all_height=True,  # root node uses all height
-            use_all_width=True,  # root node uses all width
-        )
+        if _tracing is not None:
+            _tracing.start_refresh()
 
         node = self._applicator.node
 
-        node.layout.content_top = self.margin_top
-        node.layout.content_bottom = self.margin_bottom
+        # The root node uses all the width and height of the viewport.
+        _run_layout(
+            self._layout_node_cached(
+                viewport.width, viewport.height, True, True, "root"
+            )
+        )
+
+        margin_top, margin_right, margin_bottom, margin_left = self._layout_style.margin
+        node.layout.content_top = margin_top
+        node.layout.content_bottom = margin_bottom
 
-        node.layout.content_left = self.margin_left
-        node.layout.content_right = self.margin_right
+        node.layout.content_left = margin_left
+        node.layout.content_right = margin_right
 
     def _layout_node(
         self,
@@ -244,33 +588,29 @@ class PackLogic(BaseStyle):
         alloc_height: int,
         use_all_width: bool,
         use_all_height: bool,
-    ) -> None:
-        self.__class__._depth += 1
-        # self._debug(
-        #     f"COMPUTE LAYOUT for {node} available "
-        #     f"{alloc_width}{'+' if use_all_width else ''}"
-        #     " x "
-        #     f"{alloc_height}{'+' if use_all_height else ''}"
-        # )
+        pass_name: str,
+    ) -> LayoutSteps:
+        # The tracing state is looked up once, so that a tracer installed or removed
+        # part way through the layout of this node doesn't see an unbalanced layout.
+        if (tracing := _tracing) is not None:
+            tracing.start()
 
         node = self._applicator.node
+        style = self._layout_style
+        style_width, style_height = style.size
+        margin_top, margin_right, margin_bottom, margin_left = style.margin
 
         # Establish available width
-        if self.width != NONE:
+        if style_width != NONE:
             # If width is specified, use it
-            available_width = self.width
-            min_width = self.width
-            # self._debug(f"SPECIFIED WIDTH {self.width}")
+            available_width = style_width
+            min_width = style_width
         else:
             # If no width is specified, assume we're going to use all
             # the available width. If there is an intrinsic width,
             # use it to make sure the width is at least the amount specified.
-            available_width = max(
-                0, (alloc_width - self.margin_left - self.margin_right)
-            )
-            # self._debug(f"INITIAL {available_width=}")
+            available_width = max(0, (alloc_width - margin_left - margin_right))
             if node.intrinsic.width is not None:
-                # self._debug(f"INTRINSIC WIDTH {node.intrinsic.width}")
                 try:
                     min_width = node.intrinsic.width.value
                     available_width = max(available_width, min_width)
@@ -278,25 +618,17 @@ class PackLogic(BaseStyle):
                     available_width = node.intrinsic.width
                     min_width = node.intrinsic.width
 
-                # self._debug(f"ADJUSTED {available_width=}")
             else:
-                # self._debug(f"AUTO {available_width=}")
                 min_width = 0
 
         # Establish available height
-        if self.height != NONE:
+        if style_height != NONE:
             # If height is specified, use it.
-            available_height = self.height
-            min_height = self.height
-            # self._debug(f"SPECIFIED HEIGHT {self.height}")
+            available_height = style_height
+            min_height = style_height
         else:
-            available_height = max(
-                0,
-                alloc_height - self.margin_top - self.margin_bottom,
-            )
-            # self._debug(f"INITIAL {available_height=}")
+            available_height = max(0, alloc_height - margin_top - margin_bottom)
             if node.intrinsic.height is not None:
-                # self._debug(f"INTRINSIC HEIGHT {node.intrinsic.height}")
                 try:
                     min_height = node.intrinsic.height.value
                     available_height = max(available_height, min_height)
@@ -304,244 +636,392 @@ class PackLogic(BaseStyle):
                     available_height = node.intrinsic.height
                     min_height = node.intrinsic.height
 
-                # self._debug(f"ADJUSTED {available_height=}")
             else:
-                # self._debug(f"AUTO {available_height=}")
                 min_height = 0
 
-        if node.children:
-            min_width, width, min_height, height = self._layout_children(
+        # Children that aren't displayed are excluded from layout entirely.
+        children = [
+            child for child in node.children if child.style._layout_style.displayed
+        ]
+        if children:
+            min_width, width, min_height, height = yield from self._layout_children(
+                children=children,
                 available_width=available_width,
                 available_height=available_height,
                 use_all_width=use_all_width,
                 use_all_height=use_all_height,
             )
-            # self._debug(f"HAS CHILDREN {min_width=} {width=} {min_height=} {height=}")
         else:
             width = available_width
             height = available_height
-            # self._debug(f"NO CHILDREN {min_width=} {width=} {min_height=} {height=}")
 
         # If an explicit width/height was given, that specification
         # overrides the width/height evaluated by the layout of children
-        if self.width != NONE:
-            width = self.width
+        if style_width != NONE:
+            width = style_width
             min_width = width
-        if self.height != NONE:
-            height = self.height
+        if style_height != NONE:
+            height = style_height
             min_height = height
 
-        # self._debug(f"FINAL SIZE {min_width}x{min_height} {width}x{height}")
         node.layout.content_width = int(width)
         node.layout.content_height = int(height)
 
         node.layout.min_content_width = int(min_width)
         node.layout.min_content_height = int(min_height)
 
-        # self._debug("END LAYOUT", node, node.layout)
-        self.__class__._depth -= 1
+        node.layout._layout_args = (
+            alloc_width,
+            alloc_height,
+            use_all_width,
+            use_all_height,
+        )
+        node.layout._layout_key = self._layout_key(*node.layout._layout_args)
+        node.layout._dirty = False
+        node.layout._dirty_descendants = False
+
+        if tracing is not None:
+            tracing.end(node, pass_name)
 
-    def _layout_node_in_direction(
+    def _layout_key(
         self,
-        direction: str,  # ROW | COLUMN
+        alloc_width: int,
+        alloc_height: int,
+        use_all_width: bool,
+        use_all_height: bool,
+    ) -> tuple:
+        """Reduce an allocation to the parts that can affect this node's layout.
+
+        The allocated width or height is irrelevant if the node has an explicit or
+        fixed intrinsic size in that dimension; and whether to use all the available
+        space is irrelevant for a node without children.
+        """
+        node = self._applicator.node
+        style_width, style_height = self._layout_style.size
+        if style_width != NONE or (
+            node.intrinsic.width is not None
+            and not hasattr(node.intrinsic.width, "value")
+        ):
+            alloc_width = None
+        if style_height != NONE or (
+            node.intrinsic.height is not None
+            and not hasattr(node.intrinsic.height, "value")
+        ):
+            alloc_height = None
+
+        if node.children:
+            return alloc_width, alloc_height, use_all_width, use_all_height
+        else:
+            return alloc_width, alloc_height
+
+    def _layout_node_cached(
+        self,
+        alloc_width: int,
+        alloc_height: int,
+        use_all_width: bool,
+        use_all_height: bool,
+        pass_name: str,
+    ) -> LayoutSteps | None:
+        """The steps to lay out this node, reusing the previous result if it is still
+        valid.
+
+        The previous result is valid if the node isn't dirty, and the new allocation
+        has the same layout key as the one the node was last laid out with. In that
+        case, only dirty descendants of the node (if any) are laid out again.
+
+        :returns: The steps to lay out the node, or None if there's nothing to do.
+        """
+        layout = self._applicator.node.layout
+        if not layout._dirty and layout._layout_key == self._layout_key(
+            alloc_width, alloc_height, use_all_width, use_all_height
+        ):
+            layout._layout_args = (
+                alloc_width,
+                alloc_height,
+                use_all_width,
+                use_all_height,
+            )
+            if layout._dirty_descendants:
+                return self._relayout_dirty()
+            return None
+        else:
+            return self._layout_node(
+                alloc_width, alloc_height, use_all_width, use_all_height, pass_name
+            )
+
+    def _relayout_dirty(self) -> LayoutSteps:
+        """Lay out the dirty parts of this node's subtree again.
+
+        Each dirty node is laid out with the same allocation it received the last time
+        it was laid out. A node's parent only needs to be laid out again if that changes
+        the size of the node; otherwise, propagation stops at the node.
+
+        :returns: The steps to lay out the node. Their result is whether the size of
+            this node may have changed, requiring its parent to be laid out again.
+        """
+        node = self._applicator.node
+        layout = node.layout
+
+        if layout._layout_args is None:
+            # This node has never been laid out; its parent needs to allocate space for
+            # it.
+            return True
+
+        size = (
+            layout.content_width,
+            layout.content_height,
+            layout.min_content_width,
+            layout.min_content_height,
+        )
+
+        if not layout._dirty:
+            layout._dirty_descendants = False
+            resized = False
+            for child in node.children:
+                if (
+                    child.layout._dirty or child.layout._dirty_descendants
+                ) and child.style._layout_style.displayed:
+                    resized |= yield child.style._relayout_dirty()
+
+            if not resized:
+                return False
+
+        # Force the node to be laid out, rather than reusing the previous result.
+        layout._dirty = True
+        yield self._layout_node(*layout._layout_args, "relayout")
+
+        return size != (
+            layout.content_width,
+            layout.content_height,
+            layout.min_content_width,
+            layout.min_content_height,
+        )
+
+    def _layout_node_on_axis(
+        self,
+        main_axis: int,  # 0 (horizontal) | 1 (vertical)
         alloc_main: int,
         alloc_cross: int,
         use_all_main: bool,
         use_all_cross: bool,
-    ) -> None:
-        if direction == COLUMN:
-            self._layout_node(
-                alloc_height=alloc_main,
-                alloc_width=alloc_cross,
-                use_all_height=use_all_main,
-                use_all_width=use_all_cross,
+        pass_name: str,
+    ) -> LayoutSteps | None:
+        if main_axis:
+            return self._layout_node_cached(
+                alloc_cross, alloc_main, use_all_cross, use_all_main, pass_name
             )
         else:
-            self._layout_node(
-                alloc_width=alloc_main,
-                alloc_height=alloc_cross,
-                use_all_width=use_all_main,
-                use_all_height=use_all_cross,
+            return self._layout_node_cached(
+                alloc_main, alloc_cross, use_all_main, use_all_cross, pass_name
             )
 
+    def _flex_run(self, children: list) -> tuple[float, tuple] | None:
+        """Determine whether children can be laid out with bulk arithmetic.
+
+        That is possible if there are enough children, and they are all flexible, with
+        the same flex and margins, and with no explicit or intrinsic main-axis size.
+
+        :returns: The flex and margins shared by the children, or None if they can't
+            be laid out in bulk.
+        """
+        if len(children) < bulk.MIN_CHILDREN:
+            return None
+
+        main_axis = self._layout_style.main_axis
+        main_name = _SIZE[main_axis]
+        first = children[0].style._layout_style
+        if not first.flex:
+            return None
+
+        for child in children:
+            child_style = child.style._layout_style
+            if (
+                child_style.flex != first.flex
+                or child_style.margin != first.margin
+                or child_style.size[main_axis] != NONE
+                or getattr(child.intrinsic, main_name) is not None
+            ):
+                return None
+
+        return first.flex, first.margin
+
     def _layout_children(
         self,
+        children: list,
         available_width: int,
         available_height: int,
         use_all_width: bool,
         use_all_height: bool,
-    ) -> tuple[int, int, int, int]:  # min_width, width, min_height, height
-        # Assign the appropriate dimensions to main and cross axes, depending on row /
-        # column direction.
-        horizontal = (LEFT, RIGHT) if self.text_direction == LTR else (RIGHT, LEFT)
-        if self.direction == COLUMN:
-            available_main, available_cross = available_height, available_width
-            use_all_main, use_all_cross = use_all_height, use_all_width
-            main_name, cross_name = "height", "width"
-            main_start, main_end = TOP, BOTTOM
-            cross_start, cross_end = horizontal
-        else:
-            available_main, available_cross = available_width, available_height
-            use_all_main, use_all_cross = use_all_width, use_all_height
-            main_name, cross_name = "width", "height"
-            main_start, main_end = horizontal
-            cross_start, cross_end = TOP, BOTTOM
+    ) -> LayoutSteps:  # Result: min_width, width, min_height, height
+        # The main and cross axes, and the sides of a box at the start and end of each
+        # axis, have been resolved from the row / column direction and text direction.
+        style = self._layout_style
+        main_axis, cross_axis = style.main_axis, style.cross_axis
+        main_start, main_end = style.main_start, style.main_end
+        cross_start, cross_end = style.cross_start, style.cross_end
+
+        available = (available_width, available_height)
+        available_main, available_cross = available[main_axis], available[cross_axis]
+        use_all = (use_all_width, use_all_height)
+        use_all_main, use_all_cross = use_all[main_axis], use_all[cross_axis]
+
+        main_name = _SIZE[main_axis]
+        content_main, content_cross = _CONTENT[main_axis], _CONTENT[cross_axis]
+        min_content_main = _MIN_CONTENT[main_axis]
+        min_content_cross = _MIN_CONTENT[cross_axis]
 
-        node = self._applicator.node
         flex_total = 0
         min_flex = 0
         main = 0
         min_main = 0
         remaining_main = available_main
 
-        # self._debug(
-        #     f"LAYOUT {self.direction.upper()} CHILDREN "
-        #     f"{main_name=} {available_main=} {available_cross=}"
-        # )
+        # If there are many children, all flexible with the same flex and margins, and
+        # with no main-axis size, they can be laid out with bulk arithmetic.
+        run = self._flex_run(children)
 
         # Pass 1: Lay out all children with a hard-specified main-axis dimension, or an
         # intrinsic non-flexible dimension. While iterating, collect the flex
         # total of remaining elements.
 
-        for i, child in enumerate(node.children):
-            # self._debug(f"PASS 1 {child}")
-            if child.style[main_name] != NONE:
-                # self._debug(f"- fixed {main_name} {child.style[main_name]}")
-                child.style._layout_node_in_direction(
-                    direction=self.direction,
-                    alloc_main=remaining_main,
-                    alloc_cross=available_cross,
-                    use_all_main=False,
-                    use_all_cross=child.style.direction == self.direction,
+        if run is not None:
+            # No child of a run is laid out in pass 1, and none has a minimum size.
+            run_flex, run_margin = run
+            child_main = run_margin[main_start] + run_margin[main_end]
+            flex_total = bulk.repeated_sum(0, run_flex, len(children))
+            main = min_main = child_main + (style.gap + child_main) * (
+                len(children) - 1
+            )
+            remaining_main = bulk.repeated_sum(
+                remaining_main - child_main,
+                -(style.gap + child_main),
+                len(children) - 1,
+            )
+            children_pass_1 = ()
+        else:
+            children_pass_1 = children
+
+        for i, child in enumerate(children_pass_1):
+            child_style = child.style._layout_style
+            child_margin = child_style.margin
+            child_intrinsic_main = getattr(child.intrinsic, main_name)
+            use_all_child_cross = child_style.direction == style.direction
+            if child_style.size[main_axis] != NONE:
+                yield child.style._layout_node_on_axis(
+                    main_axis,
+                    remaining_main,
+                    available_cross,
+                    False,
+                    use_all_child_cross,
+                    "pass 1",
                 )
-                child_content_main = getattr(child.layout, f"content_{main_name}")
+                child_content_main = getattr(child.layout, content_main)
 
                 # It doesn't matter how small the children can be laid out; we have an
                 # intrinsic size; so don't use min_content.(main_name)
-                min_child_content_main = getattr(child.layout, f"content_{main_name}")
-
-            elif getattr(child.intrinsic, main_name) is not None:
-                if hasattr(getattr(child.intrinsic, main_name), "value"):
-                    if child.style.flex:
-                        # self._debug(
-                        #     f"- intrinsic flex {main_name} "
-                        #     f"{getattr(child.intrinsic, main_name)=}"
-                        # )
-                        flex_total += child.style.flex
+                min_child_content_main = child_content_main
+
+            elif child_intrinsic_main is not None:
+                if hasattr(child_intrinsic_main, "value"):
+                    if child_style.flex:
+                        flex_total += child_style.flex
                         # Final child content size will be computed in pass 2, after the
                         # amount of flexible space is known. For now, set an initial
                         # content main-axis size based on the intrinsic size, which
                         # will be the minimum possible allocation.
-                        child_content_main = getattr(child.intrinsic, main_name).value
+                        child_content_main = child_intrinsic_main.value
                         min_child_content_main = child_content_main
 
                         min_flex += (
-                            child.style[f"margin_{main_start}"]
+                            child_margin[main_start]
                             + child_content_main
-                            + child.style[f"margin_{main_end}"]
+                            + child_margin[main_end]
                         )
                     else:
-                        # self._debug(
-                        #     f"- intrinsic non-flex {main_name} "
-                        #     f"{getattr(child.intrinsic, main_name)=}"
-                        # )
-                        child.style._layout_node_in_direction(
-                            direction=self.direction,
-                            alloc_main=0,
-                            alloc_cross=available_cross,
-                            use_all_main=False,
-                            use_all_cross=child.style.direction == self.direction,
+                        yield child.style._layout_node_on_axis(
+                            main_axis,
+                            0,
+                            available_cross,
+                            False,
+                            use_all_child_cross,
+                            "pass 1",
                         )
 
-                        child_content_main = getattr(
-                            child.layout, f"content_{main_name}"
-                        )
+                        child_content_main = getattr(child.layout, content_main)
 
                         # It doesn't matter how small the children can be laid out; we
                         # have an intrinsic size; so don't use
                         # layout._min_content(main_name)
                         min_child_content_main = child_content_main
                 else:
-                    # self._debug(
-                    #     f"- intrinsic {main_name} "
-                    #     f"{getattr(child.intrinsic, main_name)=}"
-                    # )
-                    child.style._layout_node_in_direction(
-                        direction=self.direction,
-                        alloc_main=remaining_main,
-                        alloc_cross=available_cross,
-                        use_all_main=False,
-                        use_all_cross=child.style.direction == self.direction,
+                    yield child.style._layout_node_on_axis(
+                        main_axis,
+                        remaining_main,
+                        available_cross,
+                        False,
+                        use_all_child_cross,
+                        "pass 1",
                     )
 
-                    child_content_main = getattr(child.layout, f"content_{main_name}")
+                    child_content_main = getattr(child.layout, content_main)
 
                     # It doesn't matter how small the children can be laid out; we have
                     # an intrinsic size; so don't use layout._min_content(main_name)
                     min_child_content_main = child_content_main
             else:
-                if child.style.flex:
-                    # self._debug(f"- unspecified flex {main_name}")
-                    flex_total += child.style.flex
+                if child_style.flex:
+                    flex_total += child_style.flex
                     # Final child content size will be computed in pass 2, after the
                     # amount of flexible space is known. For now, use 0 as the minimum,
                     # as that's the best hint the widget style can give.
                     child_content_main = 0
                     min_child_content_main = 0
                 else:
-                    # self._debug(f"- unspecified non-flex {main_name}")
-                    child.style._layout_node_in_direction(
-                        direction=self.direction,
-                        alloc_main=remaining_main,
-                        alloc_cross=available_cross,
-                        use_all_main=False,
-                        use_all_cross=child.style.direction == self.direction,
-                    )
-                    child_content_main = getattr(child.layout, f"content_{main_name}")
-                    min_child_content_main = getattr(
-                        child.layout, f"min_content_{main_name}"
+                    yield child.style._layout_node_on_axis(
+                        main_axis,
+                        remaining_main,
+                        available_cross,
+                        False,
+                        use_all_child_cross,
+                        "pass 1",
                     )
+                    child_content_main = getattr(child.layout, content_main)
+                    min_child_content_main = getattr(child.layout, min_content_main)
 
-            gap = 0 if i == 0 else self.gap
+            gap = 0 if i == 0 else style.gap
             child_main = (
-                child.style[f"margin_{main_start}"]
-                + child_content_main
-                + child.style[f"margin_{main_end}"]
+                child_margin[main_start] + child_content_main + child_margin[main_end]
             )
             main += gap + child_main
             remaining_main -= gap + child_main
 
             min_child_main = (
-                child.style[f"margin_{main_start}"]
+                child_margin[main_start]
                 + min_child_content_main
-                + child.style[f"margin_{main_end}"]
+                + child_margin[main_end]
             )
             min_main += gap + min_child_main
 
-            # self._debug(f"  {min_child_main=} {min_main=} {min_flex=}")
-            # self._debug(f"  {child_main=} {main=} {remaining_main=}")
-
         if flex_total > 0:
             quantum = (remaining_main + min_flex) / flex_total
             # In an ideal flex layout, all flex children will have a main-axis size
             # proportional to their flex value. However, if a flex child has a flexible
             # minimum main-axis size constraint that is greater than the ideal
             # main-axis size for a balanced flex layout, they need to be removed from
-            # the flex calculation.
+            # the flex calculation. (No child of a run has an intrinsic size.)
 
-            # self._debug(f"PASS 1a; {quantum=}")
-            for child in node.children:
+            for child in children if run is None else ():
+                child_style = child.style._layout_style
                 child_intrinsic_main = getattr(child.intrinsic, main_name)
-                if child.style.flex and child_intrinsic_main is not None:
+                if child_style.flex and child_intrinsic_main is not None:
                     try:
-                        ideal_main = quantum * child.style.flex
+                        ideal_main = quantum * child_style.flex
                         if child_intrinsic_main.value > ideal_main:
-                            # self._debug(f"- {child} overflows ideal main dimension")
-                            flex_total -= child.style.flex
+                            flex_total -= child_style.flex
                             min_flex -= (
-                                child.style[f"margin_{main_start}"]
+                                child_style.margin[main_start]
                                 + child_intrinsic_main.value
-                                + child.style[f"margin_{main_end}"]
+                                + child_style.margin[main_end]
                             )
                     except AttributeError:
                         # Intrinsic main-axis size isn't flexible
@@ -554,37 +1034,58 @@ class PackLogic(BaseStyle):
         else:
             quantum = 0
 
-        # self._debug(f"END PASS 1; {min_main=} {main=} {min_flex=} {quantum=}")
-
         # Pass 2: Lay out children with an intrinsic flexible main-axis size, or no
         # main-axis size specification at all.
-        for child in node.children:
-            # self._debug(f"PASS 2 {child}")
-            if child.style[main_name] != NONE:
-                # self._debug(f"- already laid out (explicit {main_name})")
+        if run is not None:
+            if quantum:
+                child_alloc_main = quantum * run_flex
+            else:
+                child_alloc_main = run_margin[main_start] + run_margin[main_end]
+
+            for child in children:
+                yield child.style._layout_node_on_axis(
+                    main_axis,
+                    child_alloc_main,
+                    available_cross,
+                    True,
+                    child.style._layout_style.direction == style.direction,
+                    "pass 2",
+                )
+
+            main += sum(getattr(child.layout, content_main) for child in children)
+            min_main += sum(
+                getattr(child.layout, min_content_main) for child in children
+            )
+            children_pass_2 = ()
+        else:
+            children_pass_2 = children
+
+        for child in children_pass_2:
+            child_style = child.style._layout_style
+            child_margin = child_style.margin
+            if child_style.size[main_axis] != NONE:
+                # Already laid out in pass 1 (explicit main-axis size).
                 pass
-            elif child.style.flex:
-                if getattr(child.intrinsic, main_name) is not None:
+            elif child_style.flex:
+                child_intrinsic_main = getattr(child.intrinsic, main_name)
+                if child_intrinsic_main is not None:
                     try:
                         child_alloc_main = (
-                            child.style[f"margin_{main_start}"]
-                            + getattr(child.intrinsic, main_name).value
-                            + child.style[f"margin_{main_end}"]
+                            child_margin[main_start]
+                            + child_intrinsic_main.value
+                            + child_margin[main_end]
                         )
-                        ideal_main = quantum * child.style.flex
-                        # self._debug(
-                        #     f"- flexible intrinsic {main_name} {child_alloc_main=}"
-                        # )
+                        ideal_main = quantum * child_style.flex
                         if ideal_main > child_alloc_main:
-                            # self._debug(f"  {ideal_main=}")
                             child_alloc_main = ideal_main
 
-                        child.style._layout_node_in_direction(
-                            direction=self.direction,
-                            alloc_main=child_alloc_main,
-                            alloc_cross=available_cross,
-                            use_all_main=True,
-                            use_all_cross=child.style.direction == self.direction,
+                        yield child.style._layout_node_on_axis(
+                            main_axis,
+                            child_alloc_main,
+                            available_cross,
+                            True,
+                            child_style.direction == style.direction,
+                            "pass 2",
                         )
                         # Our main-axis dimension calculation already takes into account
                         # the intrinsic size; that has now expanded as a result of
@@ -593,123 +1094,134 @@ class PackLogic(BaseStyle):
                         # itself have children, and those grandchildren have now been
                         # laid out.
 
-                        # self._debug(
-                        #     f"  sub {getattr(child.intrinsic, main_name).value=}"
-                        # )
-                        # self._debug(
-                        #     f"  add {getattr(child.layout, f'content_{main_name}')=}"
-                        # )
-                        # self._debug(
-                        #     f"  add min "
-                        #     f"{getattr(child.layout, f'min_content_{main_name}')=}"
-                        # )
                         main = (
                             main
-                            - getattr(child.intrinsic, main_name).value
-                            + getattr(child.layout, f"content_{main_name}")
+                            - child_intrinsic_main.value
+                            + getattr(child.layout, content_main)
                         )
                         min_main = (
                             min_main
-                            - getattr(child.intrinsic, main_name).value
-                            + getattr(child.layout, f"min_content_{main_name}")
+                            - child_intrinsic_main.value
+                            + getattr(child.layout, min_content_main)
                         )
                     except AttributeError:
-                        # self._debug(
-                        #     "- already laid out (fixed intrinsic main-axis dimension)"
-                        # )
+                        # Already laid out in pass 1 (fixed intrinsic main-axis size).
                         pass
                 else:
                     if quantum:
-                        # self._debug(
-                        #     f"- unspecified flex {main_name} with {quantum=}"
-                        # )
-                        child_alloc_main = quantum * child.style.flex
+                        child_alloc_main = quantum * child_style.flex
                     else:
-                        # self._debug(f"- unspecified flex {main_name}")
                         child_alloc_main = (
-                            child.style[f"margin_{main_start}"]
-                            + child.style[f"margin_{main_end}"]
+                            child_margin[main_start] + child_margin[main_end]
                         )
 
-                    child.style._layout_node_in_direction(
-                        direction=self.direction,
-                        alloc_main=child_alloc_main,
-                        alloc_cross=available_cross,
-                        use_all_main=True,
-                        use_all_cross=child.style.direction == self.direction,
+                    yield child.style._layout_node_on_axis(
+                        main_axis,
+                        child_alloc_main,
+                        available_cross,
+                        True,
+                        child_style.direction == style.direction,
+                        "pass 2",
                     )
                     # We now know the final min_main/main that accounts for flexible
                     # sizing; add that to the overall.
 
-                    # self._debug(
-                    #     f"  add {getattr(child.layout, f'min_content_{main_name}')=}"
-                    # )
-                    # self._debug(
-                    #     f"  add {getattr(child.layout, f'content_{main_name}')=}"
-                    # )
-                    main += getattr(child.layout, f"content_{main_name}")
-                    min_main += getattr(child.layout, f"min_content_{main_name}")
+                    main += getattr(child.layout, content_main)
+                    min_main += getattr(child.layout, min_content_main)
 
             else:
-                # self._debug(f"- already laid out (intrinsic non-flex {main_name})")
+                # Already laid out in pass 1 (intrinsic non-flexible main-axis size).
                 pass
 
-            # self._debug(f"{main_name} {min_main=} {main=}")
-
-        # self._debug(f"PASS 2 COMPLETE; USED {main=} {main_name}")
-        if use_all_main or self[main_name] != NONE:
+        if use_all_main or style.size[main_axis] != NONE:
             extra = max(0, available_main - main)
             main += extra
         else:
             extra = 0
-        # self._debug(f"COMPUTED {main_name} {min_main=} {main=}")
 
         # Pass 3: Set the main-axis position of each element, and establish box's
         # cross-axis dimension
-        if self.justify_content == END:
+        if style.justify_content == END:
             offset = extra
-        elif self.justify_content == CENTER:
+        elif style.justify_content == CENTER:
             offset = extra / 2
         else:  # START
             offset = 0
 
         cross = 0
         min_cross = 0
+        content_main_start = _CONTENT_POSITION[main_start]
+
+        if run is not None:
+            sizes = [getattr(child.layout, content_main) for child in children]
+            if main_start == _RIGHT:
+                positions = bulk.subtract_from(
+                    main,
+                    bulk.offsets(
+                        offset,
+                        len(children),
+                        [size + run_margin[_RIGHT] for size in sizes],
+                        run_margin[_LEFT],
+                        style.gap,
+                    ),
+                )
+                content_main_start = "content_left"
+            else:
+                positions = bulk.offsets(
+                    offset,
+                    len(children),
+                    run_margin[main_start],
+                    sizes,
+                    run_margin[main_end],
+                    style.gap,
+                )
+            for child, position in zip(children, positions, strict=True):
+                setattr(child.layout, content_main_start, position)
+
+            cross_margins = run_margin[cross_start] + run_margin[cross_end]
+            cross_sizes = [getattr(child.layout, content_cross) for child in children]
+            cross = max(cross, max(cross_sizes) + cross_margins)
+            min_cross = max(
+                min_cross,
+                max(getattr(child.layout, min_content_cross) for child in children)
+                + cross_margins,
+            )
+            children_pass_3 = ()
+        else:
+            children_pass_3 = children
 
-        for child in node.children:
-            # self._debug(f"PASS 3: {child} AT MAIN-AXIS OFFSET {offset}")
-            if main_start == RIGHT:
+        for child in children_pass_3:
+            child_margin = child.style._layout_style.margin
+            if main_start == _RIGHT:
                 # Needs special casing, since it's still ultimately content_left that
                 # needs to be set.
-                offset += child.layout.content_width + child.style.margin_right
+                offset += child.layout.content_width + child_margin[_RIGHT]
                 child.layout.content_left = main - offset
-                offset += child.style.margin_left
+                offset += child_margin[_LEFT]
             else:
-                offset += child.style[f"margin_{main_start}"]
-                setattr(child.layout, f"content_{main_start}", offset)
-                offset += getattr(child.layout, f"content_{main_name}")
-                offset += child.style[f"margin_{main_end}"]
+                offset += child_margin[main_start]
+                setattr(child.layout, content_main_start, offset)
+                offset += getattr(child.layout, content_main)
+                offset += child_margin[main_end]
 
-            offset += self.gap
+            offset += style.gap
 
             child_cross = (
-                getattr(child.layout, f"content_{cross_name}")
-                + child.style[f"margin_{cross_start}"]
-                + child.style[f"margin_{cross_end}"]
+                getattr(child.layout, content_cross)
+                + child_margin[cross_start]
+                + child_margin[cross_end]
             )
             cross = max(cross, child_cross)
 
             min_child_cross = (
-                child.style[f"margin_{cross_start}"]
-                + getattr(child.layout, f"min_content_{cross_name}")
-                + child.style[f"margin_{cross_end}"]
+                child_margin[cross_start]
+                + getattr(child.layout, min_content_cross)
+                + child_margin[cross_end]
             )
             min_cross = max(min_cross, min_child_cross)
 
-        # self._debug(f"{self.direction.upper()} {min_cross=} {cross=}")
         if use_all_cross:
             cross = max(cross, available_cross)
-        # self._debug(f"FINAL {self.direction.upper()} {min_cross=} {cross=}")
 
         # Pass 4: Set cross-axis position of each child.
 
@@ -717,48 +1229,58 @@ class PackLogic(BaseStyle):
         # values. However, if the cross-axis is horizontal and text-direction RTL,
         # they're flipped. This is necessary because final positioning is always set
         # using a top-left origin, even if the "real" start is on the right.
-        effective_align_items = self.align_items
+        effective_align_items = style.align_items
 
-        if cross_start == RIGHT:
-            effective_cross_start = LEFT
-            effective_cross_end = RIGHT
+        if cross_start == _RIGHT:
+            effective_cross_start = _LEFT
+            effective_cross_end = _RIGHT
 
-            if self.align_items == START:
+            if style.align_items == START:
                 effective_align_items = END
-            elif self.align_items == END:
+            elif style.align_items == END:
                 effective_align_items = START
 
         else:
             effective_cross_start = cross_start
             effective_cross_end = cross_end
 
-        for child in node.children:
-            # self._debug(f"PASS 4: {child}")
+        content_effective_cross_start = _CONTENT_POSITION[effective_cross_start]
+
+        if run is not None:
+            positions = bulk.aligned(
+                cross,
+                cross_sizes,
+                cross_margins,
+                run_margin[cross_start],
+                effective_align_items,
+            )
+            for child, position in zip(children, positions, strict=True):
+                setattr(child.layout, content_effective_cross_start, position)
+            children_pass_4 = ()
+        else:
+            children_pass_4 = children
+
+        for child in children_pass_4:
+            child_margin = child.style._layout_style.margin
             extra = cross - (
-                getattr(child.layout, f"content_{cross_name}")
-                + child.style[f"margin_{effective_cross_start}"]
-                + child.style[f"margin_{effective_cross_end}"]
+                getattr(child.layout, content_cross)
+                + child_margin[effective_cross_start]
+                + child_margin[effective_cross_end]
             )
-            # self._debug(f"-  {self.direction} extra {cross_name} {extra}")
 
             if effective_align_items == END:
-                cross_start_value = extra + child.style[f"margin_{cross_start}"]
-                # self._debug(f"  align {child} to {cross_end}")
+                cross_start_value = extra + child_margin[cross_start]
 
             elif effective_align_items == CENTER:
-                cross_start_value = (
-                    int(extra / 2) + child.style[f"margin_{cross_start}"]
-                )
-                # self._debug(f"  align {child} to center")
+                cross_start_value = int(extra / 2) + child_margin[cross_start]
 
             else:
-                cross_start_value = child.style[f"margin_{cross_start}"]
-                # self._debug(f"  align {child} to {cross_start} ")
+                cross_start_value = child_margin[cross_start]
 
-            setattr(child.layout, f"content_{effective_cross_start}", cross_start_value)
-            # self._debug(f"  {getattr(child.layout, f'content_{cross_start}')=}")
+            setattr(child.layout, content_effective_cross_start, cross_start_value)
 
-        if self.direction == COLUMN:
+        if main_axis:
+            # A column; the main axis is vertical.
             return min_cross, cross, min_main, main
         else:
             return min_main, main, min_cross, cross
@@ -57,6 +57,8 @@ PACK = "pack"
 
 @dataclass(kw_only=True, repr=False)
 class Pack(PackLogic):
+    __slots__ = ()
+
     _doc_link = "[style properties](/reference/style/pack)"
 
     display: str = validated_property(PACK, NONE, initial=PACK)
@@ -67,9 +69,10 @@ class Pack(PackLogic):
     **Default value:** `"pack"`
 
     A value of `"pack"` will apply the pack layout algorithm to this node and its
-    descendants. A value of `"none"` removes the widget from the layout entirely. Space
-    will be allocated for the widget as if it were there, but the widget itself will
-    not be visible.
+    descendants. A value of `"none"` removes the widget from the layout entirely. No
+    space will be allocated for the widget, and neither the widget nor any of its
+    children will be visible. The widget and its children won't be laid out again
+    until the widget is displayed.
     """
     visibility: str = validated_property(VISIBLE, HIDDEN, initial=VISIBLE)
     """Defines whether the widget should be drawn.
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from abc import ABC
 from builtins import id as identifier
+from collections.abc import Iterator
+from contextlib import contextmanager
 from functools import cached_property
 from os import environ
 from typing import TYPE_CHECKING, Any, TypeVar
@@ -59,6 +61,14 @@ class Widget(Node, PackMixin, ABC):
     _USE_DEBUG_BACKGROUND = False
     _debug_color_index = 0
 
+    # The number of batch_update() contexts that are currently active, on any widget.
+    _active_batches = 0
+    # The depth of batch_update() contexts active on this widget.
+    _batch_depth = 0
+    # The widgets whose refresh has been deferred by toga.style.batch(), or None if no
+    # such batch is active.
+    _global_refreshes: dict[Widget, None] | None = None
+
     def __init__(
         self,
         id: str | None = None,
@@ -75,13 +85,16 @@ class Widget(Node, PackMixin, ABC):
         :param kwargs: Initial style properties.
         """
         if style is None:
-            style = Pack(**kwargs)
+            # Widgets created with the same style properties share a prototype, which
+            # is copied (without being validated again) when it is assigned.
+            style = Pack._prototype(**kwargs)
         elif kwargs:
             style = style.copy()
             style.update(**kwargs)
 
         if self._USE_DEBUG_BACKGROUND:
             if environ.get("TOGA_DEBUG_LAYOUT") == "1" or self.DEBUG_LAYOUT_ENABLED:
+                style = style.copy()
                 style.background_color = DEBUG_BACKGROUND_PALETTE[
                     Widget._debug_color_index
                 ]
@@ -204,6 +217,7 @@ class Widget(Node, PackMixin, ABC):
                 super().add(child)
 
                 self._impl.add_child(child._impl)
+                child.applicator._update_hidden()
                 added = True
 
         # Whatever layout we're a part of needs to be refreshed
@@ -239,6 +253,7 @@ class Widget(Node, PackMixin, ABC):
             super().insert(index, child)
 
             self._impl.insert_child(index, child._impl)
+            child.applicator._update_hidden()
 
             # Whatever layout we're a part of needs to be refreshed
             self.refresh()
@@ -252,10 +267,7 @@ class Widget(Node, PackMixin, ABC):
 
         :returns: Index of specified child widget in children list.
         """
-        for _ind, _child in enumerate(self._children):
-            if child == _child:
-                return _ind
-        raise ValueError(f"{type(child).__name__} not found")
+        return super().index(child)
 
     def replace(self, old_child: Widget, new_child: Widget) -> None:
         """Replace an existing child widget with a new child widget.
@@ -292,6 +304,7 @@ class Widget(Node, PackMixin, ABC):
                 child.app = None
 
                 self._impl.remove_child(child._impl)
+                child.applicator._update_hidden()
 
         # If we removed something, whatever layout we're a part of needs to be refreshed
         if removed:
@@ -311,8 +324,8 @@ class Widget(Node, PackMixin, ABC):
     def app(self) -> App | None:
         """The App to which this widget belongs.
 
-        When setting the app for a widget, all children of this widget will be
-        recursively assigned to the same app.
+        When setting the app for a widget, all descendants of this widget will be
+        assigned to the same app.
 
         :raises ValueError: If this widget is already associated with another app.
         """
@@ -320,23 +333,33 @@ class Widget(Node, PackMixin, ABC):
 
     @app.setter
     def app(self, app: App | None) -> None:
-        # If the widget is already assigned to an app
-        if self._app:
-            if self._app == app:
-                # If app is the same as the previous app, return
-                return
-
-        self._app = app
-        self._impl.set_app(app)
-        for child in self.children:
-            child.app = app
+        # The descendants are assigned with an explicit stack, rather than recursion,
+        # so that arbitrarily deep trees can be handled. They are visited in the same
+        # order as a recursive traversal.
+        stack = [self]
+        while stack:
+            widget = stack.pop()
+            if widget is not self and type(widget).app is not Widget.app:
+                # The widget customizes the assignment (for example, to assign its
+                # content as well), so it's assigned with its own setter.
+                widget.app = app
+                continue
+
+            # If the widget is already assigned to the app (or to no app), so are its
+            # descendants.
+            if widget._app == app:
+                continue
+
+            widget._app = app
+            widget._impl.set_app(app)
+            stack.extend(reversed(widget.children))
 
     @property
     def window(self) -> Window | None:
         """The window to which this widget belongs.
 
-        When setting the window for a widget, all children of this widget will be
-        recursively assigned to the same window.
+        When setting the window for a widget, all descendants of this widget will be
+        assigned to the same window.
 
         If the widget has a value for [`window`][toga.Widget.window], it *must* also
         have a value for [`app`][toga.Widget.app].
@@ -345,20 +368,37 @@ class Widget(Node, PackMixin, ABC):
 
     @window.setter
     def window(self, window: Window | None) -> None:
-        if self.window is not None and window is None:
-            # If the widget is currently in the registry, but is being removed from a
-            # window, remove the widget from the widget registry
-            self.window.app.widgets._remove(self.id)
-        elif self.window is None and window is not None:
-            # If the widget is being assigned to a window for the first time, add it to
-            # the widget registry
-            window.app.widgets._add(self)
-
-        self._window = window
-        self._impl.set_window(window)
-
-        for child in self.children:
-            child.window = window
+        # The descendants are assigned with an explicit stack, rather than recursion,
+        # so that arbitrarily deep trees can be handled. They are visited in the same
+        # order as a recursive traversal.
+        stack = [self]
+        while stack:
+            widget = stack.pop()
+            if widget is not self and type(widget).window is not Widget.window:
+                # The widget customizes the assignment (for example, to assign its
+                # content as well), so it's assigned with its own setter.
+                widget.window = window
+                continue
+
+            if widget.window is None and window is None:
+                # The widget isn't in a window, so neither are its descendants.
+                continue
+            elif widget.window is not None and window is None:
+                # If the widget is currently in the registry, but is being removed
+                # from a window, remove the widget from the widget registry
+                widget.window.app.widgets._remove(widget.id)
+            elif widget.window is None and window is not None:
+                # If the widget is being assigned to a window for the first time, add
+                # it to the widget registry
+                window.app.widgets._add(widget)
+
+            widget._window = window
+            widget._impl.set_window(window)
+            # The widget is being attached to (or detached from) its native parent, so
+            # its bounds will need to be applied again.
+            widget.applicator.reset_bounds()
+
+            stack.extend(reversed(widget.children))
 
     @property
     def enabled(self) -> bool:
@@ -371,6 +411,19 @@ class Widget(Node, PackMixin, ABC):
         self._impl.set_enabled(bool(value))
 
     def refresh(self) -> None:
+        """Refresh the layout of the widget tree that contains this widget.
+
+        While the app's event loop is running, the layout is usually computed on the
+        next iteration of the event loop, so that any number of changes only cause a
+        single layout; until then, the `layout` of the widget reflects the previous
+        layout. Call [`App.flush_layout()`][toga.App.flush_layout] to apply the new
+        layout immediately.
+        """
+        if (deferred := self._deferred_refreshes()) is not None:
+            # Defer the refresh until the batch is complete.
+            deferred[self] = None
+            return
+
         self._impl.refresh()
 
         # Refresh the layout
@@ -378,11 +431,107 @@ class Widget(Node, PackMixin, ABC):
             # We're not the root of the node hierarchy;
             # defer the refresh call to the root node.
             self._root.refresh()
+        elif (container := self._impl.container) and self._app:
+            # If the container has been resized, the layout must be updated before
+            # the container is redrawn; otherwise, the refresh can be coalesced with
+            # any other changes made in the same iteration of the event loop.
+            args = self.layout._layout_args
+            if (
+                args is None
+                or args[:2] != (container.width, container.height)
+                or not self._app._schedule_layout(self)
+            ):
+                self._app._pending_layouts.pop(self, None)
+                self._refresh_layout()
         else:
-            # We can't compute a layout until we have a container
-            if self._impl.container:
-                super().refresh(self._impl.container)
-                self._impl.container.refreshed()
+            self._refresh_layout()
+
+    def _refresh_layout(self) -> None:
+        """Lay out the widget tree of which this widget is the root, and apply the
+        layout to the container."""
+        # We can't compute a layout until we have a container; and if the widget
+        # has been reparented since the refresh was requested, the new root will
+        # have been refreshed instead.
+        if self._impl.container and not self._root:
+            super().refresh(self._impl.container)
+            self._impl.container.refreshed()
+
+    def _deferred_refreshes(self) -> dict[Widget, None] | None:
+        """The refreshes deferred by the batch that encloses this widget, or None if
+        refreshes of this widget aren't being deferred."""
+        if Widget._active_batches and (batch := self._enclosing_batch()):
+            return batch._batched_refreshes
+        return Widget._global_refreshes
+
+    def _enclosing_batch(self) -> Widget | None:
+        """The closest widget (this one or an ancestor) that is batching updates."""
+        widget = self
+        while widget is not None:
+            if widget._batch_depth:
+                return widget
+            widget = widget.parent
+        return None
+
+    @contextmanager
+    def batch_update(self) -> Iterator[None]:
+        """Defer refreshing the layout until the end of a batch of changes.
+
+        Adding, inserting, removing or restyling widgets normally triggers a refresh of
+        the layout of the whole window. Inside a `with widget.batch_update():` block,
+        any refresh of this widget or one of its descendants is deferred until the
+        block exits. Each widget that requested a refresh is then refreshed once, and
+        the layout of the window is computed and applied exactly once.
+
+        Batches can be nested; refreshes are deferred until the outermost batch exits.
+        """
+        if not self._batch_depth:
+            self._batched_refreshes: dict[Widget, None] = {}
+        self._batch_depth += 1
+        Widget._active_batches += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            Widget._active_batches -= 1
+            if not self._batch_depth:
+                self._flush_batch()
+
+    def _flush_batch(self) -> None:
+        pending = self._batched_refreshes
+        del self._batched_refreshes
+        Widget._refresh_batched(pending)
+
+    @classmethod
+    @contextmanager
+    def _batch_all_updates(cls) -> Iterator[None]:
+        """Defer refreshing the layout of every widget until the end of a batch; see
+        [`toga.style.batch()`][toga.style.batch]."""
+        if batch_entered := Widget._global_refreshes is None:
+            Widget._global_refreshes = {}
+        try:
+            yield
+        finally:
+            if batch_entered:
+                pending = Widget._global_refreshes
+                Widget._global_refreshes = None
+                Widget._refresh_batched(pending)
+
+    @staticmethod
+    def _refresh_batched(pending: dict[Widget, None]) -> None:
+        roots = {}
+        for widget in pending:
+            if (deferred := widget._deferred_refreshes()) is not None:
+                # The widget is still inside another batch; defer to that batch.
+                deferred[widget] = None
+            elif widget._root:
+                widget._impl.refresh()
+                roots[widget._root] = None
+            else:
+                roots[widget] = None
+
+        # Refreshing each root lays out the whole tree it contains.
+        for root in roots:
+            root.refresh()
 
     def focus(self) -> None:
         """Give this widget the input focus.
@@ -6,6 +6,7 @@ from toga.handlers import wrapped_handler
 from toga.types import Position
 
 from .base import StyleT, Widget
+from .virtualbox import VirtualBox
 
 if TYPE_CHECKING:
     from toga.types import PositionT
@@ -105,6 +106,13 @@ class ScrollContainer(Widget):
             # Clear the window before the app so that registry entries can be cleared
             self._content.window = None
             self._content.app = None
+            if isinstance(self._content, VirtualBox):
+                self._content._scroll_container = None
+
+        if isinstance(widget, VirtualBox):
+            # A VirtualBox materializes the rows that are visible in this container;
+            # this must be known before it is added to the window.
+            widget._scroll_container = self
 
         if widget:
             widget.app = self.app
@@ -146,7 +154,18 @@ class ScrollContainer(Widget):
 
     @on_scroll.setter
     def on_scroll(self, on_scroll: OnScrollHandler) -> None:
-        self._on_scroll = wrapped_handler(self, on_scroll)
+        handler = wrapped_handler(self, on_scroll)
+
+        def _on_scroll(*args: object, **kwargs: object) -> object:
+            # If the content is a VirtualBox, the rows that are visible may have
+            # changed. They're updated before the handler is invoked, so that they
+            # don't depend on the handler succeeding, or completing.
+            if isinstance(self._content, VirtualBox):
+                self._content._update_rows()
+            return handler(*args, **kwargs)
+
+        _on_scroll._raw = getattr(handler, "_raw", on_scroll)
+        self._on_scroll = _on_scroll
 
     @property
     def max_horizontal_position(self) -> int:
@@ -0,0 +1,325 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Callable
+from math import inf
+
+from toga.style.pack import COLUMN, NONE, PACK
+
+from .base import StyleT, Widget
+from .box import Box
+
+
+class _RowHeights:
+    """The measured heights of the rows of a VirtualBox.
+
+    The heights are stored in a Fenwick tree, along with the number of rows that have
+    been measured, so that the total height of the rows before any row can be found,
+    and a measured height can be changed, without visiting every row.
+    """
+
+    def __init__(self, heights: list[int | None]):
+        self._heights = heights
+        self.measured_total = 0
+        self.measured_count = 0
+
+        # The trees are 1-indexed; each node holds the sum of a range of rows that
+        # ends at its index.
+        size = len(heights)
+        self._totals = [0] * (size + 1)
+        self._counts = [0] * (size + 1)
+        for index, height in enumerate(heights, start=1):
+            if height is not None:
+                self._totals[index] += height
+                self._counts[index] += 1
+                self.measured_total += height
+                self.measured_count += 1
+            if (parent := index + (index & -index)) <= size:
+                self._totals[parent] += self._totals[index]
+                self._counts[parent] += self._counts[index]
+
+    def __len__(self) -> int:
+        return len(self._heights)
+
+    def __getitem__(self, index: int) -> int | None:
+        return self._heights[index]
+
+    def __setitem__(self, index: int, height: int) -> None:
+        previous = self._heights[index]
+        if height == previous:
+            return
+
+        self._heights[index] = height
+        delta = height - (previous or 0)
+        count = previous is None
+        self.measured_total += delta
+        self.measured_count += count
+
+        index += 1
+        while index < len(self._totals):
+            self._totals[index] += delta
+            self._counts[index] += count
+            index += index & -index
+
+    def resized(self, row_count: int) -> _RowHeights:
+        """Get the heights of a different number of rows, keeping the heights of the
+        rows that still exist."""
+        heights = self._heights[:row_count]
+        heights.extend([None] * (row_count - len(heights)))
+        return _RowHeights(heights)
+
+    def before(self, index: int) -> tuple[int, int]:
+        """Get the total height, and the number, of the measured rows before a row."""
+        total = count = 0
+        while index > 0:
+            total += self._totals[index]
+            count += self._counts[index]
+            index -= index & -index
+        return total, count
+
+
+class VirtualBox(Box):
+    # The row factory is only assigned once the box has been created, so that no
+    # rows are materialized while the box is being constructed.
+    _row_factory = None
+    # The scroll container that this box is the content of, if any.
+    _scroll_container = None
+
+    def __init__(
+        self,
+        id: str | None = None,
+        style: StyleT | None = None,
+        row_count: int = 0,
+        row_factory: Callable[[int], Widget] | None = None,
+        estimated_row_height: int = 40,
+        overscan: int = 200,
+        **kwargs,
+    ):
+        """Create a new VirtualBox container widget.
+
+        :param id: The ID for the widget.
+        :param style: A style object. If no style is provided, a default style
+            will be applied to the widget.
+        :param row_count: The number of rows in the box.
+        :param row_factory: A callable that creates the widget for a row, given the
+            index of the row.
+        :param estimated_row_height: The height, in CSS pixels, assumed for rows that
+            haven't been laid out yet.
+        :param overscan: The distance, in CSS pixels, beyond each edge of the visible
+            region of the scroll container for which rows are materialized.
+        :param kwargs: Initial style properties. The rows of a VirtualBox are always
+            laid out in a column, so `direction` can only be `COLUMN`.
+        :raises ValueError: If a direction other than `COLUMN` is provided.
+        """
+        super().__init__(id=id, style=style, **kwargs)
+        # The rows are always laid out in a column.
+        if "direction" in self.style and self.style.direction != COLUMN:
+            raise ValueError("The rows of a VirtualBox are always laid out in a column")
+        self.style.direction = COLUMN
+
+        self.estimated_row_height = estimated_row_height
+        self.overscan = overscan
+
+        # The rows that currently exist, by index, in the order they were created.
+        self._rows: dict[int, Widget] = {}
+        # The measured height of each row (including its margins), or None if the
+        # row hasn't been laid out.
+        self._heights = _RowHeights([None] * row_count)
+
+        # Spacers take the place of the rows before and after the materialized rows.
+        self._spacers = (Box(display=NONE), Box(display=NONE))
+        Widget.add(self, *self._spacers)
+
+        self._row_factory = row_factory
+
+    @property
+    def row_count(self) -> int:
+        """The number of rows in the box."""
+        return len(self._heights)
+
+    @row_count.setter
+    def row_count(self, row_count: int) -> None:
+        row_count = int(row_count)
+        if row_count < 0:
+            raise ValueError("Row count cannot be negative")
+
+        self._heights = self._heights.resized(row_count)
+        self.refresh()
+
+    @property
+    def row_factory(self) -> Callable[[int], Widget] | None:
+        """The callable used to create the widget for a row, given the index of the row.
+
+        Setting a new row factory discards every existing row.
+        """
+        return self._row_factory
+
+    @row_factory.setter
+    def row_factory(self, row_factory: Callable[[int], Widget] | None) -> None:
+        with self.batch_update():
+            Widget.remove(self, *self._rows.values())
+            self._rows = {}
+            self._heights = _RowHeights([None] * len(self._heights))
+            self._row_factory = row_factory
+            if row_factory is None:
+                for spacer in self._spacers:
+                    self._set_spacer(spacer, 0, 0)
+            self.refresh()
+
+    @property
+    def materialized_rows(self) -> dict[int, Widget]:
+        """The rows that currently exist, as a dictionary mapping the index of each row
+        to its widget (read-only)."""
+        return dict(sorted(self._rows.items()))
+
+    def add(self, *children: Widget) -> None:
+        """The children of a VirtualBox are created by its row factory; they can't be
+        added directly.
+
+        :raises ValueError: Always.
+        """
+        raise ValueError("Children cannot be added to a VirtualBox")
+
+    def insert(self, index: int, child: Widget) -> None:
+        """The children of a VirtualBox are created by its row factory; they can't be
+        inserted directly.
+
+        :raises ValueError: Always.
+        """
+        raise ValueError("Children cannot be inserted into a VirtualBox")
+
+    def remove(self, *children: Widget) -> None:
+        """The children of a VirtualBox are created by its row factory; they can't be
+        removed directly.
+
+        :raises ValueError: Always.
+        """
+        raise ValueError("Children cannot be removed from a VirtualBox")
+
+    @Widget.window.setter
+    def window(self, window) -> None:
+        # Invoke the superclass property setter
+        Widget.window.fset(self, window)
+
+        # Materialize the rows that are visible in the new window.
+        self._update_rows()
+
+    def refresh(self) -> None:
+        # Within a batch, the rows are updated when the deferred refresh is performed.
+        # Otherwise, if the rows have changed, the layout has already been refreshed.
+        if self._deferred_refreshes() is not None or not self._update_rows():
+            super().refresh()
+
+    def _update_rows(self) -> bool:
+        """Materialize the rows that intersect the visible region of the scroll
+        container (plus the overscan), and discard all other rows.
+
+        Rows are only materialized while the box is in a window. If the box isn't the
+        content of a scroll container, every row is materialized.
+
+        :returns: True if any rows or spacers changed, in which case the layout has
+            been refreshed.
+        """
+        if self._row_factory is None or self.window is None:
+            return False
+
+        # Laying out new rows gives a better estimate of the height of the rows that
+        # haven't been laid out, which may change the rows that are visible; repeat
+        # until the rows are stable. Each repeat either measures more rows, or
+        # changes nothing.
+        changed = False
+        while self._materialize_rows():
+            changed = True
+
+        # If the layout has been deferred to the event loop, the new rows can only be
+        # measured once the layout has been refreshed.
+        if changed and self.app and self.app.loop.is_running():
+            self.app.loop.call_soon(self._update_rows)
+
+        return changed
+
+    def _materialize_rows(self) -> bool:
+        """Perform a single update of the materialized rows.
+
+        :returns: True if any rows or spacers changed.
+        """
+
+        # Remember the height of every row that has been laid out (unless it no
+        # longer exists).
+        heights = self._heights
+        for index, row in self._rows.items():
+            if index < len(heights) and not row.layout._dirty:
+                heights[index] = (
+                    row.style.margin_top
+                    + row.layout.content_height
+                    + row.style.margin_bottom
+                )
+
+        # Rows that haven't been laid out are assumed to have the average height of
+        # those that have.
+        if heights.measured_count:
+            estimate = heights.measured_total / heights.measured_count
+        else:
+            estimate = self.estimated_row_height
+
+        if (scroll_container := self._scroll_container) is None:
+            top, bottom = -inf, inf
+        else:
+            position = scroll_container.vertical_position
+            top = position - self.overscan
+            bottom = position + scroll_container.layout.content_height + self.overscan
+
+        gap = self.style.gap
+
+        def offset(index):
+            # The extent of the rows before a row, including the gap after each row.
+            total, count = heights.before(index)
+            return total + (index - count) * estimate + index * gap
+
+        # Find the rows that intersect the region: the first is the row after the
+        # last row that ends above the region, and the last is the row before the
+        # first row that starts below it.
+        row_count = len(heights)
+        first = bisect_right(
+            range(1, row_count + 1), top, key=lambda index: offset(index) - gap
+        )
+        last = max(first, bisect_left(range(row_count), bottom, key=offset))
+        before = offset(first)
+        after = offset(row_count) - offset(last)
+
+        changed = False
+        with self.batch_update():
+            for index in [index for index in self._rows if not first <= index < last]:
+                Widget.remove(self, self._rows.pop(index))
+                changed = True
+
+            # The rows that remain are contiguous, so each new row can be inserted
+            # directly after its predecessor (or the first spacer).
+            for index in range(first, last):
+                if index not in self._rows:
+                    row = self._rows[index] = self._row_factory(index)
+                    Widget.insert(self, index - first + 1, row)
+                    changed = True
+
+            changed |= self._set_spacer(self._spacers[0], first, before)
+            changed |= self._set_spacer(self._spacers[1], self.row_count - last, after)
+
+        return changed
+
+    def _set_spacer(self, spacer: Box, rows: int, extent: float) -> bool:
+        """Size a spacer to take the place of some rows.
+
+        :returns: True if the spacer changed.
+        """
+        # A spacer that takes the place of no rows isn't displayed, so that no gap
+        # is left for it. Otherwise, the gap between the spacer and the adjacent row
+        # takes the place of the gap after the last of the rows it replaces.
+        if rows:
+            display, height = PACK, max(0, round(extent - self.style.gap))
+        else:
+            display, height = NONE, spacer.style.height
+
+        if (spacer.style.display, spacer.style.height) == (display, height):
+            return False
+        spacer.style.update(display=display, height=height)
+        return True
@@ -0,0 +1,203 @@
+from itertools import product
+from unittest.mock import Mock
+
+import pytest
+
+from toga.style import bulk
+from toga.style.pack import CENTER, COLUMN, END, LTR, ROW, RTL, START, Pack
+
+from ..utils import ExampleNode, ExampleViewport
+
+
+@pytest.fixture(params=["numpy", "stdlib"])
+def backend(request, monkeypatch):
+    """Perform the bulk arithmetic with NumPy, or with the standard library."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(bulk, "_numpy", lambda: None)
+
+
+def make_tree(gap, margin, flex):
+    # The run is the second of three flexible siblings, so it is allocated a
+    # fractional size.
+    run = ExampleNode(
+        "run",
+        style=Pack(gap=gap),
+        children=[
+            ExampleNode(f"child-{i}", style=Pack(flex=flex, margin=margin))
+            for i in range(100)
+        ],
+    )
+    return ExampleNode(
+        "root",
+        style=Pack(),
+        children=[
+            ExampleNode("before", style=Pack(flex=1)),
+            run,
+            ExampleNode("after", style=Pack(flex=1)),
+        ],
+    )
+
+
+def restyle(tree, direction, text_direction, justify_content, align_items):
+    tree.style.update(direction=direction, text_direction=text_direction)
+    run = tree.children[1]
+    run.style.update(
+        direction=direction,
+        text_direction=text_direction,
+        justify_content=justify_content,
+        align_items=align_items,
+    )
+    # Children with different cross-axis sizes are aligned differently.
+    for i, child in enumerate(run.children):
+        if direction == ROW:
+            child.intrinsic.width, child.intrinsic.height = None, i % 7
+        else:
+            child.intrinsic.width, child.intrinsic.height = i % 7, None
+
+
+def layouts(node):
+    """The layout of every node in a tree, including the type of each value."""
+    values = [
+        node.layout.content_top,
+        node.layout.content_left,
+        node.layout.content_width,
+        node.layout.content_height,
+        node.layout.min_content_width,
+        node.layout.min_content_height,
+    ]
+    result = [(node.name, [(value, type(value)) for value in values])]
+    for child in node.children:
+        result.extend(layouts(child))
+    return result
+
+
+@pytest.mark.parametrize(
+    "gap, margin, flex, size",
+    [
+        (0, 0, 1, (10000, 10000)),
+        (3, (1, 2, 3, 4), 1, (10000, 10000)),
+        (3, (1, 2, 3, 4), 0.3, (9999, 7777)),
+        # Not enough space for the margins of every child.
+        (2, 5, 2, (500, 500)),
+    ],
+)
+def test_equivalence(monkeypatch, backend, gap, margin, flex, size):
+    """A run of children laid out in bulk has exactly the same layout as when it is
+    laid out child by child."""
+    viewport = ExampleViewport(*size)
+    bulk_tree = make_tree(gap, margin, flex)
+    scalar_tree = make_tree(gap, margin, flex)
+
+    for direction, text_direction, justify_content, align_items in product(
+        [ROW, COLUMN], [LTR, RTL], [START, CENTER, END], [START, CENTER, END]
+    ):
+        restyle(bulk_tree, direction, text_direction, justify_content, align_items)
+        bulk_tree.style.layout(viewport)
+
+        with monkeypatch.context() as m:
+            m.setattr(bulk, "MIN_CHILDREN", 1000)
+            restyle(
+                scalar_tree, direction, text_direction, justify_content, align_items
+            )
+            scalar_tree.style.layout(viewport)
+
+        assert layouts(bulk_tree) == layouts(scalar_tree), (
+            direction,
+            text_direction,
+            justify_content,
+            align_items,
+        )
+
+
+def test_run(monkeypatch):
+    """Only a long run of identically styled flexible children is laid out in bulk."""
+    monkeypatch.setattr(bulk, "MIN_CHILDREN", 4)
+
+    def run(count=5, **styles):
+        children = [ExampleNode(f"child-{i}", style=Pack(flex=1)) for i in range(count)]
+        for name, value in styles.items():
+            setattr(children[2].style, name, value)
+        parent = ExampleNode("parent", style=Pack(direction=ROW), children=children)
+        return parent.style._flex_run(children)
+
+    assert run() == (1, (0, 0, 0, 0))
+    # A child's style along the cross axis doesn't matter.
+    assert run(height=10, direction=COLUMN) == (1, (0, 0, 0, 0))
+
+    # All the children must have the same flex and margins, and no main-axis size.
+    assert run(flex=2) is None
+    assert run(margin_left=1) is None
+    assert run(width=10) is None
+    # There must be enough children.
+    assert run(count=3) is None
+
+    # Children that aren't flexible aren't laid out in bulk...
+    parent = ExampleNode(
+        "parent",
+        style=Pack(),
+        children=[ExampleNode(f"child-{i}", style=Pack()) for i in range(5)],
+    )
+    assert parent.style._flex_run(parent.children) is None
+
+    # ... nor are children with an intrinsic main-axis size.
+    children = [ExampleNode(f"child-{i}", style=Pack(flex=1)) for i in range(5)]
+    children[2].intrinsic.width = 10
+    parent = ExampleNode("parent", style=Pack(direction=ROW), children=children)
+    assert parent.style._flex_run(children) is None
+
+
+def test_lazy_import(monkeypatch):
+    """NumPy isn't imported until a run is long enough to be laid out in bulk."""
+    numpy = Mock(return_value=None)
+    monkeypatch.setattr(bulk, "_numpy", numpy)
+    viewport = ExampleViewport(1000, 1000)
+
+    def layout(count):
+        parent = ExampleNode(
+            "parent",
+            style=Pack(direction=ROW),
+            children=[
+                ExampleNode(f"child-{i}", style=Pack(flex=1)) for i in range(count)
+            ],
+        )
+        parent.style.layout(viewport)
+
+    layout(bulk.MIN_CHILDREN - 1)
+    numpy.assert_not_called()
+
+    layout(bulk.MIN_CHILDREN)
+    numpy.assert_called()
+
+
+@pytest.mark.parametrize(
+    "function, args",
+    [
+        (bulk.repeated_sum, (0.5, 0.1, 100)),
+        (bulk.repeated_sum, (3, 7, 100)),
+        (bulk.offsets, (0, 100, 3, 4, (5,) * 100)),
+        (bulk.offsets, (0.25, 100, 0.1, tuple(i / 3 for i in range(100)))),
+        (bulk.subtract_from, (1000, [i / 3 for i in range(100)])),
+        (bulk.aligned, (1000, list(range(100)), 7, 3, END)),
+        (bulk.aligned, (1000, list(range(100)), 7, 3, CENTER)),
+        (bulk.aligned, (999.5, list(range(100)), 7, 3, CENTER)),
+        (bulk.aligned, (1000, list(range(100)), 7, 3, START)),
+    ],
+)
+def test_numpy_results(monkeypatch, function, args):
+    """The bulk arithmetic has exactly the same results with NumPy as with the
+    standard library."""
+    pytest.importorskip("numpy")
+    numpy_result = function(*args)
+
+    monkeypatch.setattr(bulk, "_numpy", lambda: None)
+    stdlib_result = function(*args)
+
+    assert numpy_result == stdlib_result
+    if isinstance(numpy_result, list):
+        assert [type(value) for value in numpy_result] == [
+            type(value) for value in stdlib_result
+        ]
+    else:
+        assert type(numpy_result) is type(stdlib_result)
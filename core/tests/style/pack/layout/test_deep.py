@@ -0,0 +1,37 @@
+import sys
+
+from travertino.size import at_least
+
+from toga.style.pack import COLUMN, Pack
+
+from ..utils import ExampleNode, ExampleViewport
+
+
+def test_deep_tree():
+    """A tree that is much deeper than Python's recursion limit can be laid out, and
+    have its bounds and visibility applied."""
+    depth = sys.getrecursionlimit()
+
+    leaf = ExampleNode("leaf", style=Pack(), size=(at_least(10), 10))
+    node = leaf
+    for i in range(depth):
+        node = ExampleNode(
+            f"box {i}", style=Pack(direction=COLUMN, margin_left=1), children=[node]
+        )
+    root = node
+
+    root.style.layout(ExampleViewport(640 + depth, 480))
+
+    assert leaf.root is root
+    assert leaf.layout.absolute_content_left == depth
+    assert leaf.layout.content_width == 640
+
+    root.applicator.set_bounds()
+    leaf._impl.set_bounds.assert_called_once_with(depth, 0, 640, 10)
+
+    root.applicator.set_hidden(True)
+    leaf._impl.set_hidden.assert_called_with(True)
+
+    # The tree can be taken apart again.
+    root.remove(root.children[0])
+    assert leaf.root is not root
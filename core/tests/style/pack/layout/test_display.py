@@ -0,0 +1,74 @@
+from travertino.size import at_least
+
+from toga.style.pack import COLUMN, NONE, PACK, ROW, Pack
+
+from ..utils import ExampleNode, ExampleViewport, assert_layout
+
+
+def test_display_none():
+    """A node that isn't displayed takes up no space in the layout."""
+    viewport = ExampleViewport(640, 480)
+    root = ExampleNode(
+        "app",
+        style=Pack(direction=ROW, gap=10),
+        children=[
+            ExampleNode("first", style=Pack(width=100), size=(at_least(0), 50)),
+            ExampleNode(
+                "hidden",
+                style=Pack(display=NONE, flex=1, margin=5),
+                children=[
+                    ExampleNode("hidden child", style=Pack(), size=(200, 200)),
+                ],
+            ),
+            ExampleNode("flexible", style=Pack(flex=1), size=(at_least(0), 50)),
+        ],
+    )
+    root.style.layout(viewport)
+
+    first, hidden, flexible = root.children
+    # Only one gap is allocated, between the two displayed children.
+    assert (first.layout.absolute_content_left, first.layout.content_width) == (0, 100)
+    assert (flexible.layout.absolute_content_left, flexible.layout.content_width) == (
+        110,
+        530,
+    )
+    # The size of the hidden child doesn't contribute to the minimum size.
+    assert (root.layout.min_width, root.layout.min_height) == (110, 50)
+
+    # Once displayed, the child is laid out.
+    hidden.style.display = PACK
+    root.style.layout(viewport)
+    assert_layout(
+        root,
+        (330, 210),
+        (640, 480),
+        {
+            "origin": (0, 0),
+            "content": (640, 480),
+            "children": [
+                {"origin": (0, 0), "content": (100, 50)},
+                {
+                    "origin": (115, 5),
+                    "content": (245, 470),
+                    "children": [{"origin": (115, 5), "content": (200, 200)}],
+                },
+                {"origin": (375, 0), "content": (255, 50)},
+            ],
+        },
+    )
+
+
+def test_no_displayed_children():
+    """A node whose children aren't displayed is laid out as if it has no children."""
+    viewport = ExampleViewport(640, 480)
+    root = ExampleNode(
+        "app",
+        style=Pack(direction=COLUMN),
+        children=[
+            ExampleNode("hidden", style=Pack(display=NONE), size=(100, 100)),
+        ],
+    )
+    root.style.layout(viewport)
+
+    assert (root.layout.min_width, root.layout.min_height) == (0, 0)
+    assert (root.layout.content_width, root.layout.content_height) == (640, 480)
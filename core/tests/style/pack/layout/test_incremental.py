@@ -0,0 +1,263 @@
+import pytest
+from travertino.size import at_least
+
+from toga.style.layout import PackLogic
+from toga.style.pack import COLUMN, NONE, PACK, ROW, Pack
+
+from ..utils import ExampleNode, ExampleViewport
+
+
+@pytest.fixture
+def laid_out(monkeypatch):
+    """Record the name of every node that is laid out."""
+    names = []
+    layout_node = PackLogic._layout_node
+
+    def _layout_node(self, *args, **kwargs):
+        names.append(self._applicator.node.name)
+        return layout_node(self, *args, **kwargs)
+
+    monkeypatch.setattr(PackLogic, "_layout_node", _layout_node)
+    return names
+
+
+def build_tree(panel_style=None, leaf_size=None):
+    return ExampleNode(
+        "root",
+        style=Pack(direction=COLUMN),
+        children=[
+            ExampleNode(
+                "panel",
+                style=panel_style or Pack(direction=ROW),
+                children=[
+                    ExampleNode(
+                        "leaf", style=Pack(), size=leaf_size or (at_least(10), 10)
+                    ),
+                    ExampleNode("sibling", style=Pack(), size=(at_least(20), 20)),
+                ],
+            ),
+            ExampleNode(
+                "other",
+                style=Pack(direction=ROW),
+                children=[
+                    ExampleNode("other leaf", style=Pack(), size=(30, 30)),
+                ],
+            ),
+        ],
+    )
+
+
+def geometry(node):
+    """The full computed geometry of a node and all its descendants."""
+    return (
+        node.name,
+        node.layout.absolute_content_left,
+        node.layout.absolute_content_top,
+        node.layout.content_width,
+        node.layout.content_height,
+        node.layout.min_content_width,
+        node.layout.min_content_height,
+        [geometry(child) for child in node.children],
+    )
+
+
+def find(node, name):
+    if node.name == name:
+        return node
+    for child in node.children:
+        if result := find(child, name):
+            return result
+
+
+def test_clean_tree(laid_out):
+    """If nothing has changed, laying out again is a no-op."""
+    root = build_tree()
+    root.style.layout(ExampleViewport(640, 480))
+    assert len(laid_out) == 6
+
+    laid_out.clear()
+    root.style.layout(ExampleViewport(640, 480))
+    assert laid_out == []
+
+
+def test_viewport_change(laid_out):
+    """If the viewport changes, the whole tree is laid out again."""
+    root = build_tree()
+    root.style.layout(ExampleViewport(640, 480))
+
+    laid_out.clear()
+    root.style.layout(ExampleViewport(800, 600))
+    # The leaves have a fixed or non-flexible intrinsic size, so their allocation
+    # hasn't changed in any way that affects their layout.
+    assert laid_out == ["root", "panel", "other"]
+
+    expected = build_tree()
+    expected.style.layout(ExampleViewport(800, 600))
+    assert geometry(root) == geometry(expected)
+
+
+def test_propagation_stops(laid_out):
+    """If a change doesn't alter the size of a subtree, its ancestors aren't laid out
+    again."""
+    root = build_tree(panel_style=Pack(direction=ROW, width=200, height=100))
+    root.style.layout(ExampleViewport(640, 480))
+
+    laid_out.clear()
+    find(root, "leaf").intrinsic.width = at_least(50)
+    root.style.layout(ExampleViewport(640, 480))
+
+    # Only the fixed-size panel and the leaf were laid out again.
+    assert laid_out == ["panel", "leaf"]
+
+    expected = build_tree(
+        panel_style=Pack(direction=ROW, width=200, height=100),
+        leaf_size=(at_least(50), 10),
+    )
+    expected.style.layout(ExampleViewport(640, 480))
+    assert geometry(root) == geometry(expected)
+
+
+def test_propagation_to_root(laid_out):
+    """If a change alters the size of a subtree, its ancestors are laid out again."""
+    root = build_tree()
+    root.style.layout(ExampleViewport(640, 480))
+
+    laid_out.clear()
+    find(root, "leaf").intrinsic.height = 50
+    root.style.layout(ExampleViewport(640, 480))
+    # The allocation of the second child of the root has changed, but the layout of
+    # its fixed-size leaf has been reused.
+    assert laid_out == ["panel", "leaf", "root", "other"]
+
+    expected = build_tree(leaf_size=(at_least(10), 50))
+    expected.style.layout(ExampleViewport(640, 480))
+    assert geometry(root) == geometry(expected)
+
+
+def test_style_change(laid_out):
+    """A change in the style of a node lays out its parent again."""
+    root = build_tree(panel_style=Pack(direction=ROW, width=200, height=100))
+    root.style.layout(ExampleViewport(640, 480))
+
+    laid_out.clear()
+    find(root, "sibling").style.margin_left = 15
+    root.style.layout(ExampleViewport(640, 480))
+    assert laid_out == ["panel", "sibling"]
+
+    expected = build_tree(panel_style=Pack(direction=ROW, width=200, height=100))
+    find(expected, "sibling").style.margin_left = 15
+    expected.style.layout(ExampleViewport(640, 480))
+    assert geometry(root) == geometry(expected)
+
+
+def test_add_child(laid_out):
+    """A newly added child is laid out and positioned."""
+    root = build_tree(panel_style=Pack(direction=ROW, width=200, height=100))
+    root.style.layout(ExampleViewport(640, 480))
+    # Move the panel, so the new child's absolute position is non-trivial.
+    root.style.margin = 7
+    root.style.layout(ExampleViewport(640, 480))
+
+    laid_out.clear()
+    find(root, "panel").add(ExampleNode("new", style=Pack(), size=(5, 5)))
+    root.style.layout(ExampleViewport(640, 480))
+    assert laid_out == ["panel", "new"]
+
+    expected = build_tree(panel_style=Pack(direction=ROW, width=200, height=100))
+    expected.style.margin = 7
+    find(expected, "panel").add(ExampleNode("new", style=Pack(), size=(5, 5)))
+    expected.style.layout(ExampleViewport(640, 480))
+    assert geometry(root) == geometry(expected)
+
+
+def test_remove_child(laid_out):
+    """Removing a child lays out its former parent again."""
+    root = build_tree()
+    root.style.layout(ExampleViewport(640, 480))
+
+    laid_out.clear()
+    other = find(root, "other")
+    other.remove(find(root, "other leaf"))
+    root.style.layout(ExampleViewport(640, 480))
+    # The minimum size of the former parent has changed, so the root is laid out
+    # again as well.
+    assert laid_out == ["other", "root"]
+
+    expected = build_tree()
+    find(expected, "other").remove(find(expected, "other leaf"))
+    expected.style.layout(ExampleViewport(640, 480))
+    assert geometry(root) == geometry(expected)
+
+
+def test_non_layout_style_change(laid_out):
+    """A change in a style property that can't affect layout doesn't lay out again."""
+    root = build_tree()
+    root.style.layout(ExampleViewport(640, 480))
+
+    laid_out.clear()
+    find(root, "leaf").style.color = "red"
+    root.style.layout(ExampleViewport(640, 480))
+    assert laid_out == []
+
+
+def test_reuse_with_new_allocation(laid_out):
+    """A clean node is laid out again if its allocation changes in a way that affects
+    its layout, and reused otherwise."""
+    root = ExampleNode(
+        "root",
+        style=Pack(direction=ROW),
+        children=[
+            ExampleNode("fixed", style=Pack(width=50), size=(at_least(10), 10)),
+            ExampleNode("flexible", style=Pack(flex=1), size=(at_least(10), 10)),
+        ],
+    )
+    root.style.layout(ExampleViewport(640, 480))
+
+    laid_out.clear()
+    root.style.layout(ExampleViewport(800, 480))
+    # The fixed-width child doesn't depend on the allocated width; the flexible
+    # child does.
+    assert laid_out == ["root", "flexible"]
+    assert root.children[1].layout.content_width == 750
+
+
+def test_style_snapshot(monkeypatch):
+    """Layout reads a snapshot of each node's style, which is rebuilt whenever the
+    style changes."""
+    root = build_tree()
+    # Layout doesn't look up properties by name.
+    with monkeypatch.context() as m:
+        m.setattr(Pack, "__getitem__", None)
+        root.style.layout(ExampleViewport(640, 480))
+
+    snapshot = root.style._layout_style
+    assert root.style._layout_style is snapshot
+    assert snapshot.margin == (0, 0, 0, 0)
+    assert (snapshot.main_axis, snapshot.cross_axis) == (1, 0)
+
+    root.style.margin_top = 5
+    root.style.direction = ROW
+    snapshot = root.style._layout_style
+    assert snapshot.margin == (5, 0, 0, 0)
+    assert (snapshot.main_axis, snapshot.cross_axis) == (0, 1)
+
+
+def test_hidden_subtree(laid_out):
+    """A subtree that isn't displayed isn't laid out until it is displayed again."""
+    root = build_tree(panel_style=Pack(direction=ROW, display=NONE))
+    root.style.layout(ExampleViewport(640, 480))
+    assert laid_out == ["root", "other", "other leaf"]
+
+    laid_out.clear()
+    find(root, "leaf").intrinsic.width = at_least(50)
+    root.style.layout(ExampleViewport(640, 480))
+    assert laid_out == []
+
+    find(root, "panel").style.display = PACK
+    root.style.layout(ExampleViewport(640, 480))
+    # The space available to the panel's sibling has changed, too.
+    assert laid_out == ["root", "panel", "leaf", "sibling", "other"]
+
+    expected = build_tree(leaf_size=(at_least(50), 10))
+    expected.style.layout(ExampleViewport(640, 480))
+    assert geometry(root) == geometry(expected)
@@ -0,0 +1,105 @@
+from collections import Counter
+from itertools import count
+
+import pytest
+from travertino.size import at_least
+
+from toga.style.layout import LayoutTrace, LayoutTraceEvent, set_tracer
+from toga.style.pack import COLUMN, ROW, Pack
+
+from ..utils import ExampleNode, ExampleViewport
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Make every reading of the tracing clock one second after the last."""
+    monkeypatch.setattr("toga.style.layout.perf_counter", count().__next__)
+
+
+@pytest.fixture
+def tree():
+    leaf = ExampleNode("leaf", style=Pack(), size=(at_least(10), 10))
+    panel = ExampleNode("panel", style=Pack(direction=ROW), children=[leaf])
+    flexible = ExampleNode("flexible", style=Pack(flex=1))
+    return ExampleNode("root", style=Pack(direction=COLUMN), children=[panel, flexible])
+
+
+def test_events(clock, tree):
+    """Each node that is laid out is reported once its layout is complete."""
+    panel, flexible = tree.children
+    leaf = panel.children[0]
+
+    with LayoutTrace() as trace:
+        tree.style.layout(ExampleViewport(640, 480))
+
+    assert trace.events == [
+        LayoutTraceEvent(leaf, 1, "pass 1", 1, 1),
+        LayoutTraceEvent(panel, 1, "pass 1", 3, 2),
+        LayoutTraceEvent(flexible, 1, "pass 2", 1, 1),
+        LayoutTraceEvent(tree, 1, "root", 7, 3),
+    ]
+
+
+def test_relayout(clock, tree):
+    """A change is reported as laying out the nodes it affects again, with their
+    previous allocation."""
+    panel, flexible = tree.children
+    leaf = panel.children[0]
+
+    with LayoutTrace() as trace:
+        tree.style.layout(ExampleViewport(640, 480))
+        leaf.intrinsic.width = at_least(50)
+        tree.style.layout(ExampleViewport(640, 480))
+
+    assert trace.events[4:] == [
+        # A change in the intrinsic size of the leaf means its parent must allocate
+        # space to it again.
+        LayoutTraceEvent(leaf, 2, "pass 1", 1, 1),
+        LayoutTraceEvent(panel, 2, "relayout", 3, 2),
+        # The panel is now wider, so the root is laid out again too.
+        LayoutTraceEvent(tree, 2, "relayout", 1, 1),
+    ]
+    assert trace.counts() == {
+        1: Counter({tree: 1, panel: 1, leaf: 1, flexible: 1}),
+        2: Counter({tree: 1, panel: 1, leaf: 1}),
+    }
+
+
+def test_flamegraph(clock, tree):
+    """The time spent laying out each node can be exported as folded stacks."""
+    with LayoutTrace() as trace:
+        tree.style.layout(ExampleViewport(640, 480))
+        tree.children[0].children[0].intrinsic.width = at_least(50)
+        tree.style.layout(ExampleViewport(640, 480))
+
+    assert trace.flamegraph() == (
+        "<root>;<panel>;<leaf> 2000000\n"
+        "<root>;<panel> 4000000\n"
+        "<root>;<flexible> 1000000\n"
+        "<root> 4000000\n"
+    )
+
+
+def test_set_tracer(tree):
+    """A tracer can be installed and removed."""
+    events = []
+    assert set_tracer(events.append) is None
+    try:
+        # A trace used as a context manager restores the tracer it replaced.
+        with LayoutTrace() as trace:
+            tree.style.layout(ExampleViewport(640, 480))
+        tree.style.layout(ExampleViewport(800, 600))
+    finally:
+        assert set_tracer(None) == events.append
+
+    assert [event.node.name for event in trace.events] == [
+        "leaf",
+        "panel",
+        "flexible",
+        "root",
+    ]
+    assert [event.node.name for event in events] == ["panel", "flexible", "root"]
+
+    # Once the tracer has been removed, nothing is traced.
+    tree.style.layout(ExampleViewport(640, 480))
+    assert len(events) == 3
@@ -165,16 +165,17 @@ def test_set_visibility_inherited():
     assert_hidden_called(True, True, True)
 
     # Just setting child or parent to VISIBLE won't trigger an apply, because that's
-    # their default value. So first, set them to hidden.
+    # their default value. So first, set them to hidden. The child was already
+    # hidden, so it isn't updated when the parent is hidden.
     parent.style.visibility = HIDDEN
-    assert_hidden_called(None, True, True)
+    assert_hidden_called(None, True, None)
 
     child.style.visibility = HIDDEN
     assert_hidden_called(None, None, True)
 
     # Then set them to visible. They should still not actually be shown.
     parent.style.visibility = VISIBLE
-    assert_hidden_called(None, True, True)
+    assert_hidden_called(None, True, None)
 
     child.style.visibility = VISIBLE
     assert_hidden_called(None, None, True)
@@ -182,3 +183,14 @@ def test_set_visibility_inherited():
     # Show grandparent again; the other two should reappear.
     grandparent.style.visibility = VISIBLE
     assert_hidden_called(False, False, False)
+
+
+def test_set_display_none():
+    """A node that isn't displayed is hidden."""
+    root = ExampleNode("app", style=Pack(display=NONE))
+    root.style.apply()
+    root._impl.set_hidden.assert_called_once_with(True)
+
+    root._impl.set_hidden.reset_mock()
+    root.style.display = "pack"
+    root._impl.set_hidden.assert_called_once_with(False)
@@ -495,3 +495,90 @@ from toga.style.pack import (
 def test_rendering(style, expected_css):
     """An empty style node can be rendered."""
     assert style.__css__() == expected_css
+
+
+def test_rendering_cached():
+    """The CSS for a style is only generated again after the style changes."""
+    style = Pack(width=10)
+    css = style.__css__()
+    declarations = style._css_declarations
+    assert style.__css__() is css
+    assert style._css_declarations is declarations
+
+    style.width = 20
+    assert style.__css__() == "flex-direction: row; width: 20px;"
+    assert style._css_declarations is not declarations
+
+
+def test_changes():
+    """The declarations that have changed since an earlier set of declarations can be
+    retrieved."""
+    style = Pack(width=10, color=REBECCAPURPLE)
+    declarations = style._css_declarations
+    assert style._css_changes({}) == declarations
+    assert style._css_changes(declarations) == {}
+
+    style.width = 20
+    del style.color
+    style.font_weight = BOLD
+    assert style._css_changes(declarations) == {
+        "width": "20px",
+        "color": None,
+        "font-weight": "bold",
+    }
+
+
+class NativeStyle:
+    """A stand-in for the inline style of a DOM element."""
+
+    def __init__(self):
+        self.declarations = {}
+        self.removed = []
+
+    def setProperty(self, name, value):
+        self.declarations[name] = value
+
+    def removeProperty(self, name):
+        self.removed.append(name)
+        del self.declarations[name]
+
+
+@pytest.mark.parametrize(
+    "initial, reset, removed",
+    [
+        # Resetting a property removes its declaration.
+        ({"color": REBECCAPURPLE}, {"color"}, ["color"]),
+        (
+            {"background_color": REBECCAPURPLE},
+            {"background_color"},
+            ["background-color"],
+        ),
+        ({"width": 10, "height": 20}, {"width"}, ["width"]),
+        ({"font_weight": BOLD}, {"font_weight"}, ["font-weight"]),
+        ({"visibility": HIDDEN}, {"visibility"}, ["visibility"]),
+    ],
+)
+def test_changes_removed(initial, reset, removed):
+    """A declaration that disappears from a style is removed when the changes are
+    applied."""
+    style = Pack(**initial)
+    native = NativeStyle()
+
+    def apply(previous):
+        # The same way the web backend applies the changes.
+        for name, value in style._css_changes(previous).items():
+            if value is None:
+                native.removeProperty(name)
+            else:
+                native.setProperty(name, value)
+        return style._css_declarations
+
+    applied = apply({})
+    assert native.declarations == style._css_declarations
+    assert native.removed == []
+
+    for name in reset:
+        del style[name]
+    apply(applied)
+    assert native.declarations == style._css_declarations
+    assert native.removed == removed
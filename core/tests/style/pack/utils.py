@@ -13,7 +13,9 @@ class ExampleNode(Node):
         super().__init__(style=style, children=children, applicator=TogaApplicator())
 
         self.name = name
-        self._impl = Mock()
+        # Like most backends, the implementation doesn't hide the children of a
+        # hidden node.
+        self._impl = Mock(CASCADES_HIDDEN=False)
         if size:
             self.intrinsic.width = size[0]
             self.intrinsic.height = size[1]
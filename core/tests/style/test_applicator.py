@@ -18,12 +18,19 @@ from toga.style.pack import (
 from toga_dummy.utils import (
     EventLog,
     assert_action_not_performed,
+    assert_action_performed,
     assert_action_performed_with,
 )
+from toga_dummy.widgets.base import Widget as DummyWidget
 
 from ..utils import ExampleLeafWidget, ExampleWidget
 
 
+def native_hidden(widget):
+    """The visibility that was last passed to the widget's implementation."""
+    return EventLog.performed_actions(widget, "set hidden")[-1]["hidden"]
+
+
 @pytest.fixture
 def grandchild():
     widget = ExampleLeafWidget(id="grandchild_id")
@@ -65,15 +72,15 @@ def test_set_bounds(widget, child, grandchild):
     widget.layout.content_width = 300
     widget.layout.content_height = 400
 
-    # Manually set location of the child
-    child.layout._origin_left = 10
-    child.layout._origin_top = 20
+    # Manually set location of the child, relative to the parent
+    child.layout.content_left = 10
+    child.layout.content_top = 20
     child.layout.content_width = 30
     child.layout.content_height = 40
 
-    # Manually set location of the grandchild
-    grandchild.layout._origin_left = 1
-    grandchild.layout._origin_top = 2
+    # Manually set location of the grandchild, relative to the child
+    grandchild.layout.content_left = 1
+    grandchild.layout.content_top = 2
     grandchild.layout.content_width = 3
     grandchild.layout.content_height = 4
 
@@ -83,8 +90,72 @@ def test_set_bounds(widget, child, grandchild):
     assert_action_performed_with(
         widget, "set bounds", x=100, y=200, width=300, height=400
     )
-    assert_action_performed_with(child, "set bounds", x=10, y=20, width=30, height=40)
-    assert_action_performed_with(grandchild, "set bounds", x=1, y=2, width=3, height=4)
+    assert_action_performed_with(child, "set bounds", x=110, y=220, width=30, height=40)
+    assert_action_performed_with(
+        grandchild, "set bounds", x=111, y=222, width=3, height=4
+    )
+
+
+def test_set_bounds_unchanged(widget, child, grandchild):
+    """Bounds are only passed to widgets whose bounds have changed."""
+    widget.layout.content_width = 300
+    widget.layout.content_height = 400
+    child.layout.content_width = 30
+    child.layout.content_height = 40
+    grandchild.layout.content_width = 3
+    grandchild.layout.content_height = 4
+    widget.applicator.set_bounds()
+    assert widget.applicator.bounds_applied == 3
+    assert widget.applicator.bounds_skipped == 0
+    EventLog.reset()
+
+    # Resize the child
+    child.layout.content_width = 50
+    widget.applicator.set_bounds()
+
+    assert_action_not_performed(widget, "set bounds")
+    assert_action_performed_with(child, "set bounds", x=0, y=0, width=50, height=40)
+    assert_action_not_performed(grandchild, "set bounds")
+    assert len(EventLog.performed_actions(child, "set bounds")) == 1
+    assert widget.applicator.bounds_applied == 1
+    assert widget.applicator.bounds_skipped == 2
+
+    # Laying out again without any changes doesn't apply any bounds.
+    EventLog.reset()
+    widget.applicator.set_bounds()
+    for node in [widget, child, grandchild]:
+        assert_action_not_performed(node, "set bounds")
+    assert widget.applicator.bounds_applied == 0
+    assert widget.applicator.bounds_skipped == 3
+
+    # The counts are only recorded on the applicator that applied the bounds.
+    assert child.applicator.bounds_applied == 0
+    assert child.applicator.bounds_skipped == 0
+
+
+def test_set_bounds_not_displayed(widget, child, grandchild):
+    """Bounds aren't passed to widgets that aren't displayed, or their children."""
+    child.style.display = NONE
+    EventLog.reset()
+
+    widget.applicator.set_bounds()
+
+    assert_action_performed_with(widget, "set bounds", x=0, y=0, width=0, height=0)
+    assert_action_not_performed(child, "set bounds")
+    assert_action_not_performed(grandchild, "set bounds")
+
+
+def test_reset_bounds(widget, child, grandchild):
+    """Bounds can be forced to be applied again, even if they haven't changed."""
+    widget.applicator.set_bounds()
+    EventLog.reset()
+
+    child.applicator.reset_bounds()
+    widget.applicator.set_bounds()
+
+    assert_action_not_performed(widget, "set bounds")
+    assert_action_performed_with(child, "set bounds", x=0, y=0, width=0, height=0)
+    assert_action_not_performed(grandchild, "set bounds")
 
 
 def test_text_align(widget):
@@ -128,18 +199,101 @@ def test_set_hidden(
     child.style.visibility = child_visibility
     grandchild.style.visibility = grandchild_visibility
 
+    # A widget can only be made visible once it has been hidden.
+    if not value:
+        widget.applicator.set_hidden(True)
+
     # Set widget visibility
     widget.applicator.set_hidden(value)
 
-    assert_action_performed_with(widget, "set hidden", hidden=widget_hidden)
-    assert_action_performed_with(child, "set hidden", hidden=child_hidden)
-    assert_action_performed_with(grandchild, "set hidden", hidden=grandchild_hidden)
+    assert native_hidden(widget) == widget_hidden
+    assert native_hidden(child) == child_hidden
+    assert native_hidden(grandchild) == grandchild_hidden
 
     # The style property of the child and grandchild hasn't changed.
     assert child.style.visibility == child_visibility
     assert grandchild.style.visibility == grandchild_visibility
 
 
+def test_set_hidden_unchanged(widget, child, grandchild):
+    """Visibility is only passed to descendants whose visibility changes."""
+    child.style.visibility = HIDDEN
+    EventLog.reset()
+
+    widget.applicator.set_hidden(True)
+    assert_action_performed_with(widget, "set hidden", hidden=True)
+    # The child (and so the grandchild) were already hidden.
+    assert_action_not_performed(child, "set hidden")
+    assert_action_not_performed(grandchild, "set hidden")
+
+    EventLog.reset()
+    widget.applicator.set_hidden(False)
+    assert_action_performed_with(widget, "set hidden", hidden=False)
+    assert_action_not_performed(child, "set hidden")
+    assert_action_not_performed(grandchild, "set hidden")
+
+
+def test_set_hidden_cascading(widget, child, grandchild):
+    """If the native toolkit hides the children of a hidden widget, visibility is only
+    passed to the widget whose visibility changed."""
+    for node in [widget, child, grandchild]:
+        node._impl.CASCADES_HIDDEN = True
+
+    widget.applicator.set_hidden(True)
+    assert_action_performed_with(widget, "set hidden", hidden=True)
+    assert_action_not_performed(child, "set hidden")
+    assert_action_not_performed(grandchild, "set hidden")
+
+    # The visibility of the descendants is still tracked.
+    assert child.applicator._hidden
+    assert grandchild.applicator._hidden
+
+    # A change in the style of a descendant is passed to that descendant, even if
+    # its visibility doesn't change.
+    child.style.visibility = HIDDEN
+    assert_action_performed_with(child, "set hidden", hidden=True)
+    assert_action_not_performed(grandchild, "set hidden")
+
+    widget.applicator.set_hidden(False)
+    assert_action_performed_with(widget, "set hidden", hidden=False)
+    assert grandchild.applicator._hidden
+    assert_action_not_performed(grandchild, "set hidden")
+
+
+def test_set_hidden_cascading_own_style(widget, child, grandchild):
+    """If the native toolkit hides the children of a hidden widget, a widget's
+    implementation is only given the visibility of its own style."""
+    for node in [widget, child, grandchild]:
+        node._impl.CASCADES_HIDDEN = True
+
+    widget.style.visibility = HIDDEN
+    assert native_hidden(widget)
+
+    # The child is hidden by its parent, but it is made visible in its own right.
+    child.style.visibility = HIDDEN
+    assert native_hidden(child)
+    child.style.visibility = VISIBLE
+    assert not native_hidden(child)
+    assert child.applicator._hidden
+
+    # Showing the parent shows the child, without a native call.
+    EventLog.reset()
+    widget.style.visibility = VISIBLE
+    assert not native_hidden(widget)
+    assert_action_not_performed(child, "set hidden")
+    assert not child.applicator._hidden
+    assert not grandchild.applicator._hidden
+
+    # A child added to a hidden parent is only given its own visibility.
+    widget.style.visibility = HIDDEN
+    new_child = ExampleLeafWidget()
+    new_child._impl.CASCADES_HIDDEN = True
+    EventLog.reset()
+    widget.add(new_child)
+    assert new_child.applicator._hidden
+    assert not native_hidden(new_child)
+
+
 def test_set_font(widget):
     """A font change can be applied to a widget."""
     widget.applicator.set_font(FANTASY)
@@ -161,6 +315,53 @@ def test_set_background_color(child, widget):
     assert_action_performed_with(widget, "set background color", color=REBECCAPURPLE)
 
 
+@pytest.fixture
+def native_defaults(monkeypatch):
+    """The dummy backend's widgets already match the default style."""
+    monkeypatch.setattr(
+        DummyWidget,
+        "NATIVE_DEFAULT_STYLE",
+        {"text_align", "color", "background_color", "hidden", "font"},
+        raising=False,
+    )
+
+
+def test_native_defaults(native_defaults):
+    """When a style is first applied, properties that haven't been set are only
+    applied if the native widget doesn't already match their default."""
+    EventLog.reset()
+    widget = ExampleLeafWidget(color=REBECCAPURPLE, font_weight=BOLD)
+
+    assert_action_performed(widget, "set color")
+    assert_action_performed(widget, "set font")
+    assert_action_performed(widget, "refresh")
+    assert_action_not_performed(widget, "set background color")
+    assert_action_not_performed(widget, "set text alignment")
+    assert_action_not_performed(widget, "set hidden")
+    assert widget.applicator._hidden is False
+
+    # Properties are applied as usual once they're set...
+    widget.style.background_color = REBECCAPURPLE
+    assert_action_performed(widget, "set background color")
+
+    # ... or if the widget is added to a hidden parent.
+    parent = ExampleWidget(visibility=HIDDEN)
+    parent.add(widget)
+    assert_action_performed_with(widget, "set hidden", hidden=True)
+
+
+def test_native_defaults_replaced_style(native_defaults):
+    """Every property is applied when a widget's style is replaced."""
+    widget = ExampleLeafWidget(color=REBECCAPURPLE)
+    EventLog.reset()
+
+    widget.style = type(widget.style)()
+    assert_action_performed_with(widget, "set color", color=None)
+    assert_action_performed(widget, "set background color")
+    assert_action_performed(widget, "set text alignment")
+    assert_action_performed(widget, "set font")
+
+
 def test_deprecated_widget_argument(widget):
     """The widget argument to TogaApplicator is deprecated."""
     with pytest.warns(DeprecationWarning):
@@ -0,0 +1,119 @@
+import pytest
+
+import toga
+from toga.colors import REBECCAPURPLE
+from toga_dummy.utils import (
+    EventLog,
+    assert_action_not_performed,
+    assert_action_performed,
+)
+
+from ..utils import ExampleLeafWidget, ExampleWidget
+
+
+@pytest.fixture
+def windows(app):
+    """Two windows, each containing a box of leaf widgets."""
+    windows = []
+    for i in range(2):
+        window = toga.Window()
+        box = ExampleWidget(id=f"box{i}_id")
+        box.add(*(ExampleLeafWidget(id=f"leaf{i}{j}_id") for j in range(3)))
+        window.content = box
+        windows.append(window)
+
+    EventLog.reset()
+    return windows
+
+
+def test_batch(windows):
+    """Style changes across many widgets are applied at the end of the batch, and each
+    widget tree is laid out once."""
+    leaves = [leaf for window in windows for leaf in window.content.children]
+
+    with toga.style.batch():
+        for leaf in leaves:
+            leaf.style.color = REBECCAPURPLE
+            leaf.style.margin = 5
+            leaf.style.width = 10
+
+        # Nothing has been applied or laid out yet.
+        for leaf in leaves:
+            assert_action_not_performed(leaf, "set color")
+            assert_action_not_performed(leaf, "refresh")
+        assert_action_not_performed(windows[0].content, "set bounds")
+
+    # Each widget's style was applied, and the widget refreshed, once...
+    for leaf in leaves:
+        assert len(EventLog.performed_actions(leaf, "set color")) == 1
+        assert len(EventLog.performed_actions(leaf, "refresh")) == 1
+        assert leaf.layout.content_width == 10
+
+    # ... and each window's layout was applied once.
+    for window in windows:
+        assert len(EventLog.performed_actions(window.content, "set bounds")) == 1
+        for leaf in window.content.children:
+            assert len(EventLog.performed_actions(leaf, "set bounds")) == 1
+
+    # Once the batch is complete, style changes are applied immediately again.
+    EventLog.reset()
+    leaves[0].style.width = 20
+    assert_action_performed(leaves[0], "refresh")
+    assert leaves[0].layout.content_width == 20
+
+
+def test_batch_children(windows):
+    """Adding and removing children in a batch is laid out once."""
+    box = windows[0].content
+    new_leaf = ExampleLeafWidget(id="new_leaf_id")
+
+    with toga.style.batch():
+        box.add(new_leaf)
+        box.remove(box.children[0])
+        new_leaf.style.margin = 5
+        assert_action_not_performed(box, "refresh")
+
+    assert len(EventLog.performed_actions(box, "set bounds")) == 1
+    assert len(EventLog.performed_actions(new_leaf, "set bounds")) == 1
+    assert new_leaf.layout.content_top == 5
+
+
+def test_batch_nested(windows):
+    """Changes are deferred until the outermost batch exits, including batches of
+    updates to a single widget."""
+    box = windows[0].content
+    leaf = box.children[0]
+
+    with toga.style.batch():
+        with toga.style.batch():
+            leaf.style.margin = 5
+        with box.batch_update():
+            leaf.style.width = 10
+        assert_action_not_performed(leaf, "refresh")
+        assert_action_not_performed(leaf, "set bounds")
+
+    assert len(EventLog.performed_actions(leaf, "refresh")) == 1
+    assert len(EventLog.performed_actions(leaf, "set bounds")) == 1
+    assert leaf.layout.content_width == 10
+
+    # A batch inside a batch update is laid out when the batch update ends.
+    EventLog.reset()
+    with box.batch_update():
+        with toga.style.batch():
+            leaf.style.margin = 10
+        assert_action_not_performed(leaf, "refresh")
+
+    assert len(EventLog.performed_actions(leaf, "refresh")) == 1
+    assert len(EventLog.performed_actions(leaf, "set bounds")) == 1
+
+
+def test_batch_exception(windows):
+    """If a batch raises an exception, the changes are still applied."""
+    leaf = windows[0].content.children[0]
+
+    with pytest.raises(ValueError), toga.style.batch():
+        leaf.style.width = 10
+        raise ValueError()
+
+    assert len(EventLog.performed_actions(leaf, "refresh")) == 1
+    assert leaf.layout.content_width == 10
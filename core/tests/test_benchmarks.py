@@ -0,0 +1,33 @@
+import json
+
+import pytest
+from benchmarks.layout import SCENARIOS, Phases, main
+
+
+def test_benchmarks(tmp_path, capsys):
+    """The layout benchmarks can be run, and their results saved and compared."""
+    output = tmp_path / "results.json"
+    main(["--scale", "0.001", "--repeat", "2", "--output", str(output)])
+
+    results = json.loads(output.read_text(encoding="utf-8"))
+    assert results["scale"] == 0.001
+    assert results["repeat"] == 2
+    assert list(results["results"]) == list(SCENARIOS)
+    for phases in results["results"].values():
+        assert list(phases) == Phases.names()
+        for result in phases.values():
+            assert len(result["times"]) == 2
+            assert result["min"] == min(result["times"])
+
+    capsys.readouterr()
+    main(["deep", "--scale", "0.001", "--repeat", "1", "--compare", str(output)])
+    lines = capsys.readouterr().out.splitlines()
+    assert "baseline (ms)" in lines[0]
+    assert len(lines) == 1 + len(Phases.names())
+    assert all(line.startswith("deep ") for line in lines[1:])
+
+
+def test_unknown_scenario():
+    """An unknown scenario is rejected."""
+    with pytest.raises(SystemExit):
+        main(["nonexistent"])
@@ -1,4 +1,5 @@
 from pathlib import Path
+from unittest.mock import Mock
 
 import pytest
 
@@ -17,7 +18,10 @@ from toga.fonts import (
     SMALL_CAPS,
     SYSTEM,
     SYSTEM_DEFAULT_FONT_SIZE,
+    UnknownFontError,
+    _resolve_font,
 )
+from toga_dummy.fonts import Font as DummyFont
 
 
 @pytest.fixture
@@ -223,3 +227,69 @@ def test_register_font_variant(app, path, registered):
         Path(_REGISTERED_FONT_CACHE[("Custom Font", BOLD, NORMAL, NORMAL)]).resolve()
         == registered.resolve()
     )
+
+
+@pytest.fixture
+def probes(monkeypatch):
+    """Count the backend's probes for fonts, starting with empty font caches."""
+    monkeypatch.setattr(toga.fonts, "_IMPL_CACHE", {})
+    monkeypatch.setattr(toga.fonts, "_UNKNOWN_FONT_CACHE", set())
+    monkeypatch.setattr(toga.fonts, "_RESOLVED_FONT_CACHE", {})
+    probes = Mock()
+    load_user_registered_font = DummyFont.load_user_registered_font
+
+    def probe(self):
+        probes(self.interface)
+        load_user_registered_font(self)
+
+    monkeypatch.setattr(DummyFont, "load_user_registered_font", probe)
+    return probes
+
+
+def test_unknown_font(probes):
+    """A font that can't be loaded is only probed for once."""
+    for _ in range(2):
+        with pytest.raises(UnknownFontError, match=r"Unknown font 'Bogus Font 12pt'"):
+            toga.Font("Bogus Font", 12)
+    assert probes.call_count == 1
+
+    # The same family in another size is a different font.
+    with pytest.raises(UnknownFontError):
+        toga.Font("Bogus Font", 13)
+    assert probes.call_count == 2
+
+
+def test_resolve_font(probes, capsys):
+    """The font for a list of families is resolved once."""
+    kwargs = {"weight": BOLD, "style": NORMAL, "variant": NORMAL}
+    font = _resolve_font(["Bogus Font", "Courier"], 12, **kwargs)
+    assert (font.family, font.size, font.weight) == ("Courier", 12, BOLD)
+    assert probes.call_count == 2
+
+    assert _resolve_font(["Bogus Font", "Courier"], 12, **kwargs) is font
+    assert probes.call_count == 2
+
+    # Another list of families doesn't probe for a family that couldn't be loaded.
+    font = _resolve_font(["Bogus Font", "Helvetica"], 12, **kwargs)
+    assert font.family == "Helvetica"
+    assert probes.call_count == 3
+
+    # If none of the families can be loaded, the system font is used, and a message
+    # is only printed once.
+    for _ in range(2):
+        font = _resolve_font(["Bogus Font"], 12, **kwargs)
+        assert font.family == SYSTEM
+    assert capsys.readouterr().out.count("No valid font family") == 1
+
+
+def test_register_clears_cache(app, probes):
+    """Registering a font discards the fonts that couldn't be loaded, and the
+    resolved fonts."""
+    kwargs = {"weight": NORMAL, "style": NORMAL, "variant": NORMAL}
+    with pytest.raises(UnknownFontError):
+        toga.Font("Bogus Font", 12)
+    _resolve_font(["Bogus Font"], 12, **kwargs)
+
+    toga.Font.register("Custom Font", "path/to/custom/font.otf")
+    assert not toga.fonts._UNKNOWN_FONT_CACHE
+    assert not toga.fonts._RESOLVED_FONT_CACHE
@@ -1,3 +1,5 @@
+import asyncio
+import sys
 from unittest.mock import Mock
 
 import pytest
@@ -5,6 +7,8 @@ import pytest
 import toga
 from toga.platform import get_factory
 from toga.style import Pack
+from toga.style.pack import HIDDEN
+from toga.types import Size
 from toga_dummy.utils import (
     EventLog,
     assert_action_not_performed,
@@ -65,6 +69,88 @@ def test_widget_created(widget):
     assert widget.style.margin == (666, 666, 666, 666)
 
 
+def test_shared_style(app):
+    """Widgets created with the same style properties share the values of their
+    styles until one of them is modified."""
+    widget1 = ExampleWidget(margin=5, flex=1)
+    widget2 = ExampleWidget(margin=5, flex=1)
+    assert widget1.style is not widget2.style
+    assert widget1.style._values is widget2.style._values
+
+    widget1.style.flex = 2
+    assert widget1.style.flex == 2
+    assert widget2.style.flex == 1
+
+    # The prototype isn't modified, so a new widget has the original values.
+    widget3 = ExampleWidget(margin=5, flex=1)
+    assert widget3.style.flex == 1
+    assert widget3.style._values is widget2.style._values
+
+    # A style that is provided is copied, rather than shared with the widget.
+    style = Pack(margin=5)
+    widget4 = ExampleWidget(style=style)
+    widget4.style.margin = 10
+    assert style.margin == (5, 5, 5, 5)
+
+
+def test_style_storage():
+    """A widget's style only stores the values of the properties that have been set,
+    without an instance dictionary."""
+    widget = ExampleWidget(margin=5, flex=1)
+    assert not hasattr(widget.style, "__dict__")
+    assert len(widget.style._values) == 5
+
+    del widget.style.flex
+    assert len(widget.style._values) == 4
+    assert widget.style.flex == 0
+    assert widget.style.margin == (5, 5, 5, 5)
+
+
+@pytest.mark.parametrize(
+    "style, message",
+    [
+        ({"padding": 5}, r"Pack\.padding is deprecated"),
+        ({"padding_top": 5}, r"Pack\.padding_top is deprecated"),
+        ({"alignment": "center"}, r"Pack\.alignment is deprecated"),
+    ],
+)
+def test_shared_style_deprecated(style, message):
+    """A deprecated style property warns every time a widget is created with it."""
+    for _ in range(3):
+        with pytest.warns(DeprecationWarning, match=message):
+            ExampleWidget(**style)
+
+
+def test_deep_tree(app):
+    """A tree of widgets much deeper than Python's recursion limit can be added to,
+    laid out in, and removed from a window."""
+    depth = sys.getrecursionlimit()
+
+    leaf = ExampleLeafWidget(id="leaf")
+    widget = leaf
+    for i in range(depth):
+        widget = toga.Box(id=f"box-{i}", children=[widget])
+        if i == depth // 2:
+            # A container whose content isn't one of its children.
+            widget = toga.ScrollContainer(id="scroll", content=widget)
+    root = widget
+
+    window = toga.Window()
+    window.content = root
+    for widget in [leaf, app.widgets["scroll"], app.widgets["box-0"]]:
+        assert widget.app is app
+        assert widget.window is window
+    assert len(app.widgets) == depth + 2
+
+    root.refresh()
+    assert_action_performed(leaf, "set bounds")
+
+    window.content = toga.Box()
+    assert leaf.window is None
+    assert "leaf" not in app.widgets
+    assert len(app.widgets) == 1
+
+
 def test_add_child_to_leaf():
     """A child cannot be added to a leaf node."""
     leaf = ExampleLeafWidget()
@@ -326,6 +412,53 @@ def test_reparent_child(widget):
     assert_action_performed_with(other, "refresh")
 
 
+@pytest.mark.parametrize("method", ["add", "insert"])
+def test_reparent_visibility(widget, method):
+    """When a widget is reparented, its visibility is updated to match its new
+    ancestors."""
+    hidden = ExampleWidget(id="hidden", style=Pack(visibility=HIDDEN))
+    child = ExampleWidget(id="child_id")
+    grandchild = ExampleLeafWidget(id="grandchild_id")
+    child.add(grandchild)
+    EventLog.reset()
+
+    def reparent(parent):
+        if method == "add":
+            parent.add(child)
+        else:
+            parent.insert(0, child)
+
+    # Adding the child to a hidden parent hides the child and its descendants.
+    reparent(hidden)
+    assert_action_performed_with(child, "set hidden", hidden=True)
+    assert_action_performed_with(grandchild, "set hidden", hidden=True)
+
+    # Moving the child to a visible parent shows it again.
+    EventLog.reset()
+    reparent(widget)
+    assert_action_performed_with(child, "set hidden", hidden=False)
+    assert_action_performed_with(grandchild, "set hidden", hidden=False)
+
+    # If the visibility of the child doesn't change, nothing is updated.
+    EventLog.reset()
+    widget.remove(child)
+    reparent(ExampleWidget(id="other"))
+    assert_action_not_performed(child, "set hidden")
+    assert_action_not_performed(grandchild, "set hidden")
+
+
+def test_remove_visibility(widget):
+    """A widget that is removed from a hidden parent is no longer hidden."""
+    widget.style.visibility = HIDDEN
+    child = ExampleLeafWidget(id="child_id")
+    widget.add(child)
+    assert_action_performed_with(child, "set hidden", hidden=True)
+
+    EventLog.reset()
+    widget.remove(child)
+    assert_action_performed_with(child, "set hidden", hidden=False)
+
+
 def test_reparent_child_to_self(widget):
     """Reparenting a widget to the same parent is a no-op."""
     # Add a child to the widget
@@ -1227,6 +1360,146 @@ def test_refresh_child(widget):
     assert_action_performed(widget, "refresh")
 
 
+def test_batch_update(app, widget):
+    """Changes made inside a batch update are laid out once, when the batch ends."""
+    window = toga.Window()
+    window.content = widget
+    children = [ExampleLeafWidget(id=f"child{i}_id") for i in range(3)]
+    EventLog.reset()
+
+    with widget.batch_update():
+        for child in children:
+            widget.add(child)
+        children[1].style.margin = 5
+        widget.remove(children[2])
+
+        # Nothing has been refreshed yet
+        assert_action_not_performed(widget, "refresh")
+        assert_action_not_performed(children[1], "refresh")
+
+    # The restyled child was refreshed once, and the layout was applied once.
+    assert len(EventLog.performed_actions(children[1], "refresh")) == 1
+    assert len(EventLog.performed_actions(widget, "set bounds")) == 1
+    assert len(EventLog.performed_actions(children[0], "set bounds")) == 1
+    assert widget.children == children[:2]
+
+
+def test_batch_update_nested(app, widget):
+    """Refreshes are deferred until the outermost batch update ends."""
+    window = toga.Window()
+    window.content = widget
+    child = ExampleWidget(id="child_id")
+    widget.add(child)
+    grandchildren = [ExampleLeafWidget(id=f"grandchild{i}_id") for i in range(2)]
+    EventLog.reset()
+
+    with widget.batch_update():
+        with child.batch_update():
+            child.add(grandchildren[0])
+        # The inner batch is complete, but the outer batch is still active.
+        assert_action_not_performed(child, "refresh")
+        assert_action_not_performed(widget, "refresh")
+
+        with widget.batch_update():
+            child.add(grandchildren[1])
+        assert_action_not_performed(widget, "refresh")
+
+    assert len(EventLog.performed_actions(child, "refresh")) == 1
+    assert len(EventLog.performed_actions(grandchildren[0], "set bounds")) == 1
+    assert len(EventLog.performed_actions(grandchildren[1], "set bounds")) == 1
+
+
+def test_batch_update_exception(app, widget):
+    """If a batch update raises an exception, pending refreshes are still applied."""
+    window = toga.Window()
+    window.content = widget
+    child = ExampleLeafWidget(id="child_id")
+    EventLog.reset()
+
+    with pytest.raises(ValueError), widget.batch_update():
+        widget.add(child)
+        raise ValueError()
+
+    assert len(EventLog.performed_actions(child, "set bounds")) == 1
+
+    # Once the batch is complete, refreshes are immediate again.
+    EventLog.reset()
+    widget.refresh()
+    assert_action_performed(widget, "refresh")
+
+
+def test_batch_update_unrelated(app, widget):
+    """A batch update doesn't defer refreshes of widgets outside the batch."""
+    other = ExampleWidget(id="other_id")
+    EventLog.reset()
+
+    with widget.batch_update():
+        other.refresh()
+        assert_action_performed(other, "refresh")
+
+
+async def test_refresh_coalesced(app, widget):
+    """While the event loop is running, refreshes are coalesced into a single layout
+    on the next iteration of the loop."""
+    window = toga.Window()
+    window.content = widget
+    children = [ExampleLeafWidget(id=f"child{i}_id") for i in range(2)]
+    EventLog.reset()
+
+    widget.add(children[0])
+    widget.add(children[1])
+    children[1].style.margin = 5
+
+    # The widgets have been refreshed, but the layout hasn't been applied.
+    assert_action_performed(children[1], "refresh")
+    assert_action_not_performed(widget, "set bounds")
+
+    await asyncio.sleep(0)
+
+    # The layout was applied once.
+    assert len(EventLog.performed_actions(widget, "set bounds")) == 1
+    assert len(EventLog.performed_actions(children[0], "set bounds")) == 1
+    assert children[1].layout.content_left == 5
+
+
+async def test_flush_layout(app, widget):
+    """Pending layout changes can be applied immediately."""
+    window = toga.Window()
+    window.content = widget
+    child = ExampleLeafWidget(id="child_id")
+    EventLog.reset()
+
+    widget.add(child)
+    assert_action_not_performed(child, "set bounds")
+
+    app.flush_layout()
+    assert len(EventLog.performed_actions(child, "set bounds")) == 1
+
+    # The layout isn't applied again on the next iteration of the loop.
+    await asyncio.sleep(0)
+    assert len(EventLog.performed_actions(child, "set bounds")) == 1
+
+
+async def test_refresh_resized(app, widget):
+    """If the container has been resized, the layout is refreshed immediately."""
+    window = toga.Window()
+    window.content = widget
+    child = ExampleLeafWidget(id="child_id")
+    widget.add(child)
+    widget.style.margin = 0
+    EventLog.reset()
+
+    widget._impl.get_size = Mock(return_value=Size(640, 480))
+    widget.refresh()
+
+    assert len(EventLog.performed_actions(child, "set bounds")) == 1
+    assert widget.layout.content_width == 640
+
+    # Any pending refresh has been satisfied.
+    await asyncio.sleep(0)
+    assert len(EventLog.performed_actions(child, "set bounds")) == 1
+
+
 def test_focus(widget):
     """A widget can be given focus."""
     widget.focus()
@@ -0,0 +1,372 @@
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+import toga
+from toga.style.pack import COLUMN, NONE, PACK, ROW
+from toga_dummy.utils import assert_action_performed
+
+
+def row_factory(index):
+    return toga.Box(id=f"row-{index}", height=20)
+
+
+@pytest.fixture
+def window(app):
+    return toga.Window()
+
+
+@pytest.fixture
+def virtualbox():
+    return toga.VirtualBox(row_count=100, row_factory=row_factory, overscan=0)
+
+
+@pytest.fixture
+def on_scroll_handler():
+    return Mock()
+
+
+@pytest.fixture
+def scroll_container(window, virtualbox, on_scroll_handler):
+    scroll_container = toga.ScrollContainer(
+        content=virtualbox,
+        on_scroll=on_scroll_handler,
+        height=100,
+    )
+    window.content = scroll_container
+    # Backends refresh the content of a scroll container when the scroll container
+    # is resized; the dummy backend doesn't.
+    virtualbox.refresh()
+    return scroll_container
+
+
+def assert_spacers(virtualbox, before, after):
+    """Assert the heights of the spacers before and after the rows, with None for a
+    spacer that isn't displayed."""
+    heights = []
+    for spacer in virtualbox._spacers:
+        if spacer.style.display == NONE:
+            heights.append(None)
+        else:
+            assert spacer.style.display == PACK
+            heights.append(spacer.style.height)
+    assert heights == [before, after]
+
+
+def assert_rows(virtualbox, indices):
+    """Assert the rows that have been materialized, and that they are the children of
+    the box, in order, between the spacers."""
+    rows = virtualbox.materialized_rows
+    assert list(rows) == list(indices)
+    assert [row.id for row in rows.values()] == [f"row-{index}" for index in indices]
+    assert virtualbox.children == [
+        virtualbox._spacers[0],
+        *rows.values(),
+        virtualbox._spacers[1],
+    ]
+
+
+def test_create():
+    """A VirtualBox can be created with no arguments."""
+    virtualbox = toga.VirtualBox()
+    assert virtualbox._impl.interface == virtualbox
+    assert_action_performed(virtualbox, "create Box")
+
+    assert virtualbox.row_count == 0
+    assert virtualbox.row_factory is None
+    assert virtualbox.estimated_row_height == 40
+    assert virtualbox.overscan == 200
+    assert virtualbox.materialized_rows == {}
+    assert virtualbox.style.direction == COLUMN
+
+
+def test_create_with_values():
+    """A VirtualBox can be created with arguments."""
+    virtualbox = toga.VirtualBox(
+        id="foobar",
+        row_count=10,
+        row_factory=row_factory,
+        estimated_row_height=30,
+        overscan=50,
+        # A style property
+        width=256,
+    )
+    assert virtualbox.id == "foobar"
+    assert virtualbox.row_count == 10
+    assert virtualbox.row_factory == row_factory
+    assert virtualbox.estimated_row_height == 30
+    assert virtualbox.overscan == 50
+    assert virtualbox.style.width == 256
+
+    # No rows are materialized until the box is in a window.
+    assert virtualbox.materialized_rows == {}
+
+
+def test_create_with_direction():
+    """A VirtualBox can only lay out its rows in a column."""
+    virtualbox = toga.VirtualBox(direction=COLUMN)
+    assert virtualbox.style.direction == COLUMN
+
+    with pytest.raises(
+        ValueError,
+        match=r"The rows of a VirtualBox are always laid out in a column",
+    ):
+        toga.VirtualBox(direction=ROW)
+
+
+def test_all_rows(window):
+    """If the box isn't in a scroll container, every row is materialized."""
+    virtualbox = toga.VirtualBox(row_count=5, row_factory=row_factory)
+    window.content = virtualbox
+
+    assert_rows(virtualbox, range(5))
+    assert_spacers(virtualbox, None, None)
+
+    # Once the box is removed from the window, the rows are left as they are.
+    window.content = toga.Box()
+    virtualbox.row_count = 10
+    assert_rows(virtualbox, range(5))
+
+
+def test_visible_rows(scroll_container, virtualbox):
+    """Only the rows that are visible in the scroll container are materialized."""
+    assert_rows(virtualbox, range(5))
+    # The rows after the visible rows are assumed to be the same height as the rows
+    # that have been laid out.
+    assert_spacers(virtualbox, None, 1900)
+    assert virtualbox.layout.content_height == 2000
+
+
+def test_overscan(window):
+    """Rows beyond the visible region, up to the overscan distance, are
+    materialized."""
+    virtualbox = toga.VirtualBox(row_count=100, row_factory=row_factory, overscan=50)
+    scroll_container = toga.ScrollContainer(content=virtualbox, height=100)
+    window.content = scroll_container
+    virtualbox.refresh()
+
+    assert_rows(virtualbox, range(8))
+    assert_spacers(virtualbox, None, 1840)
+
+    scroll_container.vertical_position = 1000
+    assert_rows(virtualbox, range(47, 58))
+    assert_spacers(virtualbox, 940, 840)
+
+
+def test_scroll(scroll_container, virtualbox, on_scroll_handler):
+    """Scrolling materializes the rows that become visible."""
+    scroll_container.vertical_position = 1000
+
+    assert_rows(virtualbox, range(50, 55))
+    assert_spacers(virtualbox, 1000, 900)
+    assert virtualbox.layout.content_height == 2000
+
+    # The scroll handler is still invoked.
+    on_scroll_handler.assert_called_once_with(scroll_container)
+
+    # Scrolling to the end leaves no rows after the visible rows.
+    scroll_container.vertical_position = 1900
+    assert_rows(virtualbox, range(95, 100))
+    assert_spacers(virtualbox, 1900, None)
+
+
+def test_scroll_handler_raises(scroll_container, virtualbox, on_scroll_handler):
+    """The rows are updated when the container scrolls, even if the scroll handler
+    raises an exception."""
+    on_scroll_handler.side_effect = Exception("Problem in handler")
+
+    scroll_container.vertical_position = 1000
+    on_scroll_handler.assert_called_once_with(scroll_container)
+    assert_rows(virtualbox, range(50, 55))
+    assert_spacers(virtualbox, 1000, 900)
+
+
+async def test_async_scroll_handler(window, virtualbox):
+    """The rows are updated when the container scrolls, before an asynchronous scroll
+    handler has completed."""
+    resume = asyncio.Event()
+    progress = []
+
+    async def on_scroll(widget, **kwargs):
+        progress.append("started")
+        await resume.wait()
+        progress.append("finished")
+
+    scroll_container = toga.ScrollContainer(
+        content=virtualbox,
+        on_scroll=on_scroll,
+        height=100,
+    )
+    window.content = scroll_container
+    virtualbox.refresh()
+    # Allow the deferred layout to be refreshed.
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+
+    scroll_container.vertical_position = 1000
+    assert_rows(virtualbox, range(50, 55))
+    assert_spacers(virtualbox, 1000, 900)
+
+    # The rows don't depend on the handler having completed.
+    await asyncio.sleep(0)
+    assert progress == ["started"]
+    assert_rows(virtualbox, range(50, 55))
+
+    resume.set()
+    await asyncio.sleep(0)
+    assert progress == ["started", "finished"]
+
+
+def test_variable_row_heights(window):
+    """Rows of different heights are located using the heights of the rows that have
+    been laid out, and the average height for those that haven't."""
+
+    def variable_factory(index):
+        return toga.Box(id=f"row-{index}", height=10 * (1 + index % 3))
+
+    virtualbox = toga.VirtualBox(
+        row_count=100, row_factory=variable_factory, overscan=0
+    )
+    scroll_container = toga.ScrollContainer(content=virtualbox, height=100)
+    window.content = scroll_container
+    virtualbox.refresh()
+
+    # Rows 0-5 fill the visible region (10 + 20 + 30 + 10 + 20 + 30 = 120); the
+    # remaining 94 rows are assumed to have the average of the measured heights.
+    assert_rows(virtualbox, range(6))
+    assert_spacers(virtualbox, None, 94 * 20)
+
+    # The rows that have been laid out keep their heights as the container
+    # scrolls; rows that have never been laid out use the latest average.
+    scroll_container.vertical_position = 1000
+    rows = list(virtualbox.materialized_rows)
+    before, after = (spacer.style.height for spacer in virtualbox._spacers)
+    heights = [virtualbox._heights[index] for index in rows]
+    assert None not in heights
+    assert before <= 1000 < before + heights[0]
+    assert before + sum(heights[:-1]) < 1100 <= before + sum(heights)
+    assert before + sum(heights) + after == virtualbox.layout.content_height
+
+
+def test_gap(window):
+    """The gap between rows is included in the extent of the spacers."""
+    virtualbox = toga.VirtualBox(
+        row_count=100, row_factory=row_factory, overscan=0, gap=10
+    )
+    scroll_container = toga.ScrollContainer(content=virtualbox, height=100)
+    window.content = scroll_container
+    virtualbox.refresh()
+
+    assert_rows(virtualbox, range(4))
+    assert_spacers(virtualbox, None, 96 * 30 - 10)
+    assert virtualbox.layout.content_height == 100 * 30 - 10
+
+    scroll_container.vertical_position = 600
+    assert_rows(virtualbox, range(20, 24))
+    assert_spacers(virtualbox, 20 * 30 - 10, 76 * 30 - 10)
+    assert virtualbox.layout.content_height == 100 * 30 - 10
+
+
+async def test_deferred_layout(window):
+    """If the layout is deferred to the event loop, the rows are updated again once
+    the layout has been refreshed."""
+    virtualbox = toga.VirtualBox(row_count=100, row_factory=row_factory, overscan=0)
+    scroll_container = toga.ScrollContainer(content=virtualbox, height=100)
+    window.content = scroll_container
+    virtualbox.refresh()
+
+    # The rows that were materialized haven't been laid out, so they are assumed to
+    # have the estimated height.
+    assert_rows(virtualbox, range(3))
+    assert_spacers(virtualbox, None, 97 * 40)
+
+    # Once the layout has been refreshed, the rows are updated to match the height
+    # of the rows that have been laid out.
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    assert_rows(virtualbox, range(5))
+    assert_spacers(virtualbox, None, 1900)
+
+
+def test_row_count(scroll_container, virtualbox):
+    """Changing the row count updates the rows."""
+    scroll_container.vertical_position = 1000
+    assert_rows(virtualbox, range(50, 55))
+
+    # Rows that no longer exist are removed.
+    virtualbox.row_count = 52
+    assert virtualbox.row_count == 52
+    assert_rows(virtualbox, range(50, 52))
+    assert_spacers(virtualbox, 1000, None)
+
+    # Rows that are added are materialized if they are visible.
+    virtualbox.row_count = 200
+    assert_rows(virtualbox, range(50, 55))
+    assert_spacers(virtualbox, 1000, 2900)
+
+
+def test_negative_row_count(virtualbox):
+    """The row count can't be negative."""
+    with pytest.raises(ValueError, match=r"Row count cannot be negative"):
+        virtualbox.row_count = -1
+
+
+def test_row_factory(scroll_container, virtualbox):
+    """Replacing the row factory replaces every row."""
+    old_rows = virtualbox.materialized_rows
+
+    def new_factory(index):
+        return toga.Box(id=f"row-{index}", height=50)
+
+    virtualbox.row_factory = new_factory
+    assert virtualbox.row_factory == new_factory
+
+    assert_rows(virtualbox, range(2))
+    assert_spacers(virtualbox, None, 98 * 50)
+    assert not set(virtualbox.materialized_rows.values()) & set(old_rows.values())
+
+    # Removing the row factory removes every row.
+    virtualbox.row_factory = None
+    assert_rows(virtualbox, [])
+    assert_spacers(virtualbox, None, None)
+
+
+@pytest.mark.parametrize(
+    "method, args",
+    [
+        ("add", [toga.Box]),
+        ("insert", [0, toga.Box]),
+        ("remove", [toga.Box]),
+    ],
+)
+def test_children(virtualbox, method, args):
+    """Children can't be added to or removed from a VirtualBox directly."""
+    args = [arg() if callable(arg) else arg for arg in args]
+    with pytest.raises(ValueError, match=r"Children cannot be .* VirtualBox"):
+        getattr(virtualbox, method)(*args)
+
+
+def test_spacer_children(scroll_container, virtualbox):
+    """The spacers are the first and last children of the box; the rows are between
+    them."""
+    scroll_container.vertical_position = 1000
+    rows = virtualbox.materialized_rows
+
+    assert virtualbox.index(virtualbox._spacers[0]) == 0
+    assert [virtualbox.index(row) for row in rows.values()] == list(range(1, 6))
+    assert virtualbox.index(virtualbox._spacers[1]) == 6
+    assert len(virtualbox.children) == len(rows) + 2
+
+
+def test_replace_content(scroll_container, virtualbox):
+    """If the box is removed from the scroll container, it is no longer updated when
+    the container scrolls."""
+    assert virtualbox._scroll_container == scroll_container
+
+    scroll_container.content = toga.Box()
+    assert virtualbox._scroll_container is None
+    assert virtualbox.window is None
+
+    scroll_container.vertical_position = 1000
+    assert_rows(virtualbox, range(5))
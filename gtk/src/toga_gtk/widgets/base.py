@@ -14,6 +14,10 @@ from ..libs import (
 
 
 class Widget(ABC):
+    # Resetting the color or background color removes a CSS provider, which a newly
+    # created widget doesn't have, so they don't need to be applied until they're set.
+    NATIVE_DEFAULT_STYLE = {"color", "background_color"}
+
     def __init__(self, interface):
         super().__init__()
         self.interface = interface
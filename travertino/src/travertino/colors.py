@@ -3,6 +3,7 @@ from __future__ import annotations
 import string
 import warnings
 from abc import ABC, abstractmethod
+from functools import lru_cache
 
 from .constants import *  # noqa: F403
 
@@ -10,10 +11,105 @@ from .constants import *  # noqa: F403
 warnings.filterwarnings("default", category=DeprecationWarning)
 
 
+# The maximum number of parsed strings, interned colors, and conversions between
+# color spaces that are cached. Colors are immutable, so the same instance can be
+# handed out for every equivalent input.
+_MAX_CACHED_COLORS = 1024
+
+
 def _clamp(value, lower, upper):
     return min(upper, max(lower, value))
 
 
+@lru_cache(maxsize=_MAX_CACHED_COLORS)
+def _interned_rgb(r, g, b, a):
+    return rgb(r, g, b, a)
+
+
+# Conversions are cached by value, rather than only on the instance being converted,
+# so that equal colors share the result of the conversion.
+@lru_cache(maxsize=_MAX_CACHED_COLORS)
+def _rgb_to_hsl(r, g, b, a):
+    # Formula used here is from: https://en.wikipedia.org/wiki/HSL_and_HSV#From_RGB
+    r_prime = r / 255
+    g_prime = g / 255
+    b_prime = b / 255
+
+    max_component = max(r_prime, g_prime, b_prime)
+    min_component = min(r_prime, g_prime, b_prime)
+    value = max_component
+    chroma = max_component - min_component
+
+    lightness = (max_component + min_component) / 2
+
+    if chroma == 0:
+        hue = 0
+    elif value == r_prime:
+        hue = 60 * (((g_prime - b_prime) / chroma) % 6)
+    elif value == g_prime:
+        hue = 60 * (((b_prime - r_prime) / chroma) + 2)
+    else:  # value == b_prime:
+        hue = 60 * (((r_prime - g_prime) / chroma) + 4)
+
+    if lightness in {0, 1}:
+        saturation = 0
+    else:
+        saturation = chroma / (1 - abs((2 * value) - chroma - 1))
+
+    return hsl(hue, saturation, lightness, a)
+
+
+@lru_cache(maxsize=_MAX_CACHED_COLORS)
+def _hsl_to_rgb(h, s, l, a):  # noqa: E741
+    c = (1.0 - abs(2.0 * l - 1.0)) * s
+    h = h / 60.0
+    x = c * (1.0 - abs(h % 2 - 1.0))
+    m = l - 0.5 * c
+
+    if h < 1.0:
+        r, g, b = c + m, x + m, m
+    elif h < 2.0:
+        r, g, b = x + m, c + m, m
+    elif h < 3.0:
+        r, g, b = m, c + m, x + m
+    elif h < 4.0:
+        r, g, b = m, x + m, c + m
+    elif h < 5.0:
+        r, g, b = x + m, m, c + m
+    else:
+        r, g, b = c + m, m, x + m
+
+    return rgb(r * 0xFF, g * 0xFF, b * 0xFF, a)
+
+
+@lru_cache(maxsize=_MAX_CACHED_COLORS)
+def _parse_string(value):
+    if result := NAMED_COLOR.get(value.lower()):
+        return result
+
+    pound, *digits = value
+    if pound == "#" and all(d in string.hexdigits for d in digits):
+        if len(digits) in {3, 4}:
+            r, g, b, *a = digits
+            return _interned_rgb(
+                int(f"{r}{r}", 16),
+                int(f"{g}{g}", 16),
+                int(f"{b}{b}", 16),
+                (int(f"{a[0]}{a[0]}", 16) / 0xFF) if a else 1.0,
+            )
+
+        elif len(digits) in {6, 8}:
+            r1, r2, g1, g2, b1, b2, *a = digits
+            return _interned_rgb(
+                int(f"{r1}{r2}", 16),
+                int(f"{g1}{g2}", 16),
+                int(f"{b1}{b2}", 16),
+                (int(f"{a[0]}{a[1]}", 16) / 0xFF) if a else 1.0,
+            )
+
+    raise ValueError(f"Unknown color: {value!r}")
+
+
 class Color(ABC):
     """A base class for all colorspace representations.
 
@@ -26,6 +122,9 @@ class Color(ABC):
     def parse(value: Color | str) -> Color:
         """Parse a color from a value.
 
+        Strings are only parsed once; equivalent strings produce the same (immutable)
+        color instance.
+
         Accepts:
         * An rgb() or hsl() instance
         * A named color
@@ -40,28 +139,7 @@ class Color(ABC):
             return value
 
         elif isinstance(value, str):
-            if result := NAMED_COLOR.get(value.lower()):
-                return result
-
-            pound, *digits = value
-            if pound == "#" and all(d in string.hexdigits for d in digits):
-                if len(digits) in {3, 4}:
-                    r, g, b, *a = digits
-                    return rgb(
-                        r=int(f"{r}{r}", 16),
-                        g=int(f"{g}{g}", 16),
-                        b=int(f"{b}{b}", 16),
-                        a=(int(f"{a[0]}{a[0]}", 16) / 0xFF) if a else 1.0,
-                    )
-
-                elif len(digits) in {6, 8}:
-                    r1, r2, g1, g2, b1, b2, *a = digits
-                    return rgb(
-                        r=int(f"{r1}{r2}", 16),
-                        g=int(f"{g1}{g2}", 16),
-                        b=int(f"{b1}{b2}", 16),
-                        a=(int(f"{a[0]}{a[1]}", 16) / 0xFF) if a else 1.0,
-                    )
+            return _parse_string(value)
 
         raise ValueError(f"Unknown color: {value!r}")
 
@@ -269,33 +347,7 @@ class rgb(Color):
         if cached := getattr(self, "_hsl", None):
             return cached
 
-        # Formula used here is from: https://en.wikipedia.org/wiki/HSL_and_HSV#From_RGB
-        r_prime = self.r / 255
-        g_prime = self.g / 255
-        b_prime = self.b / 255
-
-        max_component = max(r_prime, g_prime, b_prime)
-        min_component = min(r_prime, g_prime, b_prime)
-        value = max_component
-        chroma = max_component - min_component
-
-        lightness = (max_component + min_component) / 2
-
-        if chroma == 0:
-            hue = 0
-        elif value == r_prime:
-            hue = 60 * (((g_prime - b_prime) / chroma) % 6)
-        elif value == g_prime:
-            hue = 60 * (((b_prime - r_prime) / chroma) + 2)
-        else:  # value == b_prime:
-            hue = 60 * (((r_prime - g_prime) / chroma) + 4)
-
-        if lightness in {0, 1}:
-            saturation = 0
-        else:
-            saturation = chroma / (1 - abs((2 * value) - chroma - 1))
-
-        self._hsl = hsl(hue, saturation, lightness, self.a)
+        self._hsl = _rgb_to_hsl(self.r, self.g, self.b, self.a)
         return self._hsl
 
 
@@ -361,25 +413,7 @@ class hsl(Color):
         if cached := getattr(self, "_rgb", None):
             return cached
 
-        c = (1.0 - abs(2.0 * self.l - 1.0)) * self.s
-        h = self.h / 60.0
-        x = c * (1.0 - abs(h % 2 - 1.0))
-        m = self.l - 0.5 * c
-
-        if h < 1.0:
-            r, g, b = c + m, x + m, m
-        elif h < 2.0:
-            r, g, b = x + m, c + m, m
-        elif h < 3.0:
-            r, g, b = m, c + m, x + m
-        elif h < 4.0:
-            r, g, b = m, x + m, c + m
-        elif h < 5.0:
-            r, g, b = x + m, m, c + m
-        else:
-            r, g, b = c + m, m, x + m
-
-        self._rgb = rgb(r * 0xFF, g * 0xFF, b * 0xFF, self.a)
+        self._rgb = _hsl_to_rgb(self.h, self.s, self.l, self.a)
         return self._rgb
 
 
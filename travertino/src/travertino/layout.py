@@ -26,8 +26,16 @@ class BaseBox:
     content_bottom: The distance from the bottom of the content to the bottom of the box
     content_right: The distance from the right of the content to the right of the box
 
-    origin_top: The absolute position of the top of the box
-    origin_left: The absolute position of the left of the box
+    origin_top: The absolute position of the top of the box. This is only stored
+        for the root of a tree; the origin of any other box is the absolute
+        position of the content of its parent.
+    origin_left: The absolute position of the left of the box. As for origin_top,
+        this is only stored for the root of a tree.
+
+    Layout bookkeeping
+    ~~~~~~~~~~~~~~~~~~
+    dirty: The box needs to be laid out again.
+    dirty_descendants: At least one descendant of the box needs to be laid out again.
 
     Computed properties
     ~~~~~~~~~~~~~~~~~~~
@@ -39,8 +47,34 @@ class BaseBox:
     absolute_content_bottom: The absolute position of the bottom of the content box.
     absolute_content_right: The absolute position of the right of the content box.
 
+    Absolute positions are computed on demand, and cached until the position of any
+    box changes.
     """
 
+    __slots__ = [
+        "node",
+        "visible",
+        "min_content_width",
+        "min_content_height",
+        "content_width",
+        "content_height",
+        "_content_top",
+        "_content_left",
+        "content_bottom",
+        "content_right",
+        "_root_origin_top",
+        "_root_origin_left",
+        "_absolute_generation",
+        "_absolute_content_top",
+        "_absolute_content_left",
+        "_dirty",
+        "_dirty_descendants",
+    ]
+
+    # Incremented whenever the position of any box changes, invalidating every cached
+    # absolute position.
+    _generation = 0
+
     def __init__(self, node):
         self.node = node
         self._reset()
@@ -71,38 +105,71 @@ class BaseBox:
         self.content_bottom = 0
         self.content_right = 0
 
-        self.__origin_top = 0
-        self.__origin_left = 0
-
-        # Set the origin via properties; this forces the calculation of
-        # absolute positions.
-        self._origin_top = 0
-        self._origin_left = 0
+        # The origin of the box, if it is the root of a tree.
+        self._root_origin_top = 0
+        self._root_origin_left = 0
+
+        # The generation at which the absolute position was cached.
+        self._absolute_generation = -1
+        self._absolute_content_top = 0
+        self._absolute_content_left = 0
+        BaseBox._generation += 1
+
+        # A box that has never been laid out is dirty by definition.
+        self._dirty = True
+        self._dirty_descendants = False
+
+    def _mark_dirty(self, parent=True):
+        """Flag that this box needs to be laid out again.
+
+        This should be invoked whenever the style, intrinsic size, or children of the
+        box's node change. Ancestors are flagged as having dirty descendants; they only
+        need to be laid out again if the size of the subtree below them changes.
+
+        :param parent: Whether the parent of the node should be flagged as dirty as
+            well. The parent reads the style and intrinsic size of the node directly
+            when laying out its children, so this is only False when the change is
+            limited to the node's children.
+        """
+        self._dirty = True
+        # A change in the children of a node may have moved a box to a new parent.
+        BaseBox._generation += 1
+
+        node = self.node
+        if parent and node.parent is not None:
+            node = node.parent
+            node.layout._dirty = True
+
+        while (node := node.parent) is not None:
+            if node.layout._dirty_descendants:
+                # Everything above this point has already been flagged.
+                break
+            node.layout._dirty_descendants = True
 
     ######################################################################
     # Origin handling
     ######################################################################
     @property
     def _origin_top(self):
-        return self.__origin_top
+        if (parent := self.node.parent) is None:
+            return self._root_origin_top
+        return parent.layout.absolute_content_top
 
     @_origin_top.setter
     def _origin_top(self, value):
-        if value != self.__origin_top:
-            self.__origin_top = value
-            for child in self.node.children:
-                child.layout._origin_top = self.absolute_content_top
+        self._root_origin_top = value
+        BaseBox._generation += 1
 
     @property
     def _origin_left(self):
-        return self.__origin_left
+        if (parent := self.node.parent) is None:
+            return self._root_origin_left
+        return parent.layout.absolute_content_left
 
     @_origin_left.setter
     def _origin_left(self, value):
-        if value != self.__origin_left:
-            self.__origin_left = value
-            for child in self.node.children:
-                child.layout._origin_left = self.absolute_content_left
+        self._root_origin_left = value
+        BaseBox._generation += 1
 
     @property
     def width(self):
@@ -129,9 +196,9 @@ class BaseBox:
 
     @content_top.setter
     def content_top(self, value):
-        self._content_top = value
-        for child in self.node.children:
-            child.layout._origin_top = self.absolute_content_top
+        if value != self._content_top:
+            self._content_top = value
+            BaseBox._generation += 1
 
     @property
     def content_left(self):
@@ -139,26 +206,52 @@ class BaseBox:
 
     @content_left.setter
     def content_left(self, value):
-        self._content_left = value
-        for child in self.node.children:
-            child.layout._origin_left = self.absolute_content_left
+        if value != self._content_left:
+            self._content_left = value
+            BaseBox._generation += 1
 
     ######################################################################
     # Absolute content box position
     ######################################################################
 
+    def _update_absolute(self):
+        # Compute the absolute position of the content box, reusing the cached
+        # positions of ancestors. Stale ancestors are updated first, so a top-down
+        # walk of a tree computes each position exactly once.
+        generation = BaseBox._generation
+        stale = [self]
+        node = self.node
+        while (node := node.parent) is not None:
+            if node.layout._absolute_generation == generation:
+                top = node.layout._absolute_content_top
+                left = node.layout._absolute_content_left
+                break
+            stale.append(node.layout)
+        else:
+            top = stale[-1]._root_origin_top
+            left = stale[-1]._root_origin_left
+
+        for layout in reversed(stale):
+            top = layout._absolute_content_top = top + layout._content_top
+            left = layout._absolute_content_left = left + layout._content_left
+            layout._absolute_generation = generation
+
     @property
     def absolute_content_top(self):
-        return self.__origin_top + self._content_top
+        if self._absolute_generation != BaseBox._generation:
+            self._update_absolute()
+        return self._absolute_content_top
 
     @property
     def absolute_content_right(self):
-        return self.__origin_left + self._content_left + self.content_width
+        return self.absolute_content_left + self.content_width
 
     @property
     def absolute_content_bottom(self):
-        return self.__origin_top + self._content_top + self.content_height
+        return self.absolute_content_top + self.content_height
 
     @property
     def absolute_content_left(self):
-        return self.__origin_left + self._content_left
+        if self._absolute_generation != BaseBox._generation:
+            self._update_absolute()
+        return self._absolute_content_left
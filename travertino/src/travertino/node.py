@@ -1,9 +1,17 @@
+from bisect import bisect_left, insort
+
+
 class Node:
+    # Incremented whenever any node is added to or removed from a tree, invalidating
+    # the root that every node has cached.
+    _generation = 0
+
     def __init__(self, style, applicator=None, children=None):
         # Parent needs to be primed before style is (potentially) applied with
         # assignment of applicator.
         self._parent = None
-        self._root = None
+        self._cached_root = None
+        self._root_generation = Node._generation
 
         # Explicitly set the internal attribute first, since the setter for style will
         # access the applicator property.
@@ -12,6 +20,9 @@ class Node:
         self.style = style
         self.applicator = applicator
 
+        # The position of each child is tracked lazily; see _child_position().
+        self._child_origins = None
+
         if children is None:
             self._children = None
         else:
@@ -33,6 +44,8 @@ class Node:
         self._style = style.copy()
         self.intrinsic = self.style.IntrinsicSize()
         self.layout = self.style.Box(self)
+        # Changes to the intrinsic size invalidate the layout of this node.
+        self.intrinsic._layout = self.layout
 
         if self.applicator:
             self.style._applicator = self.applicator
@@ -62,6 +75,38 @@ class Node:
         # This triggers style.apply():
         self.style._applicator = applicator
 
+    @property
+    def _root(self):
+        """The root of the tree containing this node, or None if this node is the root.
+
+        The root is resolved when it is requested, rather than when the tree is
+        modified, so moving a subtree doesn't need to visit every node it contains.
+        Once resolved, the root is cached until the next modification of any tree.
+        """
+        if self._root_generation == Node._generation:
+            return self._cached_root
+
+        # Walk up the tree until an ancestor with a valid cached root (or the root
+        # itself) is found. An explicit loop is used, rather than recursion, so that
+        # arbitrarily deep trees can be handled.
+        generation = Node._generation
+        path = []
+        node = self
+        while node._root_generation != generation and node._parent is not None:
+            path.append(node)
+            node = node._parent
+
+        if node._root_generation != generation:
+            # This is the root of the tree.
+            node._cached_root = None
+            node._root_generation = generation
+        root = node._cached_root or node
+
+        for node in path:
+            node._cached_root = root
+            node._root_generation = generation
+        return self._cached_root
+
     @property
     def root(self):
         """The root of the tree containing this node.
@@ -115,8 +160,12 @@ class Node:
             raise ValueError("Cannot add children")
 
         self._children.append(child)
+        if self._child_origins is not None:
+            self._child_origins[child] = self._next_origin
+            self._next_origin += 1
         child._parent = self
-        self._set_root(child, self.root)
+        Node._generation += 1
+        self.layout._mark_dirty(parent=False)
 
     def insert(self, index, child):
         """Insert a node as a child of this one.
@@ -130,9 +179,11 @@ class Node:
         if self._children is None:
             raise ValueError("Cannot insert child")
 
+        self._track_insert(index, child)
         self._children.insert(index, child)
         child._parent = self
-        self._set_root(child, self.root)
+        Node._generation += 1
+        self.layout._mark_dirty(parent=False)
 
     def remove(self, child):
         """Remove child from this node.
@@ -145,9 +196,11 @@ class Node:
         if self._children is None:
             raise ValueError("Cannot remove children")
 
-        self._children.remove(child)
+        del self._children[self._child_position(child)]
+        self._track_remove(child)
         child._parent = None
-        self._set_root(child, None)
+        Node._generation += 1
+        self.layout._mark_dirty(parent=False)
 
     def clear(self):
         """Clear all children from this node."""
@@ -157,8 +210,80 @@ class Node:
 
         for child in self._children:
             child._parent = None
-            self._set_root(child, None)
+        Node._generation += 1
         self._children = []
+        self._child_origins = None
+        self.layout._mark_dirty(parent=False)
+
+    def index(self, child):
+        """The position of a child in the list of children of this node.
+        Args:
+            child: The child node of interest.
+
+        Raises:
+            ValueError: If the node is not a child of this node.
+        """
+        return self._child_position(child)
+
+    ######################################################################
+    # The position of each child is tracked so that it can be found without searching
+    # the list of children. Each child is assigned an "origin": its position when the
+    # positions were last rebuilt, or a new origin past the end if it has been added
+    # since. When a child is removed, its origin is recorded (in sorted order), and
+    # the position of any other child is its origin, less the number of removed
+    # origins that precede it. A child inserted into the gap left by a removed child
+    # takes over the origin of that child; any other insertion discards the tracked
+    # positions, which are rebuilt when a position is next requested.
+    ######################################################################
+
+    def _child_position(self, child):
+        if self._child_origins is None:
+            if self._children is None:
+                raise ValueError("Node has no children")
+            self._child_origins = {node: i for i, node in enumerate(self._children)}
+            self._removed_origins = []
+            self._next_origin = len(self._children)
+
+        try:
+            origin = self._child_origins[child]
+        except KeyError:
+            raise ValueError(f"{type(child).__name__} not found") from None
+        return origin - bisect_left(self._removed_origins, origin)
+
+    def _track_insert(self, index, child):
+        if self._child_origins is None:
+            return
+
+        count = len(self._children)
+        if index < 0:
+            index = max(index + count, 0)
+        if index >= count:
+            self._child_origins[child] = self._next_origin
+            self._next_origin += 1
+            return
+
+        # A removed origin whose gap is at the insertion point can be reused. The gap
+        # of each removed origin is its value, less the number of removed origins
+        # that precede it.
+        removed = self._removed_origins
+        gap = bisect_left(range(len(removed)), index, key=lambda i: removed[i] - i)
+        if gap < len(removed) and removed[gap] - gap == index:
+            self._child_origins[child] = removed.pop(gap)
+        else:
+            self._child_origins = None
+
+    def _track_remove(self, child):
+        if self._child_origins is None:
+            return
+
+        origin = self._child_origins.pop(child)
+        if origin == self._next_origin - 1:
+            self._next_origin -= 1
+        elif len(self._removed_origins) >= len(self._children):
+            # Rebuild the positions rather than let the removed origins accumulate.
+            self._child_origins = None
+        else:
+            insort(self._removed_origins, origin)
 
     def refresh(self, viewport):
         """Refresh the layout and appearance of the tree this node is contained in."""
@@ -183,9 +308,3 @@ class Node:
                 ######################################################################
 
                 self.applicator.set_bounds()
-
-    def _set_root(self, node, root):
-        # Propagate a root node change through a tree.
-        node._root = root
-        for child in node.children:
-            self._set_root(child, root)
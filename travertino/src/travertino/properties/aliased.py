@@ -60,19 +60,10 @@ class aliased_property:
         return self.derive_name(style) in style
 
     def derive_name(self, style):
-        name = None
-
         if isinstance(self.source, str):
             name = self.source
         else:
-            for condition, result in self.source.items():
-                if condition.match(style):
-                    name = result
-                    break
-
-        if name is None:
-            conditions = " or ".join(f"({condition})" for condition in self.source)
-            raise AttributeError(f"'{self.name}' is only supported when {conditions}")
+            name = self._derive_conditional_name(style)
 
         if self.deprecated:
             cls = type(style).__name__
@@ -83,3 +74,35 @@ class aliased_property:
             )
 
         return name
+
+    def _derive_conditional_name(self, style):
+        # The name a conditional alias resolves to is cached on the style, until one of
+        # the properties its conditions depend on is changed; see
+        # BaseStyle._set_value().
+        if (derived_names := style._derived_names) is None:
+            derived_names = style._derived_names = {}
+        elif (name := derived_names.get(self.name)) is not None:
+            return name
+
+        for condition, result in self.source.items():
+            if condition.match(style):
+                name = result
+                break
+        else:
+            conditions = " or ".join(f"({condition})" for condition in self.source)
+            raise AttributeError(f"'{self.name}' is only supported when {conditions}")
+
+        style_class = type(style)
+        try:
+            dependencies = 0
+            for condition in self.source:
+                for dependency in condition.properties:
+                    dependencies |= 1 << getattr(style_class, dependency).index
+        except AttributeError:
+            # A condition depends on an alias or shorthand, which doesn't have a
+            # storage slot of its own; the name can't be cached.
+            return name
+
+        style_class._ALIAS_DEPENDENCIES |= dependencies
+        derived_names[self.name] = name
+        return name
@@ -1,9 +1,21 @@
 from ..colors import Color
 
+# Validated inputs of these types are cached; they're immutable, and hashed by value.
+_CACHED_TYPES = {str, int, float, bool}
+
+_MISSING = object()
+
+
+def _strip(value):
+    return value.strip()
+
 
 class Choices:
     "A class to define allowable data types for a property"
 
+    # The maximum number of validated inputs cached for each set of choices.
+    _MAX_CACHED = 256
+
     def __init__(
         self,
         *constants,
@@ -29,27 +41,47 @@ class Choices:
         if self.color:
             self._options.append("<color>")
 
-    def validate(self, value):
+        # Only the conversions these choices allow are attempted, in order of
+        # precedence, along with the exceptions that mean a conversion doesn't apply.
+        self._conversions = []
         if self.string:
-            try:
-                return value.strip()
-            except AttributeError:
-                pass
+            self._conversions.append((_strip, AttributeError))
         if self.integer:
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                pass
+            self._conversions.append((int, (ValueError, TypeError)))
         if self.number:
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                pass
+            self._conversions.append((float, (ValueError, TypeError)))
         if self.color:
+            self._conversions.append((Color.parse, ValueError))
+
+        # Most values can be found among the constants by hash, rather than by
+        # comparing them with every constant.
+        self._hashed_constants = {const: const for const in self.constants}
+
+        # Validated inputs, keyed by type and value.
+        self._cache = {}
+
+    def validate(self, value):
+        if (value_type := type(value)) not in _CACHED_TYPES:
+            return self._validate(value)
+
+        key = (value_type, value)
+        if (result := self._cache.get(key, _MISSING)) is _MISSING:
+            result = self._validate(value)
+            if len(self._cache) < self._MAX_CACHED:
+                self._cache[key] = result
+        return result
+
+    def _validate(self, value):
+        for convert, exceptions in self._conversions:
             try:
-                return Color.parse(value)
-            except ValueError:
+                return convert(value)
+            except exceptions:
                 pass
+
+        try:
+            return self._hashed_constants[value]
+        except (KeyError, TypeError):
+            pass
         for const in self.constants:
             if value == const:
                 return const
@@ -32,6 +32,7 @@ class validated_property:
 
     def __set_name__(self, style_class, name):
         self.name = name
+        self.index = style_class._allocate_slot()
         style_class._BASE_PROPERTIES[style_class].add(name)
         style_class._BASE_ALL_PROPERTIES[style_class].add(name)
 
@@ -39,7 +40,12 @@ class validated_property:
         if style is None:
             return self
 
-        return getattr(style, f"_{self.name}", self.initial)
+        mask = style._set_mask
+        index = self.index
+        if mask >> index & 1:
+            # The values of the slots that have been set are stored in order.
+            return style._values[(mask & ((1 << index) - 1)).bit_count()]
+        return self.initial
 
     def __set__(self, style, value):
         if value is self:
@@ -56,7 +62,7 @@ class validated_property:
         value = self.validate(value)
         current = style[self.name]  # Fetches initial if not set
 
-        setattr(style, f"_{self.name}", value)
+        style._set_value(self.index, value)
         if value != current:
             ######################################################################
             # 08-2025: Backwards compatibility for Toga < 0.5.0
@@ -75,9 +81,8 @@ class validated_property:
 
     def __delete__(self, style):
         try:
-            current = getattr(style, f"_{self.name}")
-            delattr(style, f"_{self.name}")
-        except AttributeError:
+            current = style._delete_value(self.index)
+        except KeyError:
             pass
         else:
             if current != self.initial:
@@ -110,7 +115,7 @@ class validated_property:
             ) from error
 
     def is_set_on(self, style):
-        return hasattr(style, f"_{self.name}")
+        return bool(style._set_mask >> self.index & 1)
 
 
 class list_property(validated_property):
@@ -21,9 +21,34 @@ class BaseIntrinsicSize:
     height: The height of the node.
     """
 
-    def __init__(self, width=None, height=None):
-        self.width = width
-        self.height = height
+    def __init__(self, width=None, height=None, layout=None):
+        # The layout box of the node this size describes. If provided, the box is
+        # flagged as dirty whenever the intrinsic size changes.
+        self._layout = layout
+        self._width = width
+        self._height = height
 
     def __repr__(self):
         return f"({self.width}, {self.height})"
+
+    @property
+    def width(self):
+        return self._width
+
+    @width.setter
+    def width(self, value):
+        if value != self._width:
+            self._width = value
+            if self._layout is not None:
+                self._layout._mark_dirty()
+
+    @property
+    def height(self):
+        return self._height
+
+    @height.setter
+    def height(self, value):
+        if value != self._height:
+            self._height = value
+            if self._layout is not None:
+                self._layout._mark_dirty()
@@ -7,6 +7,7 @@ from contextlib import contextmanager
 from warnings import filterwarnings, warn
 
 from .compat import _toga_lt_5
+from .properties.aliased import aliased_property
 from .properties.shorthand import directional_property
 from .properties.validated import validated_property
 
@@ -36,11 +37,119 @@ class BaseStyle(ABC):  # noqa: B024
     # Includes aliases and shorthands
     _BASE_ALL_PROPERTIES = defaultdict(set)
 
+    # Prototype style declarations, keyed by class and properties; see _prototype().
+    _PROTOTYPES = {}
+    _MAX_PROTOTYPES = 256
+
+    # The number of properties that have been allocated a storage slot; see
+    # _allocate_slot().
+    _SLOT_COUNT = 0
+
+    # The bits of _ALIAS_DEPENDENCIES record the slots of the properties that the
+    # conditions of aliases depend on; see _derived_names.
+    _ALIAS_DEPENDENCIES = 0
+
+    # Style declarations don't have an instance dictionary; subclasses that define
+    # instance attributes of their own should also define __slots__.
+    __slots__ = (
+        # The values of the properties that have been set, as a tuple in the order of
+        # their slots; the bits of _set_mask record which slots have been set, so the
+        # value in a slot is at the position given by the number of set slots below
+        # it. The tuple is shared with copies of this style declaration.
+        "_values",
+        "_set_mask",
+        # The names that conditional aliases resolve to, keyed by alias, or None; see
+        # aliased_property.
+        "_derived_names",
+        "_assigned_applicator",
+        # The names of the properties whose application is being deferred by
+        # batch_apply(), or None if a batch isn't active.
+        "_batched_names",
+    )
+
+    def __new__(cls, *args, **kwargs):
+        style = super().__new__(cls)
+        style._values = ()
+        style._set_mask = 0
+        style._derived_names = None
+        return style
+
     def __init_subclass__(cls):
         # Give the subclass a direct reference to its properties.
         cls._PROPERTIES = cls._BASE_PROPERTIES[cls]
         cls._ALL_PROPERTIES = cls._BASE_ALL_PROPERTIES[cls]
 
+    @classmethod
+    def _prototype(cls, **properties):
+        """Get a style declaration with the given properties that may be shared.
+
+        Declarations with the same properties are interned, so they are only created
+        (and validated) once. The declaration that is returned is a copy of the
+        interned declaration, which shares its values until either is modified.
+
+        Declarations that use an alias aren't interned, so that a deprecated alias
+        warns every time it is used.
+        """
+        for name in properties:
+            if name not in cls._PROPERTIES and (
+                isinstance(prop := getattr(cls, name, None), aliased_property)
+                or getattr(prop, "deprecated", False)
+            ):
+                return cls(**properties)
+
+        try:
+            key = (cls, *((name, type(v), v) for name, v in properties.items()))
+            prototype = cls._PROTOTYPES.get(key)
+        except TypeError:
+            # A value can't be hashed, so the declaration can't be interned.
+            return cls(**properties)
+
+        if prototype is None:
+            prototype = cls(**properties)
+            if len(cls._PROTOTYPES) < cls._MAX_PROTOTYPES:
+                cls._PROTOTYPES[key] = prototype
+        return prototype.copy()
+
+    @classmethod
+    def _allocate_slot(cls):
+        """Allocate a storage slot for a property of this class, returning its index.
+
+        Slots are numbered after those of any base class.
+        """
+        index = cls._SLOT_COUNT
+        cls._SLOT_COUNT = index + 1
+        return index
+
+    def _get_value(self, index):
+        """Get the value in a slot, which must be set."""
+        mask = self._set_mask
+        return self._values[(mask & ((1 << index) - 1)).bit_count()]
+
+    def _set_value(self, index, value):
+        mask = self._set_mask
+        values = self._values
+        position = (mask & ((1 << index) - 1)).bit_count()
+        if mask >> index & 1:
+            self._values = (*values[:position], value, *values[position + 1 :])
+        else:
+            self._values = (*values[:position], value, *values[position:])
+            self._set_mask = mask | 1 << index
+        if self._ALIAS_DEPENDENCIES >> index & 1:
+            self._derived_names = None
+
+    def _delete_value(self, index):
+        """Delete the value in a slot, returning it; raises KeyError if unset."""
+        mask = self._set_mask
+        if not mask >> index & 1:
+            raise KeyError(index)
+        values = self._values
+        position = (mask & ((1 << index) - 1)).bit_count()
+        self._values = (*values[:position], *values[position + 1 :])
+        self._set_mask = mask & ~(1 << index)
+        if self._ALIAS_DEPENDENCIES >> index & 1:
+            self._derived_names = None
+        return values[position]
+
     ###################################################
     # 03-2025: Backwards compatibility for Toga < 0.5.0
     ###################################################
@@ -130,9 +239,15 @@ class BaseStyle(ABC):  # noqa: B024
                 ######################################################################
 
     def copy(self, applicator=None):
-        """Create a duplicate of this style declaration."""
+        """Create a duplicate of this style declaration.
+
+        The values of the properties have already been validated, so they aren't
+        validated again; the duplicate shares them until either declaration is
+        modified.
+        """
         dup = self.__class__()
-        dup.update(**self)
+        dup._values = self._values
+        dup._set_mask = self._set_mask
 
         ######################################################################
         # 10-2024: Backwards compatibility for Toga < 0.5.0
@@ -178,11 +293,10 @@ class BaseStyle(ABC):  # noqa: B024
     ######################################################################
 
     def __post_init__(self):
-        # Because batch_apply is a no-op with no applicator, it's fine that these aren't
+        # Because batch_apply is a no-op with no applicator, it's fine that this isn't
         # set during the dataclass-generated __init__ — even when directional/composite
         # properties (which call batch_apply) are set.
-        self._batched_mode = False
-        self._batched_names = set()
+        self._batched_names = None
 
     # After deprecation is removed, this should be the signature:
     # def apply(self, name: str | None = None) -> None:
@@ -205,8 +319,10 @@ class BaseStyle(ABC):  # noqa: B024
                 stacklevel=2,
             )
 
-        if self._batched_mode:
+        if self._batched_names is not None:
             self._batched_names.update(names)
+        elif BaseStyle._all_batched is not None:
+            self._defer_apply({*names} if names else self._PROPERTIES)
         else:
             self._apply({*names} if names else self._PROPERTIES)
 
@@ -226,19 +342,55 @@ class BaseStyle(ABC):  # noqa: B024
         No-op if no applicator is present, or if already in batched mode.
         """
         # Short-circuit out if no applicator is set. This avoids trying to access the
-        # nonexistent _batched_mode during __init__.
-        if batch_entered := self._applicator and not self._batched_mode:
-            self._batched_mode = True
+        # nonexistent _batched_names during __init__.
+        if batch_entered := self._applicator and self._batched_names is None:
+            self._batched_names = set()
 
         try:
             yield
         finally:
             if batch_entered:
-                self._batched_mode = False
+                names = self._batched_names
+                self._batched_names = None
+
+                if names:
+                    if BaseStyle._all_batched is not None:
+                        self._defer_apply(names)
+                    else:
+                        self._apply(names)
+
+    # The style declarations whose calls to _apply() are being deferred by
+    # batch_apply_all(), mapped by ID to the declaration and the names of the
+    # properties to apply; or None if no such batch is active.
+    _all_batched = None
+
+    def _defer_apply(self, names):
+        _, batched_names = BaseStyle._all_batched.setdefault(id(self), (self, set()))
+        batched_names.update(names)
+
+    @classmethod
+    @contextmanager
+    def batch_apply_all(cls):
+        """Aggregate calls to apply() on *every* style declaration, until the end of
+        the batch; each declaration then makes one single call to _apply().
+
+        No-op if already in this batched mode.
+        """
+        if batch_entered := BaseStyle._all_batched is None:
+            BaseStyle._all_batched = {}
 
-                if self._batched_names:
-                    self._apply(self._batched_names)
-                    self._batched_names.clear()
+        try:
+            yield
+        finally:
+            if batch_entered:
+                batched = BaseStyle._all_batched
+                BaseStyle._all_batched = None
+
+                for style, names in batched.values():
+                    # The applicator may have been removed since the names were
+                    # batched.
+                    if style._applicator:
+                        style._apply(names)
 
     ######################################################################
     # Provide a dict-like interface
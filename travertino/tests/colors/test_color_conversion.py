@@ -164,3 +164,9 @@ def test_rgb_to_hsl(rgb_color, hsl_color):
 def test_hsl_to_rgb(rgb_color, hsl_color):
     """An hsl color can be converted to rgb."""
     assert_equal_color(hsl_color.rgb, rgb_color)
+
+
+def test_conversion_shared():
+    """Equal colors share the result of a conversion."""
+    assert rgb(10, 20, 30).hsl is rgb(10, 20, 30).hsl
+    assert hsl(120, 0.5, 0.5).rgb is hsl(120, 0.5, 0.5).rgb
@@ -60,6 +60,17 @@ def test_named_color_invalid():
         Color.parse("not a color")
 
 
+def test_interned():
+    """Equivalent strings are parsed to the same color instance."""
+    color = Color.parse("#abcdef")
+    assert Color.parse("#abcdef") is color
+    assert Color.parse("#ABCDEF") is color
+    assert Color.parse("#abcdefff") is color
+
+    assert Color.parse("#abc") is Color.parse("#aabbcc")
+    assert Color.parse("red") is Color.parse("RED")
+
+
 @pytest.mark.parametrize(
     "num_digits",
     [1, 2, 5, 7, 9, 10],
@@ -1,9 +1,12 @@
 import re
 from contextlib import nullcontext
 from functools import partial
+from unittest.mock import patch
 
 import pytest
 
+from travertino.properties.aliased import Condition
+
 from .style_classes import VALUE1, VALUE2, VALUE3, Style
 
 
@@ -181,3 +184,37 @@ def test_conditional_alias_simultaneous_setting(alias, context, properties):
         style.update(**properties)
     with context():
         assert style[alias] == 1
+
+
+def test_conditional_alias_cached():
+    """The property a conditional alias refers to is only derived again when a
+    property its conditions depend on changes."""
+    style = Style(thing_top=10, list_prop=[VALUE1])
+
+    match = patch.object(Condition, "match", autospec=True, side_effect=Condition.match)
+    with match as match:
+        assert style.conditional_alias is None
+        assert match.call_count == 3
+
+        # Neither reading, nor setting, nor changing another property re-evaluates
+        # the conditions.
+        style.conditional_alias = 5
+        assert style.conditional_alias == 5
+        style.explicit_const = VALUE2
+        assert style.conditional_alias == 5
+        assert match.call_count == 3
+
+        # Changing a dependency does.
+        style.list_prop = [VALUE1, VALUE2]
+        assert style.conditional_alias == 0
+        assert match.call_count == 5
+
+        del style.thing_top
+        assert style.conditional_alias == VALUE2
+        assert match.call_count == 6
+
+    # A copy of the style derives its own names.
+    copy = style.copy()
+    copy.thing_top = 10
+    assert copy.conditional_alias == 0
+    assert style.conditional_alias == VALUE2
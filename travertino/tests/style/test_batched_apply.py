@@ -1,5 +1,7 @@
 from unittest.mock import Mock, call
 
+import pytest
+
 from .style_classes import VALUE2, VALUE3, Style
 
 
@@ -77,3 +79,90 @@ def test_batched_apply_directional():
 
     del style.thing
     style._apply.assert_called_once_with({"thing_right", "thing_bottom", "thing_left"})
+
+
+def make_styles(count):
+    styles = [Style() for _ in range(count)]
+    for style in styles:
+        style._applicator = Mock()
+        style._apply.reset_mock()
+    return styles
+
+
+def test_batch_apply_all():
+    """Calls to apply() on every style are deferred until the end of the batch, and
+    then each style makes one call to _apply."""
+    first, second, unchanged = make_styles(3)
+
+    with Style.batch_apply_all():
+        first.explicit_const = VALUE2
+        second.update(explicit_const=VALUE2, implicit=VALUE3)
+        first.implicit = VALUE3
+        first.thing = 10
+
+        first._apply.assert_not_called()
+        second._apply.assert_not_called()
+
+    first._apply.assert_called_once_with(
+        {
+            "explicit_const",
+            "implicit",
+            "thing_top",
+            "thing_right",
+            "thing_bottom",
+            "thing_left",
+        }
+    )
+    second._apply.assert_called_once_with({"explicit_const", "implicit"})
+    unchanged._apply.assert_not_called()
+
+    # Once the batch is complete, changes are applied immediately again.
+    first._apply.reset_mock()
+    first.explicit_const = VALUE3
+    first._apply.assert_called_once_with({"explicit_const"})
+
+
+def test_batch_apply_all_everything():
+    """Applying every property in a batch applies every property at the end."""
+    (style,) = make_styles(1)
+
+    with Style.batch_apply_all():
+        style.apply()
+
+    style._apply.assert_called_once_with(Style._PROPERTIES)
+
+
+def test_batch_apply_all_nested():
+    """Nested batches are only applied when the outermost batch ends."""
+    (style,) = make_styles(1)
+
+    with Style.batch_apply_all():
+        with Style.batch_apply_all():
+            style.explicit_const = VALUE2
+        style._apply.assert_not_called()
+
+    style._apply.assert_called_once_with({"explicit_const"})
+
+
+def test_batch_apply_all_exception():
+    """If a batch raises an exception, the changes are still applied."""
+    (style,) = make_styles(1)
+
+    with pytest.raises(ValueError), Style.batch_apply_all():
+        style.explicit_const = VALUE2
+        raise ValueError()
+
+    style._apply.assert_called_once_with({"explicit_const"})
+
+
+def test_batch_apply_all_removed_applicator():
+    """Changes aren't applied to a style whose applicator has been removed."""
+    first, second = make_styles(2)
+
+    with Style.batch_apply_all():
+        first.explicit_const = VALUE2
+        second.explicit_const = VALUE2
+        first._applicator = None
+
+    first._apply.assert_not_called()
+    second._apply.assert_called_once_with({"explicit_const"})
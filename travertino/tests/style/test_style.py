@@ -1,8 +1,11 @@
+import warnings
+
 import pytest
 
 from travertino.properties.validated import list_property, validated_property
 
 from .style_classes import (
+    VALUE1,
     VALUE2,
     VALUE3,
     VALUES,
@@ -51,6 +54,149 @@ def test_create_and_copy(StyleClass):
     assert dup.implicit == VALUE3
 
 
+@pytest.mark.parametrize("StyleClass", [Style, DeprecatedStyle])
+def test_copy_on_write(StyleClass):
+    """A copy shares the values of the original until either of them is modified."""
+    style = StyleClass(explicit_const=VALUE2, implicit=VALUE3)
+    dup = style.copy()
+    assert dup._values is style._values
+    assert dup._set_mask == style._set_mask
+
+    # The values weren't set on the copy again.
+    dup.apply.assert_not_called()
+
+    # Modifying the copy doesn't modify the original...
+    dup.explicit_const = VALUE1
+    del dup.implicit
+    assert dup.explicit_const == VALUE1
+    assert "implicit" not in dup
+    assert style.explicit_const == VALUE2
+    assert style.implicit == VALUE3
+
+    # ... and modifying the original doesn't modify another copy.
+    dup = style.copy()
+    style.explicit_value = 5
+    assert style.explicit_value == 5
+    assert "explicit_value" not in dup
+    assert dup.explicit_const == VALUE2
+
+
+def test_slots():
+    """Each property is stored in its own slot, and the slots of a subclass follow
+    those of its base class."""
+    indices = [getattr(Style, name).index for name in Style._PROPERTIES]
+    assert sorted(indices) == list(range(len(indices)))
+
+    class SubStyle(Style):
+        sub_prop = validated_property(integer=True)
+
+    assert SubStyle.sub_prop.index >= len(indices)
+
+    # Only the values of the slots that have been set are stored, in slot order.
+    style = Style(explicit_value=5)
+    assert style._values == (5,)
+    assert style._set_mask == 1 << Style.explicit_value.index
+
+    style.explicit_const = VALUE2
+    style.implicit = VALUE3
+    assert style._values == tuple(
+        value
+        for _, value in sorted(
+            [
+                (Style.explicit_value.index, 5),
+                (Style.explicit_const.index, VALUE2),
+                (Style.implicit.index, VALUE3),
+            ]
+        )
+    )
+
+    assert style._get_value(Style.implicit.index) == VALUE3
+
+    # Deleting a value from a copy doesn't modify the original.
+    dup = style.copy()
+    del dup.explicit_const
+    assert len(dup._values) == 2
+    assert dup.explicit_value == 5
+    assert dup.implicit == VALUE3
+    assert "explicit_const" not in dup
+    assert style.explicit_const == VALUE2
+
+
+def test_prototype():
+    """Style declarations with the same properties can share a prototype."""
+    style = Style._prototype(explicit_const=VALUE2, implicit=VALUE3)
+    assert style.explicit_const == VALUE2
+    assert style.implicit == VALUE3
+
+    # Each declaration is a copy of the prototype, sharing its values.
+    dup = Style._prototype(explicit_const=VALUE2, implicit=VALUE3)
+    assert dup is not style
+    assert dup._values is style._values
+    assert Style._prototype(explicit_const=VALUE2)._values is not style._values
+    # Values of different types aren't interchangeable.
+    integer = Style._prototype(explicit_value=1)
+    assert Style._prototype(explicit_value=1.0)._values is not integer._values
+
+    # Style declarations with values that can't be hashed aren't shared.
+    style = Style._prototype(list_prop=[VALUE1, VALUE2])
+    assert style.list_prop == [VALUE1, VALUE2]
+    assert Style._prototype(list_prop=[VALUE1, VALUE2])._values is not style._values
+
+
+def test_prototype_modified():
+    """Modifying a declaration doesn't modify the prototype it was copied from."""
+    style = Style._prototype(explicit_const=VALUE2, implicit=VALUE3)
+    style.explicit_const = VALUE1
+    del style.implicit
+
+    dup = Style._prototype(explicit_const=VALUE2, implicit=VALUE3)
+    assert dup.explicit_const == VALUE2
+    assert dup.implicit == VALUE3
+
+
+@pytest.mark.parametrize(
+    "name, source",
+    [
+        ("plain_alias", "explicit_const"),
+        ("plain_alias_deprecated", "explicit_const"),
+        ("directional_alias", "thing_top"),
+    ],
+)
+def test_prototype_alias(name, source):
+    """Style declarations that use an alias aren't shared."""
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", DeprecationWarning)
+        style = Style._prototype(**{name: VALUE2})
+        dup = Style._prototype(**{name: VALUE2})
+
+    assert dup._values is not style._values
+    assert getattr(dup, source) == VALUE2
+
+
+def test_prototype_deprecated_alias():
+    """A deprecated alias warns every time a declaration is created with it."""
+    for _ in range(3):
+        with pytest.warns(
+            DeprecationWarning,
+            match=r"Style\.plain_alias_deprecated is deprecated",
+        ):
+            style = Style._prototype(plain_alias_deprecated=VALUE2)
+        assert style.explicit_const == VALUE2
+
+
+def test_prototype_limit(monkeypatch):
+    """Only a limited number of prototypes are kept."""
+    monkeypatch.setattr(Style, "_PROTOTYPES", {})
+    monkeypatch.setattr(Style, "_MAX_PROTOTYPES", 2)
+
+    first = Style._prototype(explicit_value=1)
+    Style._prototype(explicit_value=2)
+    third = Style._prototype(explicit_value=3)
+
+    assert Style._prototype(explicit_value=1)._values is first._values
+    assert Style._prototype(explicit_value=3)._values is not third._values
+
+
 @pytest.mark.parametrize("StyleClass", [Style, DeprecatedStyle])
 def test_str(StyleClass):
     style = StyleClass()
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from unittest.mock import Mock
 from warnings import catch_warnings, filterwarnings
 
 import pytest
@@ -412,3 +413,55 @@ def test_string_symbol(StyleClass):
     # Both equality and instance checking should work.
     assert_property(style, "string_symbol", TOP)
     assert style.string_symbol is TOP
+
+
+def test_validated_cache(monkeypatch):
+    """Validated inputs are cached, distinguishing between values of different
+    types."""
+    choices = Choices("a", NONE, integer=True, color=True)
+    monkeypatch.setattr(choices, "_validate", Mock(wraps=choices._validate))
+
+    assert choices.validate("#112233") == rgb(0x11, 0x22, 0x33)
+    assert choices.validate("#112233") == rgb(0x11, 0x22, 0x33)
+    assert choices.validate("a") == "a"
+    assert choices.validate("a") == "a"
+    assert choices._validate.call_count == 2
+
+    # Values that are equal, but of different types, are cached separately.
+    assert choices.validate(True) == 1
+    assert choices.validate(1) == 1
+    assert choices.validate(1.5) == 1
+    assert choices._validate.call_count == 5
+
+    # Invalid values aren't cached...
+    for _ in range(2):
+        with pytest.raises(ValueError, match=r"'b' is not a valid value"):
+            choices.validate("b")
+    assert choices._validate.call_count == 7
+
+    # ... and neither are values of other types.
+    color = rgb(0x11, 0x22, 0x33)
+    assert choices.validate(color) is color
+    assert choices.validate(color) is color
+    assert choices._validate.call_count == 9
+
+
+def test_validated_cache_limit(monkeypatch):
+    """Only a limited number of validated inputs are cached."""
+    choices = Choices(integer=True)
+    monkeypatch.setattr(Choices, "_MAX_CACHED", 2)
+    for value in ["1", "2", "3"]:
+        choices.validate(value)
+    assert choices._cache == {(str, "1"): 1, (str, "2"): 2}
+
+
+class UnhashableString(str):
+    __hash__ = None
+
+
+def test_unhashable_value():
+    """A value that can't be hashed is compared with each constant."""
+    choices = Choices("a", NONE)
+    assert choices.validate(UnhashableString("a")) == "a"
+    with pytest.raises(ValueError):
+        choices.validate(UnhashableString("b"))
@@ -385,6 +385,47 @@ def test_descendent_offsets(box):
     )
 
 
+def test_reparented_offsets(box):
+    box.node.layout.content_top = 7
+    box.node.layout.content_left = 8
+    box.child1.layout.content_top = 9
+    box.child1.layout.content_left = 10
+    box.child2.layout.content_top = 100
+    box.child2.layout.content_left = 200
+    box.grandchild1_1.layout.content_top = 1
+    box.grandchild1_1.layout.content_left = 2
+
+    assert box.grandchild1_1.layout.absolute_content_top == 17
+    assert box.grandchild1_1.layout.absolute_content_left == 20
+
+    # Moving a node to a new parent moves it to the position of the new parent.
+    box.child2.add(box.grandchild1_1)
+
+    assert box.grandchild1_1.layout._origin_top == 107
+    assert box.grandchild1_1.layout._origin_left == 208
+    assert box.grandchild1_1.layout.absolute_content_top == 108
+    assert box.grandchild1_1.layout.absolute_content_left == 210
+
+
+def test_root_origin(box):
+    # Moving the root moves all its descendants.
+    box.grandchild1_1.layout.content_top = 1
+    assert box.grandchild1_1.layout.absolute_content_top == 1
+
+    box.node.layout._origin_top = 50
+    box.node.layout._origin_left = 60
+
+    assert box.grandchild1_1.layout.absolute_content_top == 51
+    assert box.grandchild1_1.layout.absolute_content_left == 60
+
+
+def test_slots():
+    # A base box has a fixed set of attributes.
+    layout = BaseBox(Node(style=Style()))
+    with pytest.raises(AttributeError):
+        layout.unknown = 42
+
+
 def test_absolute_equalities(box):
     # Move the box around and set some borders.
     layout = box.node.layout
@@ -414,3 +455,66 @@ def test_absolute_equalities(box):
         layout.content_top + layout.content_height + layout.content_bottom
         == layout.height
     )
+
+
+def clean(*nodes):
+    for node in nodes:
+        node.layout._dirty = False
+        node.layout._dirty_descendants = False
+
+
+def dirty_state(node):
+    return (node.layout._dirty, node.layout._dirty_descendants)
+
+
+def test_initially_dirty(box):
+    """A box that has never been laid out is dirty."""
+    assert dirty_state(box.grandchild1_2) == (True, False)
+
+
+def test_mark_dirty(box):
+    """Marking a box dirty also marks its parent, and flags further ancestors."""
+    clean(box.node, box.child1, box.child2, box.grandchild1_1, box.grandchild1_2)
+
+    box.grandchild1_1.layout._mark_dirty()
+
+    assert dirty_state(box.grandchild1_1) == (True, False)
+    assert dirty_state(box.grandchild1_2) == (False, False)
+    assert dirty_state(box.child1) == (True, False)
+    assert dirty_state(box.child2) == (False, False)
+    assert dirty_state(box.node) == (False, True)
+
+
+def test_mark_dirty_without_parent(box):
+    """A box can be marked dirty without marking its parent dirty."""
+    clean(box.node, box.child1, box.child2, box.grandchild1_1, box.grandchild1_2)
+
+    box.grandchild1_1.layout._mark_dirty(parent=False)
+
+    assert dirty_state(box.grandchild1_1) == (True, False)
+    assert dirty_state(box.child1) == (False, True)
+    assert dirty_state(box.node) == (False, True)
+
+
+def test_mark_dirty_root(box):
+    """The root box can be marked dirty."""
+    clean(box.node, box.child1, box.child2, box.grandchild1_1, box.grandchild1_2)
+
+    box.node.layout._mark_dirty()
+
+    assert dirty_state(box.node) == (True, False)
+    assert dirty_state(box.child1) == (False, False)
+
+
+def test_intrinsic_change_marks_dirty(box):
+    """Changing the intrinsic size of a node marks its layout dirty."""
+    clean(box.node, box.child1, box.child2, box.grandchild1_1, box.grandchild1_2)
+
+    # Assigning the same value isn't a change.
+    box.child2.intrinsic.width = None
+    assert dirty_state(box.child2) == (False, False)
+    assert dirty_state(box.node) == (False, False)
+
+    box.child2.intrinsic.width = 10
+    assert dirty_state(box.child2) == (True, False)
+    assert dirty_state(box.node) == (True, False)
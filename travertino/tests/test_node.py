@@ -1,3 +1,5 @@
+import random
+import sys
 from dataclasses import dataclass
 from unittest.mock import Mock, call
 from warnings import catch_warnings, filterwarnings
@@ -233,6 +235,9 @@ def test_add():
     assert child.parent == node
     assert child.root == node.root
 
+    # The node has been flagged for layout.
+    assert node.layout._dirty
+
 
 def test_insert():
     """Node can be inserted at a specific position as a child"""
@@ -272,12 +277,16 @@ def test_remove():
     child3 = Node(style=style)
     node = Node(style=style, children=[child1, child2, child3])
 
+    node.layout._dirty = False
     node.remove(child1)
 
     assert child1 not in node.children
     assert child1.parent is None
     assert child1.root == child1
 
+    # The node has been flagged for layout.
+    assert node.layout._dirty
+
 
 def test_remove_leaf():
     """Node that can't contain children raises error on remove."""
@@ -287,6 +296,70 @@ def test_remove_leaf():
         node.remove(child)
 
 
+def test_index():
+    """The position of a child can be found."""
+    style = Style()
+    children = [Node(style=style) for _ in range(3)]
+    node = Node(style=style, children=children)
+
+    for i, child in enumerate(children):
+        assert node.index(child) == i
+
+    with pytest.raises(ValueError, match=r"Node not found"):
+        node.index(Node(style=style))
+
+    # A node that can't have children has no children to find.
+    with pytest.raises(ValueError, match=r"Node has no children"):
+        children[0].index(children[1])
+
+    # A child that isn't found can't be removed.
+    with pytest.raises(ValueError, match=r"Node not found"):
+        node.remove(Node(style=style))
+    assert node.children == children
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_index_after_edits(seed):
+    """The position of every child is correct after any sequence of edits."""
+    rng = random.Random(seed)
+    style = Style()
+    node = Node(style=style, children=[Node(style=style) for _ in range(20)])
+    spare = [Node(style=style) for _ in range(20)]
+
+    for _ in range(300):
+        operation = rng.choice(["add", "insert", "remove", "replace", "index"])
+        if operation == "add" and spare:
+            node.add(spare.pop())
+        elif operation == "insert" and spare:
+            count = len(node.children)
+            node.insert(rng.randint(-count - 2, count + 2), spare.pop())
+        elif operation == "remove" and node.children:
+            child = rng.choice(node.children)
+            node.remove(child)
+            spare.append(child)
+        elif operation == "replace" and node.children and spare:
+            old_child = rng.choice(node.children)
+            index = node.index(old_child)
+            node.remove(old_child)
+            node.insert(index, spare.pop())
+            spare.append(old_child)
+        elif operation == "index" and node.children:
+            child = rng.choice(node.children)
+            assert node.index(child) == node.children.index(child)
+
+    for i, child in enumerate(node.children):
+        assert node.index(child) == i
+    for child in spare:
+        with pytest.raises(ValueError):
+            node.index(child)
+
+    # Clearing the node discards the positions of its children.
+    node.clear()
+    child = Node(style=style)
+    node.add(child)
+    assert node.index(child) == 0
+
+
 def test_clear():
     """Node can be cleared of all children."""
     style = Style()
@@ -299,6 +372,7 @@ def test_clear():
         assert child.root == node
     assert node.children == children
 
+    node.layout._dirty = False
     node.clear()
 
     for child in children:
@@ -308,6 +382,61 @@ def test_clear():
 
     assert node.children == []
 
+    # The node has been flagged for layout.
+    assert node.layout._dirty
+
+
+def test_deep_tree():
+    """A tree much deeper than Python's recursion limit can be built and split up."""
+    depth = sys.getrecursionlimit() * 2
+    style = Style()
+    root = node = Node(style=style, children=[])
+    for _ in range(depth):
+        child = Node(style=style, children=[])
+        node.add(child)
+        node.layout.content_left = 1
+        node = child
+
+    assert node.root is root
+    assert node.layout.absolute_content_left == depth
+
+    # Moving the tree to a new root updates the root of every descendant.
+    new_root = Node(style=style, children=[])
+    new_root.add(root)
+    assert node.root is new_root
+
+    new_root.remove(root)
+    assert root.root is root
+
+
+def test_move_subtree():
+    """Moving a subtree doesn't visit its descendants, but their root is updated."""
+    style = Style()
+    leaves = [Node(style=style) for _ in range(5)]
+    subtree = Node(style=style, children=[Node(style=style, children=leaves)])
+    assert leaves[0].root is subtree
+
+    first = Node(style=style, children=[])
+    second = Node(style=style, children=[])
+    for _ in range(3):
+        first.add(subtree)
+        # The descendants haven't resolved their root since the move.
+        assert all(leaf._root_generation != Node._generation for leaf in leaves)
+        assert [leaf.root for leaf in leaves] == [first] * 5
+
+        first.remove(subtree)
+        second.insert(0, subtree)
+        assert [leaf.root for leaf in leaves] == [second] * 5
+
+        second.clear()
+        assert [leaf.root for leaf in leaves] == [subtree] * 5
+
+    # A tree that is modified is also updated.
+    other = Node(style=style, children=[])
+    first.add(other)
+    assert first.root is first
+    assert other.root is first
+
 
 def test_clear_leaf():
     """For a node that can't have children, clear() is a no-op."""
@@ -328,9 +457,9 @@ def test_create_with_no_applicator():
     assert node.style.int_prop == 5
     assert node.style is not style
 
-    # Since no applicator has been assigned, the overall style wasn't applied. However,
-    # apply("int_prop") was still called.
-    node.style.apply.assert_called_once_with("int_prop")
+    # Since no applicator has been assigned, the style wasn't applied. The copy shares
+    # the values of the original, so the properties weren't set (and applied) again.
+    node.style.apply.assert_not_called()
 
 
 def test_create_with_applicator():
@@ -351,9 +480,9 @@ def test_create_with_applicator():
     assert applicator.node is node
     assert node.style._applicator is applicator
 
-    # First, call("int_prop") is called when style object is created.
-    # Assigning a non-None applicator should always apply style.
-    assert node.style.apply.mock_calls == [call("int_prop"), call()]
+    # The copy shares the values of the original, so the properties aren't set (and
+    # applied) individually. Assigning a non-None applicator should always apply style.
+    assert node.style.apply.mock_calls == [call()]
 
 
 @pytest.mark.parametrize(
@@ -442,9 +571,10 @@ def test_assign_style_with_applicator():
 
     assert node.style != style_1
 
-    # call("int_prop") is called when the style object is created.
-    # Since an applicator has already been assigned, assigning style applies the style.
-    assert node.style.apply.mock_calls == [call("int_prop"), call()]
+    # The copy shares the values of the original, so the properties aren't set (and
+    # applied) individually. Since an applicator has already been assigned, assigning
+    # style applies the style.
+    assert node.style.apply.mock_calls == [call()]
 
 
 def test_assign_style_with_no_applicator():
@@ -463,9 +593,8 @@ def test_assign_style_with_no_applicator():
 
     assert node.style != style_1
 
-    # Since no applicator has been assigned, the overall style wasn't applied. However,
-    # apply("int_prop") was still called when creating the style.
-    node.style.apply.assert_called_once_with("int_prop")
+    # Since no applicator has been assigned, the style wasn't applied.
+    node.style.apply.assert_not_called()
 
 
 def test_apply_before_node_is_ready():
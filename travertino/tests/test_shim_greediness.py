@@ -87,7 +87,7 @@ def test_type_error_in_set():
 def test_type_error_in_delete():
     """A TypeError in a property's __delete__() method should propagate."""
     style = TypeErrorApplyStyle()
-    # Assign to underlying attribute, so that __delete__() won't simply abort.
-    style._test_prop = 3
+    # Assign to underlying storage, so that __delete__() won't simply abort.
+    style._set_value(TypeErrorApplyStyle.test_prop.index, 3)
     with pytest.raises(TypeError, match=r"unrelated TypeError"):
         del style.test_prop
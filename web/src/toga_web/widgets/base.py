@@ -88,9 +88,19 @@ class NativeProxy:
 
 
 class Widget(ABC):
+    # The DOM element of a widget contains the elements of its children, so hiding a
+    # widget hides its children; each element is only given the visibility of its own
+    # style.
+    CASCADES_HIDDEN = True
+    # The DOM element is created with the widget's CSS, and the applicator methods
+    # only update that CSS, so nothing needs to be applied until a property is set.
+    NATIVE_DEFAULT_STYLE = {"text_align", "color", "background_color", "hidden", "font"}
+
     def __init__(self, interface):
         self.interface = interface
         self._container = None
+        # The CSS declarations last applied to the native element's inline style.
+        self._css_declarations = {}
 
         self.create()
 
@@ -120,6 +130,7 @@ class Widget(ABC):
 
         classes = ["toga", self.interface.__class__.__name__.lower()] + classes
 
+        self._css_declarations = self.interface.style._css_declarations
         native = create_element(
             tag,
             id=f"toga_{self.interface.id}",
@@ -175,12 +186,24 @@ class Widget(ABC):
     # APPLICATOR
     #
     # Web style is a little different to other platforms; we if there's
-    # any change, we can just re-set the CSS styles and the browser
-    # will reflect those changes as needed.
+    # any change, we can just update the CSS styles and the browser
+    # will reflect those changes as needed. Only the declarations that
+    # have changed since the style was last applied are updated.
     ######################################################################
 
     def _reapply_style(self):
-        self.native.style = self.interface.style.__css__()
+        style = self.interface.style
+        changes = style._css_changes(self._css_declarations)
+        self._css_declarations = style._css_declarations
+        if not changes:
+            return
+
+        native_style = self.native.style
+        for name, value in changes.items():
+            if value is None:
+                native_style.removeProperty(name)
+            else:
+                native_style.setProperty(name, value)
 
     def set_bounds(self, x, y, width, height):
         self._reapply_style()
@@ -36,10 +36,11 @@ class Button(Widget):
         # wa-button (appearance="outlined") sets text color via --wa-color-on-quiet
         # inside its shadow DOM, so the host's inherited `color` doesn't reach the
         # button label. Forward it as a CSS variable so the shadow DOM picks it up.
-        css = self.interface.style.__css__()
+        super()._reapply_style()
         if color := self.interface.style.color:
-            css += f" --wa-color-on-quiet: {color};"
-        self.native.style = css
+            self.native.style.setProperty("--wa-color-on-quiet", str(color))
+        else:
+            self.native.style.removeProperty("--wa-color-on-quiet")
 
     def rehint(self):
         pass
@@ -33,7 +33,8 @@ class Switch(Widget):
         # wa-switch sets color via --wa-form-control-value-color inside its shadow DOM,
         # so the host's inherited `color` property doesn't reach the label text.
         # Forward it explicitly as a CSS variable so the shadow DOM picks it up.
-        css = self.interface.style.__css__()
+        super()._reapply_style()
         if color := self.interface.style.color:
-            css += f" --wa-form-control-value-color: {color};"
-        self.native.style = css
+            self.native.style.setProperty("--wa-form-control-value-color", str(color))
+        else:
+            self.native.style.removeProperty("--wa-form-control-value-color")
@@ -223,6 +223,8 @@ class Window(Scalable):
         for widget in self.interface.widgets:
             widget._impl.scale_font()
             widget._impl.refresh()
+            # The same layout produces different native geometry at the new scale.
+            widget.applicator.reset_bounds()
 
         # Then do a single layout pass.
         if self.interface.content is not None: